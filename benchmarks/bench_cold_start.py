@@ -0,0 +1,96 @@
+"""
+Measure GUI cold start against fixed budgets.
+
+Each measurement runs in a fresh interpreter, so nothing is imported or cached in
+memory beforehand:
+
+- import: time to import gui once streamlit is loaded, and which heavy libraries
+  (pandas, numpy, altair, pyarrow) that pulled in.
+- first render: one full script run through streamlit's AppTest harness, for the
+  Upload Data page with no data and for the Home page with a large export
+  already in the parse cache (a throwaway cache directory, via STRONG_CACHE_DIR).
+
+Exits with status 1 if any measurement is over its budget.
+
+Usage: python benchmarks/bench_cold_start.py [num_sets]   (default 1,000,000)
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from synthetic import write_export  # pylint: disable=wrong-import-position
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))
+HEAVY_MODULES = ("pandas", "numpy", "altair", "pyarrow")
+# Seconds. The first Home render must stay interactive however large the export:
+# a fixed part (importing pandas and pyarrow, reading the cached workout summary)
+# plus hashing the CSV for the cache key, the only step linear in the number of
+# sets. Building Workout objects (about 5s per million sets) would blow it.
+BUDGETS = {
+    "import": 0.1,
+    "first_render_no_data": 0.5,
+}
+HOME_BUDGET_FIXED = 1.0
+HOME_BUDGET_PER_MILLION_SETS = 0.25
+
+IMPORT_SNIPPET = f"""
+import json, sys, time
+sys.path.insert(0, {SRC!r})
+import streamlit
+start = time.perf_counter()
+import gui
+print(json.dumps({{"seconds": time.perf_counter() - start,
+                  "heavy": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+RENDER_SNIPPET = f"""
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+sys.argv = ["gui.py", *sys.argv[1:]]
+app = AppTest.from_file({os.path.join(SRC, "gui.py")!r}, default_timeout=600)
+start = time.perf_counter()
+app.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "metrics": len(app.metric), "errors": [str(e.value) for e in app.exception],
+                  "heavy": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+def _run(snippet, *args, env=None):
+    out = subprocess.run([sys.executable, "-c", snippet, *args], check=True, capture_output=True,
+                         text=True, env=env).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+def main():
+    num_sets = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, STRONG_CACHE_DIR=os.path.join(tmp, "cache"),
+                   STRONG_STORE=os.path.join(tmp, "no_store.db"))
+        path = write_export(os.path.join(tmp, "strong.csv"), num_sets)
+        # Fill the parse cache in a separate process so the timed runs start cold
+        subprocess.run([sys.executable, "-c", f"import sys; sys.path.insert(0, {SRC!r}); "
+                        f"import parse_cache; parse_cache.cached_parse_csv({path!r})"], check=True, env=env)
+
+        results = {
+            "import": _run(IMPORT_SNIPPET, env=env),
+            "first_render_no_data": _run(RENDER_SNIPPET, os.path.join(tmp, "missing.csv"), env=env),
+            "first_render_home": _run(RENDER_SNIPPET, path, env=env),
+        }
+
+    budgets = dict(BUDGETS, first_render_home=HOME_BUDGET_FIXED + HOME_BUDGET_PER_MILLION_SETS * num_sets / 1e6)
+    over = False
+    print(f"Cold start with {num_sets:,} sets")
+    for name, result in results.items():
+        ok = result["seconds"] <= budgets[name] and not result.get("errors")
+        over |= not ok
+        heavy = ", ".join(result["heavy"]) or "none"
+        print(f"  {name:<22} {result['seconds']:7.3f}s  budget {budgets[name]:6.2f}s  "
+              f"{'ok' if ok else 'OVER'}  (heavy libraries loaded: {heavy})")
+        if result.get("errors"):
+            print(f"    errors: {result['errors']}")
+    return 1 if over else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+"""
+Compare parse_csv with parse_csv_columnar on a synthetic export.
+
+Usage: python benchmarks/bench_columnar.py [num_rows]   (default 1,000,000)
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import parse_raw_data as prd  # pylint: disable=wrong-import-position
+from columnar import parse_csv_columnar  # pylint: disable=wrong-import-position
+from synthetic import write_export  # pylint: disable=wrong-import-position
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_export(os.path.join(tmp, "strong.csv"), num_rows)
+        mappings = {}
+
+        _, row_time = timed(prd.parse_csv, path)
+        result, columnar_time = timed(parse_csv_columnar, path, mappings)
+        _, view_time = timed(result.workouts)
+
+    print(f"rows:                      {num_rows:,}")
+    print(f"parse_csv:                 {row_time:.2f}s")
+    print(f"parse_csv_columnar:        {columnar_time:.2f}s ({row_time / columnar_time:.1f}x faster)")
+    print(f"  + building object view:  {view_time:.2f}s")
+
+if __name__ == "__main__":
+    main()
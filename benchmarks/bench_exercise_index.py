@@ -0,0 +1,39 @@
+"""
+Show parse_csv time growing linearly with the number of exercises per workout.
+
+The number of workouts and sets per exercise stay fixed, so the row count grows
+with exercises per workout. With a dict-based exercise index the time per row
+stays flat; a linear scan over workout.exercises made it grow with the width.
+
+Usage: python benchmarks/bench_exercise_index.py [num_workouts]   (default 200)
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import parse_raw_data as prd  # pylint: disable=wrong-import-position
+from synthetic import write_export  # pylint: disable=wrong-import-position
+
+SETS_PER_EXERCISE = 3
+EXERCISES_PER_WORKOUT = [25, 50, 100, 200, 400, 800]
+
+def main():
+    num_workouts = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"{'exercises/workout':>18} {'rows':>10} {'seconds':>9} {'us/row':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for width in EXERCISES_PER_WORKOUT:
+            num_rows = num_workouts * width * SETS_PER_EXERCISE
+            path = write_export(
+                os.path.join(tmp, f"strong_{width}.csv"), num_rows,
+                exercises_per_workout=width, sets_per_exercise=SETS_PER_EXERCISE,
+                num_exercise_names=max(EXERCISES_PER_WORKOUT),
+            )
+            start = time.perf_counter()
+            prd.parse_csv(path)
+            elapsed = time.perf_counter() - start
+            print(f"{width:>18} {num_rows:>10,} {elapsed:>9.2f} {elapsed / num_rows * 1e6:>8.2f}")
+
+if __name__ == "__main__":
+    main()
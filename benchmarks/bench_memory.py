@@ -0,0 +1,48 @@
+"""
+Report the memory held by parsed workouts, before and after compacting the sets.
+
+Parses a synthetic export with parse_csv under tracemalloc and reports the
+memory still allocated once parsing is done, then again after
+set_store.compact() has moved every set into struct-of-arrays storage.
+
+Usage: python benchmarks/bench_memory.py [num_sets]   (default 1,000,000)
+"""
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import parse_raw_data as prd  # pylint: disable=wrong-import-position
+from set_store import compact  # pylint: disable=wrong-import-position
+from synthetic import mapping_for_catalog, write_export  # pylint: disable=wrong-import-position
+
+def _retained_mb():
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+
+def main():
+    num_sets = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        prd.MAPPING_FILE = os.path.join(tmp, "mapping.json")
+        prd.save_mappings(mapping_for_catalog())
+        path = write_export(os.path.join(tmp, "strong.csv"), num_sets)
+
+        tracemalloc.start()
+        workouts = prd.parse_csv(path)
+        parsed = _retained_mb()
+        start = time.perf_counter()
+        store = compact(workouts)
+        elapsed = time.perf_counter() - start
+        compacted = _retained_mb()
+        tracemalloc.stop()
+
+    print(f"{num_sets:,} sets in {len(workouts):,} workouts")
+    print(f"parse_csv objects:      {parsed:8.1f} MB")
+    print(f"after compact():        {compacted:8.1f} MB  ({elapsed:.1f} s under tracemalloc)")
+    print(f"  of which set arrays:  {store.nbytes() / (1024 * 1024):8.1f} MB")
+
+if __name__ == "__main__":
+    main()
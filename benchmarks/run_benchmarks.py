@@ -0,0 +1,145 @@
+"""
+Benchmark suite with a JSON baseline and regression check.
+
+Generates a synthetic export (see synthetic.py), times each case several times
+and keeps the best run. With --update-baseline the results are written to the
+baseline file; otherwise they are compared to it and the script exits with
+status 1 if any case got slower than the baseline by more than --threshold.
+
+Usage: python benchmarks/run_benchmarks.py [--rows N] [--repeat R]
+           [--baseline PATH] [--threshold 0.25] [--min-delta-ms 1.0]
+           [--update-baseline] [--output PATH]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import parse_raw_data as prd  # pylint: disable=wrong-import-position
+from classifier import BodyPartIndex  # pylint: disable=wrong-import-position
+from columnar import read_sets_frame  # pylint: disable=wrong-import-position
+from rollups import Rollups  # pylint: disable=wrong-import-position
+from workout_collection import METRICS, WorkoutCollection  # pylint: disable=wrong-import-position
+from synthetic import (  # pylint: disable=wrong-import-position
+    exercise_name_variants, mapping_for_catalog, write_export)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+def _filter_linear(workouts, start, end):
+    """The list-comprehension filter gui.filter_workouts uses for plain lists."""
+    return [w for w in workouts if start <= w.date.date() <= end]
+
+def build_cases(csv_path):
+    """Name -> zero-argument callable for every benchmarked operation."""
+    workouts = prd.parse_csv(csv_path)
+    collection = WorkoutCollection(workouts)
+    rollups = Rollups(workouts)
+    # The middle half of the history, like a typical date-picker selection
+    days = collection.days
+    start, end = days[len(days) // 4], days[3 * len(days) // 4]
+    durations = [w.duration for w in workouts]
+    duration_strs = [f"{d // 60}h {d % 60}m" if d >= 60 else f"{d}m" for d in durations]
+    body_part_index = BodyPartIndex(prd.load_mappings())
+    custom_names = exercise_name_variants(2000)
+
+    def home_sums_linear():
+        filtered = _filter_linear(workouts, start, end)
+        return [sum(getattr(w, m) for w in filtered) for m in METRICS]
+
+    return {
+        "parse_csv": lambda: prd.parse_csv(csv_path),
+        "read_sets_frame": lambda: read_sets_frame(csv_path),
+        "parse_duration": lambda: [prd.parse_duration(s) for s in duration_strs],
+        "filter_workouts_linear": lambda: _filter_linear(workouts, start, end),
+        "filter_workouts_collection": lambda: collection.between(start, end),
+        "home_metrics_linear": home_sums_linear,
+        "home_metrics_collection": lambda: collection.totals(start, end),
+        "collection_build": lambda: WorkoutCollection(workouts),
+        "graphs_rollups_build": lambda: Rollups(workouts),
+        "graphs_weekly_body_parts": lambda: rollups.body_part_sets(start, end, "week"),
+        "graphs_daily_weight": lambda: rollups.daily_totals(start, end),
+        "classify_2000_exercises": lambda: body_part_index.classify(custom_names),
+    }
+
+def time_case(fn, repeat):
+    """Best wall time of repeat runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def compare(results, baseline, threshold, min_delta=0.001):
+    """
+    Return [(case, baseline s, current s)] for cases slower than baseline * (1 + threshold).
+    Slowdowns smaller than min_delta seconds are timer noise and are ignored.
+    """
+    regressions = []
+    for name, seconds in results.items():
+        previous = baseline.get(name)
+        if (previous is not None and seconds > previous * (1 + threshold)
+                and seconds - previous > min_delta):
+            regressions.append((name, previous, seconds))
+    return regressions
+
+def run(rows, repeat, work_dir):
+    """Generate an export with rows set rows and time every case. Returns {case: seconds}."""
+    csv_path = write_export(os.path.join(work_dir, "strong.csv"), rows)
+    results = {}
+    for name, fn in build_cases(csv_path).items():
+        results[name] = time_case(fn, repeat)
+        print(f"{name:<28} {results[name] * 1000:>10.2f} ms")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark suite.")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before failing, as a fraction (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="ignore slowdowns smaller than this many milliseconds")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--output", help="also write this run's results to a JSON file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Benchmark against the synthetic catalog's mapping, not the user's
+        prd.MAPPING_FILE = os.path.join(tmp, "mapping.json")
+        prd.save_mappings(mapping_for_catalog())
+        results = run(args.rows, args.repeat, tmp)
+
+    record = {"rows": args.rows, "recorded": date.today().isoformat(), "results": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=2)
+
+    if args.update_baseline or not os.path.isfile(args.baseline):
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=2)
+        print(f"\nBaseline written to {args.baseline}.")
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("rows") != args.rows:
+        print(f"\nBaseline was recorded with {baseline.get('rows')} rows, not {args.rows}; "
+              "rerun with matching --rows or --update-baseline.")
+        return 1
+
+    regressions = compare(results, baseline["results"], args.threshold, args.min_delta_ms / 1000)
+    for name, previous, seconds in regressions:
+        print(f"REGRESSION {name}: {previous * 1000:.2f} ms -> {seconds * 1000:.2f} ms")
+    if regressions:
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:.0%} of {args.baseline}.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""
+Write realistic synthetic Strong exports for benchmarking.
+
+Workouts follow a push / pull / legs split with a varied number of exercises and
+sets, progressive weights, bodyweight and cardio movements, durations over and
+under an hour, and occasional notes containing commas, quotes and line breaks.
+
+Usage: python benchmarks/synthetic.py OUT.csv [--rows N] [--seed S] [--mapping OUT.json]
+"""
+import argparse
+import csv
+import json
+import random
+from datetime import datetime, timedelta
+
+HEADER = [
+    "Date", "Workout Name", "Duration", "Exercise Name", "Set Order",
+    "Weight", "Reps", "Notes", "Workout Notes",
+]
+WORKOUT_NAMES = ["Push", "Pull", "Legs", "Upper", "Lower", "Full Body"]
+
+# Exercise name -> (body part, starting weight in lbs, 0 for bodyweight)
+CATALOG = {
+    "Bench Press (Barbell)": ("Pecs", 135),
+    "Incline Bench Press (Dumbbell)": ("Pecs", 50),
+    "Chest Fly (Cable)": ("Pecs", 30),
+    "Push Up": ("Pecs", 0),
+    "Overhead Press (Barbell)": ("Front Delts", 85),
+    "Lateral Raise (Dumbbell)": ("Side Delts", 15),
+    "Face Pull (Cable)": ("Rear Delts", 40),
+    "Triceps Pushdown (Cable)": ("Triceps", 50),
+    "Skullcrusher (EZ Bar)": ("Triceps", 50),
+    "Deadlift (Barbell)": ("Hamstrings", 225),
+    "Pull Up": ("Back (Lats)", 0),
+    "Lat Pulldown (Cable)": ("Back (Lats)", 120),
+    "Bent Over Row (Barbell)": ("Back (Upper)", 135),
+    "Shrug (Dumbbell)": ("Traps", 60),
+    "Bicep Curl (Dumbbell)": ("Biceps", 25),
+    "Hammer Curl (Dumbbell)": ("Forearms", 25),
+    "Squat (Barbell)": ("Quads", 185),
+    "Leg Press": ("Quads", 270),
+    "Romanian Deadlift (Barbell)": ("Hamstrings", 155),
+    "Hip Thrust (Barbell)": ("Glutes", 185),
+    "Standing Calf Raise (Machine)": ("Calves", 150),
+    "Tibialis Raise": ("Tibialis", 0),
+    "Crunch": ("Abs", 0),
+    "Plank": ("Abs", 0),
+    "Running (Treadmill)": ("Cardio", 0),
+}
+SPLITS = {
+    "Push": ["Pecs", "Front Delts", "Side Delts", "Triceps", "Abs"],
+    "Pull": ["Back (Lats)", "Back (Upper)", "Rear Delts", "Traps", "Biceps", "Forearms"],
+    "Legs": ["Quads", "Hamstrings", "Glutes", "Calves", "Tibialis", "Cardio"],
+}
+SET_NOTES = ["", "", "", "", "", "", "Felt strong", "Grip slipped, reset", 'Used "thumbless" grip',
+             "Paused reps\nslow eccentric"]
+WORKOUT_NOTES = ["", "", "", "", "Deload week", "Short on time, supersets", "Gym was busy"]
+
+def mapping_for_catalog():
+    """Exercise -> body part mapping covering every CATALOG exercise."""
+    return {name: body_part for name, (body_part, _) in CATALOG.items()}
+
+def exercise_name_variants(count, seed=0):
+    """
+    count custom exercise names built from CATALOG movements, the way athletes
+    rename them ("Paused Bench Press (Smith Machine)", "Squat - Tempo 3"), for
+    benchmarking the body part classifier.
+    """
+    rng = random.Random(seed)
+    prefixes = ["", "", "Paused", "Tempo", "Single Arm", "Seated", "Standing", "Heavy", "Banded"]
+    suffixes = ["", "(Smith Machine)", "(Machine)", "(Band)", "- Tempo 3", "- Drop Set", "v2"]
+    movements = list(CATALOG)
+    names = []
+    for i in range(count):
+        base = rng.choice(movements)
+        names.append(" ".join(p for p in (rng.choice(prefixes), base, rng.choice(suffixes), str(i)) if p))
+    return names
+
+def _format_duration(minutes):
+    return f"{minutes // 60}h {minutes % 60}m" if minutes >= 60 else f"{minutes}m"
+
+def _exercises_for(rng, workout_name, count):
+    """Pick count exercises matching the workout's split (any exercise for other names)."""
+    body_parts = SPLITS.get(workout_name)
+    pool = [n for n, (bp, _) in CATALOG.items() if body_parts is None or bp in body_parts]
+    return rng.sample(pool, min(count, len(pool)))
+
+def write_export(path, num_rows, exercises_per_workout=None, sets_per_exercise=None, seed=0,
+                 num_exercise_names=None):
+    """
+    Write num_rows set rows to path, grouped into workouts like a real export.
+    Exercises and sets per workout vary unless fixed by exercises_per_workout /
+    sets_per_exercise; num_exercise_names switches to generated "Exercise N"
+    names (for benchmarks that need many distinct exercises).
+    """
+    rng = random.Random(seed)
+    generated_names = [f"Exercise {i}" for i in range(num_exercise_names or 0)]
+    start = datetime(2015, 1, 1, 7, 0, 0)
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        written = 0
+        workout_index = 0
+        while written < num_rows:
+            # Roughly 5 sessions a week, at varying times of day
+            day = start + timedelta(days=workout_index * 7 // 5)
+            date = day + timedelta(minutes=rng.randint(0, 14 * 60), seconds=rng.randint(0, 59))
+            date_str = date.strftime("%Y-%m-%d %H:%M:%S")
+            name = WORKOUT_NAMES[workout_index % 3] if rng.random() < 0.85 else rng.choice(WORKOUT_NAMES)
+            workout_notes = rng.choice(WORKOUT_NOTES)
+            # Progressive overload: about 1% heavier per 10 workouts
+            progress = 1 + workout_index / 1000
+
+            width = exercises_per_workout or rng.randint(4, 8)
+            if generated_names:
+                exercises = [generated_names[(workout_index * 7 + e) % len(generated_names)]
+                             for e in range(width)]
+            else:
+                exercises = _exercises_for(rng, name, width)
+            sets_plan = [sets_per_exercise or rng.randint(2, 5) for _ in exercises]
+            duration = _format_duration(max(15, sum(sets_plan) * 3 + rng.randint(-10, 20)))
+
+            for exercise, num_sets in zip(exercises, sets_plan):
+                _, base_weight = CATALOG.get(exercise, ("", 50))
+                for s in range(1, num_sets + 1):
+                    if written >= num_rows:
+                        break
+                    weight = base_weight * progress * rng.uniform(0.9, 1.05) if base_weight else 0
+                    writer.writerow([
+                        date_str, name, duration, exercise, s,
+                        f"{round(weight / 2.5) * 2.5:.1f}", rng.randint(3, 15),
+                        rng.choice(SET_NOTES), workout_notes,
+                    ])
+                    written += 1
+            workout_index += 1
+    return path
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic Strong export.")
+    parser.add_argument("path")
+    parser.add_argument("--rows", type=int, default=100_000, help="set rows to write (10k to 10M)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mapping", help="also write an exercise -> body part mapping JSON here")
+    args = parser.parse_args()
+    write_export(args.path, args.rows, seed=args.seed)
+    if args.mapping:
+        with open(args.mapping, "w", encoding="utf-8") as f:
+            json.dump(mapping_for_catalog(), f, indent=2)
+    print(f"Wrote {args.rows:,} rows to {args.path}.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Parse a Strong export on a background thread.
+
+BackgroundLoad reads the export in batches of rows (columnar.iter_set_batches),
+turns each batch into workouts and merges them into the result so far, so a
+caller polling it (the GUI, once per rerun) can show progress and partial
+workouts while the parse runs, and cancel it between batches. Published
+workouts are never changed afterwards: a workout that a later batch adds sets
+to is copied first. Exports read from a path are written to the parse cache
+when they finish, and the whole parse is recorded as one timing stage.
+"""
+import io
+import os
+import threading
+
+import pandas as pd
+
+import parse_cache
+from columnar import iter_set_batches, workouts_from_frame
+from instrumentation import active_recorder, stage, use_recorder
+from parse_raw_data import Workout, load_mappings, merge_workouts
+
+BATCH_ROWS = 20_000
+
+RUNNING = "running"
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+def _copy_workout(workout):
+    """A new Workout with the same fields and sets, for changing without touching the original."""
+    copy = Workout(workout.name, workout.date, workout.duration, workout.notes)
+    for exercise in workout.exercises:
+        for s in exercise.exercise_sets:
+            copy.add_set(exercise.name, s, body_part=exercise.body_part)
+    return copy
+
+class BackgroundLoad:
+    """
+    One export being parsed on a worker thread. source is a path, bytes or a
+    binary stream; label names it in messages. Call start(), then poll
+    progress / workouts() / status from the main thread. cache_entry is the
+    parse_cache.cache_path of a path source, if the caller already hashed it.
+    """
+    def __init__(self, source, label, batch_rows=BATCH_ROWS, cache_dir=None, cache_entry=None):
+        self.source = source
+        self.label = label
+        self.batch_rows = batch_rows
+        self.cache_dir = cache_dir
+        self.cache_entry = cache_entry
+        self.status = RUNNING
+        self.error = None
+        self.rows_read = 0
+        self.bytes_read = 0
+        self.total_bytes = None
+        # Bumped each time a batch is published, so pollers can skip unchanged results
+        self.version = 0
+        self._workouts = []
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        # The worker records its stage into the timings of the session that started it
+        self._recorder = active_recorder()
+        self._thread = threading.Thread(target=self._run, name=f"load {label}", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Ask the worker to stop after the current batch; workouts read so far are kept."""
+        self._cancel.set()
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+    @property
+    def running(self):
+        return self.status == RUNNING
+
+    @property
+    def progress(self):
+        """Fraction of the input read so far, between 0 and 1."""
+        if self.status == DONE:
+            return 1.0
+        if not self.total_bytes:
+            return 0.0
+        return min(1.0, self.bytes_read / self.total_bytes)
+
+    def workouts(self):
+        """
+        The workouts parsed so far (all of them once status is DONE). Each batch
+        publishes a new list, and published workouts are not modified later, so
+        neither the list nor its workouts change under the caller.
+        """
+        with self._lock:
+            return self._workouts
+
+    def _open(self):
+        """Binary stream over the source, and its size in bytes if known."""
+        if isinstance(self.source, (str, os.PathLike)):
+            return open(self.source, "rb"), os.path.getsize(self.source)
+        if isinstance(self.source, (bytes, bytearray, memoryview)):
+            return io.BytesIO(self.source), len(self.source)
+        stream = self.source
+        stream.seek(0, io.SEEK_END)
+        size = stream.tell()
+        stream.seek(0)
+        return stream, size
+
+    def _run(self):
+        use_recorder(self._recorder)
+        with stage("background_load") as record:
+            self._parse()
+            record["rows"] = self.rows_read
+
+    def _parse(self):
+        is_path = isinstance(self.source, (str, os.PathLike))
+        stream = None
+        try:
+            entry = None
+            if is_path:
+                entry = self.cache_entry or parse_cache.cache_path(self.source, self.cache_dir)
+            stream, self.total_bytes = self._open()
+            by_key = {}
+            published = set()
+            frames = []
+            for batch in iter_set_batches(stream, self.batch_rows, load_mappings()):
+                batch_workouts = {(w.date, w.name): w for w in workouts_from_frame(batch)}
+                # A workout cut by a batch boundary is merged back together by key,
+                # into a copy if the old half was already published
+                for key in batch_workouts.keys() & published:
+                    by_key[key] = _copy_workout(by_key[key])
+                merge_workouts(by_key, batch_workouts)
+                if entry is not None:
+                    frames.append(batch)
+                with self._lock:
+                    self._workouts = list(by_key.values())
+                    published = set(by_key)
+                    self.rows_read += len(batch)
+                    self.bytes_read = stream.tell()
+                    self.version += 1
+                if self._cancel.is_set():
+                    self.status = CANCELLED
+                    return
+            if entry is not None and frames:
+                parse_cache.store_frame(entry, pd.concat(frames, ignore_index=True), self.cache_dir)
+            self.status = DONE
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Surfaced to the GUI through status / error instead of killing the thread silently
+            self.error = e
+            self.status = FAILED
+        finally:
+            if is_path and stream is not None:
+                stream.close()
@@ -0,0 +1,79 @@
+"""
+Altair chart builders shared by the GUI pages and the headless reports (report.py).
+
+Each takes the frame a page already computes and returns a chart, so the same
+chart can be shown with st.altair_chart or saved as a static HTML / PNG file.
+"""
+import altair as alt
+import pandas as pd
+
+# Acute:chronic workload ratio range usually read as a safe progression
+ACWR_BAND = (0.8, 1.3)
+
+def line_chart(data, title):
+    """
+    One line per column of date-indexed data (a Series is a single line), the
+    static counterpart of st.line_chart.
+    """
+    frame = data.to_frame(title) if isinstance(data, pd.Series) else data
+    long = frame.rename_axis("date").reset_index().melt("date", var_name="series", value_name="value")
+    chart = (
+        alt.Chart(long)
+        .mark_line()
+        .encode(
+            x=alt.X("date:T", title="Date"),
+            y=alt.Y("value:Q", title=title),
+            tooltip=["date:T", "series:N", "value:Q"],
+        )
+        .properties(width=600)
+    )
+    if frame.shape[1] > 1:
+        chart = chart.encode(color=alt.Color("series:N", title=None))
+    return chart
+
+def chart_spec(chart):
+    """
+    Vega-Lite dict of a chart, with its data inlined. Long daily series can pass
+    altair's 5,000-row default limit; they are already cut down to a date range.
+    """
+    with alt.data_transformers.disable_max_rows():
+        return chart.to_dict()
+
+def body_part_chart(df_bar, granularity):
+    """Stacked bar chart of sets per period (x) and body part (color)."""
+    return (
+        alt.Chart(df_bar)
+        .mark_bar()
+        .encode(
+            x=alt.X("period:N", title=granularity),
+            y=alt.Y("sum(sets_count):Q", title="Number of Exercise Sets"),
+            color=alt.Color("body_part:N", title="Body Part", scale=alt.Scale(scheme='category20'))
+        )
+        .properties(width=600)
+    )
+
+def pr_timeline_chart(events, record_label):
+    """Points for each record-setting day (x) and record value (y), colored by exercise."""
+    return (
+        alt.Chart(events)
+        .mark_point(filled=True)
+        .encode(
+            x=alt.X("date:T", title="Date"),
+            y=alt.Y("value:Q", title=record_label),
+            color=alt.Color("exercise:N", title="Exercise", scale=alt.Scale(scheme='category20')),
+            tooltip=["date:T", "exercise:N", "value:Q", "weight:Q", "reps:Q"],
+        )
+        .properties(width=600)
+    )
+
+def training_load_chart(series):
+    """Acute:chronic workload ratio per day (line) over the shaded ACWR_BAND."""
+    data = series["acwr"].dropna().rename("acwr").reset_index()
+    band = alt.Chart(pd.DataFrame({"low": [ACWR_BAND[0]], "high": [ACWR_BAND[1]]})).mark_rect(
+        opacity=0.15, color="green").encode(y="low:Q", y2="high:Q")
+    line = alt.Chart(data).mark_line().encode(
+        x=alt.X("date:T", title="Date"),
+        y=alt.Y("acwr:Q", title="Acute:chronic workload ratio"),
+        tooltip=["date:T", alt.Tooltip("acwr:Q", format=".2f")],
+    )
+    return (band + line).properties(width=600)
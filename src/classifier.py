@@ -0,0 +1,155 @@
+"""
+Batch exercise -> body part classification from the existing mapping.
+
+Every mapped exercise name is split into character trigrams and whole words,
+weighted by inverse document frequency and kept in an inverted index. Unmapped
+names are scored in batches against every mapped name by cosine similarity, and
+the best match's body part is assigned when it is both confident (score >=
+threshold) and clearly ahead of the best match for any other body part (by
+margin). Everything else is left for prompt_for_body_part.
+"""
+import math
+import re
+from collections import Counter
+
+import numpy as np
+
+DEFAULT_THRESHOLD = 0.6
+DEFAULT_MARGIN = 0.1
+CHUNK_SIZE = 256
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+def normalize(name):
+    """Lowercase and collapse punctuation, e.g. "Curl (Dumbbell)" -> "curl dumbbell"."""
+    return _NON_WORD.sub(" ", name.lower()).strip()
+
+def features(name, n=3):
+    """Character n-grams of the padded normalized name plus its whole words."""
+    text = f" {normalize(name)} "
+    grams = {text[i:i + n] for i in range(len(text) - n + 1)}
+    grams.update("w:" + word for word in text.split())
+    return grams
+
+class BodyPartIndex:
+    """Similarity index over an exercise name -> BodyPart value mapping."""
+    def __init__(self, mappings, n=3):
+        self.n = n
+        # Mapped names grouped by body part, so per-body-part maxima are contiguous column ranges
+        entries = sorted((body_part, name) for name, body_part in mappings.items() if body_part)
+        self.names = [name for _, name in entries]
+        self._exact = {normalize(name): body_part for body_part, name in entries}
+        self.labels = []
+        label_starts = []
+        for i, (body_part, _) in enumerate(entries):
+            if not self.labels or self.labels[-1] != body_part:
+                self.labels.append(body_part)
+                label_starts.append(i)
+        self._label_starts = np.array(label_starts, dtype=np.intp)
+
+        docs = [features(name, n) for name in self.names]
+        doc_freq = Counter(feature for doc in docs for feature in doc)
+        self._vocab = {feature: i for i, feature in enumerate(doc_freq)}
+        total = len(docs)
+        self._idf = np.array([math.log((1 + total) / (1 + df)) + 1 for df in doc_freq.values()])
+
+        # Inverted index in CSR form: feature f's postings are
+        # _doc_ids[_ptr[f]:_ptr[f + 1]] with matching _weights
+        feature_ids = np.array([self._vocab[f] for doc in docs for f in doc], dtype=np.intp)
+        doc_ids = np.repeat(np.arange(total), [len(doc) for doc in docs])
+        weights = self._idf[feature_ids]
+        doc_norms = np.sqrt(np.bincount(doc_ids, weights=weights ** 2, minlength=total))
+        order = np.argsort(feature_ids, kind="stable")
+        self._doc_ids = doc_ids[order]
+        self._weights = (weights / doc_norms[doc_ids])[order]
+        self._ptr = np.searchsorted(feature_ids[order], np.arange(len(self._vocab) + 1))
+
+    def __len__(self):
+        return len(self.names)
+
+    def _query(self, name):
+        """(vocabulary ids, idf weights, norm) of a name's features. Unseen features add to the norm."""
+        grams = features(name, self.n)
+        ids = np.array([self._vocab[g] for g in grams if g in self._vocab], dtype=np.intp)
+        weights = self._idf[ids]
+        norm = math.sqrt(float(weights @ weights) + len(grams) - len(ids)) or 1.0
+        return ids, weights, norm
+
+    def best_scores(self, names):
+        """
+        Array of shape (len(names), len(labels)): for each name, the best cosine
+        similarity to any mapped name of each body part. Names are scored in chunks
+        by expanding their features' postings and summing with one bincount.
+        """
+        scores = np.zeros((len(names), len(self.labels)))
+        num_docs = len(self.names)
+        if not num_docs:
+            return scores
+        for chunk_start in range(0, len(names), CHUNK_SIZE):
+            chunk = names[chunk_start:chunk_start + CHUNK_SIZE]
+            queries = [self._query(name) for name in chunk]
+            feature_ids = np.concatenate([ids for ids, _, _ in queries])
+            query_weights = np.concatenate([w / norm for _, w, norm in queries])
+            query_index = np.repeat(np.arange(len(chunk)), [len(ids) for ids, _, _ in queries])
+
+            firsts = self._ptr[feature_ids]
+            lengths = self._ptr[feature_ids + 1] - firsts
+            # Positions of every posting of every query feature, without a Python loop
+            postings = (np.repeat(firsts - (np.cumsum(lengths) - lengths), lengths)
+                        + np.arange(lengths.sum()))
+            dots = np.bincount(
+                np.repeat(query_index * num_docs, lengths) + self._doc_ids[postings],
+                weights=self._weights[postings] * np.repeat(query_weights, lengths),
+                minlength=len(chunk) * num_docs,
+            ).reshape(len(chunk), num_docs)
+            scores[chunk_start:chunk_start + len(chunk)] = np.maximum.reduceat(
+                dots, self._label_starts, axis=1)
+        return scores
+
+    def scores(self, name):
+        """{body part: best similarity} for one name, leaving out body parts with no overlap."""
+        exact = self._exact.get(normalize(name))
+        if exact is not None:
+            return {exact: 1.0}
+        row = self.best_scores([name])[0]
+        return {label: float(score) for label, score in zip(self.labels, row) if score > 0}
+
+    def match(self, name):
+        """(best body part, score, best score of another body part), or (None, 0, 0) without overlap."""
+        ranked = sorted(self.scores(name).items(), key=lambda item: item[1], reverse=True)
+        if not ranked:
+            return None, 0.0, 0.0
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        return ranked[0][0], ranked[0][1], runner_up
+
+    def classify(self, names, threshold=DEFAULT_THRESHOLD, margin=DEFAULT_MARGIN):
+        """
+        Split names into ({name: body part} confidently assigned, [ambiguous names])
+        in one batched pass. Ambiguous names keep their input order so they can be
+        prompted for.
+        """
+        assigned = {}
+        pending = []
+        for name in names:
+            exact = self._exact.get(normalize(name))
+            if exact is not None:
+                assigned[name] = exact
+            else:
+                pending.append(name)
+        if not self.labels:
+            return assigned, pending
+
+        scores = self.best_scores(pending)
+        best = scores.argmax(axis=1)
+        top = scores[np.arange(len(pending)), best]
+        if len(self.labels) > 1:
+            runner_up = np.partition(scores, -2, axis=1)[:, -2]
+        else:
+            runner_up = np.zeros(len(pending))
+        confident = (top >= threshold) & (top - runner_up >= margin)
+        ambiguous = []
+        for name, label, is_confident in zip(pending, best, confident):
+            if is_confident:
+                assigned[name] = self.labels[label]
+            else:
+                ambiguous.append(name)
+        return assigned, ambiguous
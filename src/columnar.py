@@ -0,0 +1,218 @@
+"""
+Columnar parse engine for Strong exports.
+
+Reads the whole CSV in one go with pandas and converts dates, weights, reps and
+durations as column operations instead of row by row. The Workout / Exercise /
+ExerciseSet objects produced by parse_raw_data.parse_csv are still available,
+but only built when asked for via ColumnarWorkouts.workouts().
+"""
+import io
+import random
+import sys
+from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
+
+from parse_raw_data import (
+    BODY_PARTS_BY_VALUE, BodyPart, Exercise, ExerciseSet, Workout, load_mappings,
+)
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Raw CSV header -> column name in the typed frame
+COLUMNS = {
+    "Date": "date_str",
+    "Workout Name": "workout_name",
+    "Duration": "duration_str",
+    "Exercise Name": "exercise_name",
+    "Set Order": "set_order",
+    "Weight": "weight",
+    "Reps": "reps",
+    "Notes": "notes",
+    "Workout Notes": "workout_notes",
+}
+NUMERIC_COLUMNS = ("Set Order", "Weight", "Reps")
+
+def _per_unique(values, convert):
+    """
+    Apply a column conversion to the distinct values only and broadcast the result.
+    Exports repeat the same Date and Duration strings for every set of a workout,
+    so this is much cheaper than converting every row.
+    """
+    codes, uniques = pd.factorize(values)
+    converted = convert(pd.Series(uniques, dtype=str))
+    return pd.Series(np.asarray(converted)[codes], index=values.index)
+
+def parse_duration_column(durations):
+    """Vectorized parse_duration: "1h 31m" -> 91 for a whole Series of strings."""
+    hours = durations.str.extract(r"(\d+)h", expand=False)
+    minutes = durations.str.extract(r"(\d+)m", expand=False)
+    hours = pd.to_numeric(hours).fillna(0).astype("int64")
+    minutes = pd.to_numeric(minutes).fillna(0).astype("int64")
+    return hours * 60 + minutes
+
+def resolve_body_parts(exercise_names, mappings):
+    """Map exercise names to BodyPart values once per unique name, then broadcast."""
+    resolved = {}
+    for name in exercise_names.unique():
+        if name in mappings:
+            body_part_str = mappings[name]
+            if body_part_str not in BODY_PARTS_BY_VALUE:
+                body_part_str = random.choice(list(BodyPart)).value
+            resolved[name] = body_part_str
+        else:
+            resolved[name] = ""
+    return exercise_names.map(resolved)
+
+def _read_csv(source, **kwargs):
+    """pd.read_csv with the column types of a Strong export. Also accepts a bytes buffer."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    # Numeric columns are parsed by the C reader; empty cells become NaN
+    return pd.read_csv(
+        source,
+        usecols=list(COLUMNS),
+        dtype={name: (float if name in NUMERIC_COLUMNS else str) for name in COLUMNS},
+        keep_default_na=False,
+        na_values={name: [""] for name in NUMERIC_COLUMNS},
+        encoding="utf-8",
+        **kwargs,
+    )
+
+def _typed_frame(raw, mappings):
+    """Convert a raw read_csv frame to the typed sets frame."""
+    raw = raw.rename(columns=COLUMNS)
+    return pd.DataFrame({
+        "date": _per_unique(
+            raw["date_str"], lambda dates: pd.to_datetime(dates, format=DATE_FORMAT)),
+        "date_str": raw["date_str"],
+        "workout_name": raw["workout_name"],
+        "duration": _per_unique(raw["duration_str"], parse_duration_column),
+        "exercise_name": raw["exercise_name"],
+        "body_part": resolve_body_parts(raw["exercise_name"], mappings),
+        # int(float(...)) in parse_csv truncates towards zero
+        "set_number": raw["set_order"].fillna(1).astype("int64"),
+        "weight": np.trunc(raw["weight"].fillna(0)).astype("int64"),
+        "reps": raw["reps"].fillna(0).astype("int64"),
+        "notes": raw["notes"],
+        "workout_notes": raw["workout_notes"],
+    })
+
+def read_sets_frame(source, mappings=None):
+    """
+    Read a Strong CSV into a typed DataFrame with one row per exercise set.
+    Columns: date (datetime64), date_str, workout_name, duration (minutes),
+    exercise_name, body_part (BodyPart value or ""), set_number, weight, reps,
+    notes, workout_notes.
+    """
+    if mappings is None:
+        mappings = load_mappings()
+    return _typed_frame(_read_csv(source), mappings)
+
+def iter_set_batches(source, batch_size=100_000, mappings=None):
+    """
+    Yield the typed sets frame in batches of at most batch_size rows, so
+    aggregations over huge exports run in memory bounded by the batch size.
+    """
+    if mappings is None:
+        mappings = load_mappings()
+    with _read_csv(source, chunksize=batch_size) as reader:
+        for raw in reader:
+            yield _typed_frame(raw, mappings)
+
+def workouts_from_frame(frame):
+    """
+    Build Workout/Exercise/ExerciseSet objects from a typed sets frame, in parse_csv
+    order. Consecutive rows of one exercise in one workout are added as a batch.
+    """
+    workouts = {}
+    date_objs = {}
+    # tolist() gives every row its own str; share repeated notes and names instead
+    notes_table = {}
+    columns = zip(
+        frame["date_str"].tolist(),
+        frame["workout_name"].tolist(),
+        frame["duration"].tolist(),
+        frame["exercise_name"].tolist(),
+        frame["body_part"].tolist(),
+        frame["set_number"].tolist(),
+        frame["weight"].tolist(),
+        frame["reps"].tolist(),
+        frame["notes"].tolist(),
+        frame["workout_notes"].tolist(),
+    )
+    for (date_str, workout_name, exercise_name), run in groupby(columns, key=itemgetter(0, 1, 3)):
+        run = list(run)
+        date_parsed = date_objs.get(date_str)
+        if date_parsed is None:
+            date_parsed = datetime.strptime(date_str, DATE_FORMAT)
+            date_objs[date_str] = date_parsed
+
+        workout_key = (date_str, workout_name)
+        workout_obj = workouts.get(workout_key)
+        if workout_obj is None:
+            duration, workout_notes = run[0][2], run[0][9]
+            workout_obj = Workout(sys.intern(workout_name), date_parsed, duration,
+                                  notes_table.setdefault(workout_notes, workout_notes))
+            workouts[workout_key] = workout_obj
+
+        exercise_obj = workout_obj.get_exercise(exercise_name)
+        if exercise_obj is None:
+            the_body_part = BODY_PARTS_BY_VALUE.get(run[0][4])
+            exercise_obj = workout_obj.add_exercise(
+                Exercise(sys.intern(exercise_name), body_part=the_body_part))
+
+        name = workout_obj.name
+        exercise_obj.add_sets([
+            ExerciseSet(name, date_parsed, set_number, weight, reps, notes_table.setdefault(notes, notes))
+            for _, _, _, _, _, set_number, weight, reps, notes, _ in run
+        ])
+
+    return list(workouts.values())
+
+def workout_summary(frame):
+    """
+    One row per workout (Date + Workout Name) of a typed sets frame, in
+    WorkoutCollection order (by date, ties in parse_csv order). Columns: date and
+    the totals of workout_collection.METRICS, equal to the Workout properties.
+    """
+    grouped = frame.groupby(["date_str", "workout_name"], sort=False)
+    summary = pd.DataFrame({
+        "date": grouped["date"].first(),
+        "duration": grouped["duration"].first(),
+        "total_weight_lifted": grouped["weight"].sum(),
+        "total_reps_performed": grouped["reps"].sum(),
+        "number_of_exercises": grouped["exercise_name"].nunique(),
+        "number_of_exercise_sets": grouped.size(),
+    })
+    return summary.sort_values("date", kind="stable").reset_index(drop=True)
+
+class ColumnarWorkouts:
+    """
+    Result of parse_csv_columnar: the typed sets frame plus a lazy object view.
+    Workout objects are only built on the first call to workouts().
+    """
+    def __init__(self, frame):
+        self.frame = frame
+        self._workouts = None
+
+    def __len__(self):
+        """Number of workouts (unique Date + Workout Name pairs)."""
+        return len(self.frame.drop_duplicates(["date_str", "workout_name"]))
+
+    @property
+    def number_of_sets(self):
+        return len(self.frame)
+
+    def workouts(self):
+        """Return the same list of Workout objects parse_csv would produce."""
+        if self._workouts is None:
+            self._workouts = workouts_from_frame(self.frame)
+        return self._workouts
+
+def parse_csv_columnar(source, mappings=None):
+    """Columnar counterpart of parse_csv. Returns a ColumnarWorkouts."""
+    return ColumnarWorkouts(read_sets_frame(source, mappings))
@@ -0,0 +1,86 @@
+"""
+Server-side downsampling of chart data before it is sent to the browser.
+
+Long date ranges would otherwise send one line point per training day and one
+bar segment per body part per week. The weight line is reduced with
+Largest-Triangle-Three-Buckets (LTTB), which keeps the visual shape of the
+series, and bar charts move to the next coarser period once they have too many bars.
+"""
+import numpy as np
+
+MAX_LINE_POINTS = 500
+MAX_BARS = 156
+# Next coarser period for the bar chart rollup
+COARSER = {"day": "week", "week": "month", "month": "year"}
+
+def lttb_indices(x, y, threshold):
+    """
+    Indices of the threshold points LTTB keeps from (x, y). The first and last
+    points are always kept; every bucket in between contributes the point that
+    forms the largest triangle with the previous pick and the next bucket's mean.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # threshold - 2 buckets over the points between the first and last
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    edges = np.append(edges, n)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], edges[i + 2]
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+    return indices
+
+def downsample_series(series, max_points=MAX_LINE_POINTS):
+    """
+    LTTB-downsample a date-indexed Series to at most max_points.
+    Returns (series, points_saved).
+    """
+    if len(series) <= max_points:
+        return series, 0
+    x = series.index.to_numpy().astype("datetime64[ns]").astype(np.int64)
+    kept = lttb_indices(x, series.to_numpy(), max_points)
+    return series.iloc[kept], len(series) - len(kept)
+
+def cap_periods(frame_for, granularity, max_bars=MAX_BARS):
+    """
+    Build bar-chart data with frame_for(granularity), moving to coarser periods
+    while there are more than max_bars distinct periods.
+    Returns (frame, granularity used, bar segments saved).
+    """
+    frame = frame_for(granularity)
+    original_segments = len(frame)
+    while frame["period"].nunique() > max_bars and granularity in COARSER:
+        granularity = COARSER[granularity]
+        frame = frame_for(granularity)
+    return frame, granularity, original_segments - len(frame)
+
+def thin_events(events, max_points=MAX_LINE_POINTS):
+    """
+    Reduce a dated event table (e.g. the PR timeline) to at most about max_points
+    rows by keeping only the last event per exercise and record type in each
+    month, then each year. Returns (events, points_saved).
+    """
+    if len(events) <= max_points:
+        return events, 0
+    thinned = events
+    for freq in ("M", "Y"):
+        period = events["date"].dt.to_period(freq)
+        thinned = events[~events.assign(_period=period)
+                         .duplicated(["exercise", "record", "_period"], keep="last")]
+        if len(thinned) <= max_points:
+            break
+    return thinned, len(events) - len(thinned)
@@ -0,0 +1,95 @@
+"""
+Dataset-level history of every exercise.
+
+Each exercise name maps to its sets across all workouts, in date order, stored
+as three parallel numpy arrays (date, weight, reps). Looking up an exercise is a
+dict access, its last performance is the last array element, and a date range is
+two searchsorted calls, instead of scanning every workout for matching names.
+"""
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+EPOCH = datetime(1970, 1, 1)
+
+# One exercise's sets in date order; parallel arrays of equal length
+SetHistory = namedtuple("SetHistory", ["dates", "weights", "reps"])
+
+def _empty_history():
+    empty = np.array([], dtype=np.int64)
+    return SetHistory(empty.astype("datetime64[s]"), empty, empty)
+
+class ExerciseHistory:
+    """Immutable per-exercise set history for a list of workouts."""
+    def __init__(self, workouts):
+        columns = {}
+        # Epoch seconds per distinct timestamp; a workout's sets share one date
+        seconds = {}
+        for w in workouts:
+            for e in w.exercises:
+                dates, weights, reps = columns.setdefault(e.name, ([], [], []))
+                for s in e.exercise_sets:
+                    when = seconds.get(s.date)
+                    if when is None:
+                        when = seconds[s.date] = int((s.date - EPOCH).total_seconds())
+                    dates.append(when)
+                    weights.append(s.weight)
+                    reps.append(s.reps)
+
+        self._histories = {}
+        for name, (dates, weights, reps) in columns.items():
+            dates = np.array(dates, dtype=np.int64).astype("datetime64[s]")
+            order = np.argsort(dates, kind="stable")
+            self._histories[name] = SetHistory(
+                dates[order],
+                np.array(weights, dtype=np.int64)[order],
+                np.array(reps, dtype=np.int64)[order],
+            )
+
+    def __len__(self):
+        return len(self._histories)
+
+    def __contains__(self, name):
+        return name in self._histories
+
+    def names(self):
+        """Exercise names, most performed (by sets) first."""
+        return sorted(self._histories, key=lambda n: (-len(self._histories[n].dates), n))
+
+    def sets(self, name):
+        """SetHistory of every set of name ever, in date order (empty arrays if unknown)."""
+        return self._histories.get(name) or _empty_history()
+
+    def last_performed(self, name):
+        """Datetime of the most recent set of name, or None if it was never performed."""
+        dates = self.sets(name).dates
+        return dates[-1].astype(object) if len(dates) else None
+
+    def between(self, name, start, end):
+        """SetHistory of name's sets dated start..end (dates inclusive)."""
+        history = self.sets(name)
+        lo = np.searchsorted(history.dates, np.datetime64(start, "s"), side="left")
+        day_after = np.datetime64(end, "D") + np.timedelta64(1, "D")
+        hi = np.searchsorted(history.dates, day_after, side="left")
+        return SetHistory(history.dates[lo:hi], history.weights[lo:hi], history.reps[lo:hi])
+
+    def sessions(self, name, start=None, end=None):
+        """
+        One row per session (set timestamp) of name, indexed by date, with the top
+        weight, total volume (weight x reps), set count and total reps.
+        """
+        history = self.sets(name) if start is None else self.between(name, start, end)
+        frame = pd.DataFrame({
+            "date": history.dates.astype("datetime64[us]"),
+            "top_weight": history.weights,
+            "volume": history.weights * history.reps,
+            "reps": history.reps,
+        })
+        return frame.groupby("date").agg(
+            top_weight=("top_weight", "max"),
+            volume=("volume", "sum"),
+            sets=("reps", "size"),
+            reps=("reps", "sum"),
+        )
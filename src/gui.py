@@ -1,121 +1,377 @@
 import streamlit as st
 import sys
-import pandas as pd
-import altair as alt
-from parse_raw_data import parse_csv
-from datetime import date
-import tempfile
+# Only stdlib-backed modules are imported up front. pandas, numpy, altair and pyarrow
+# come in through function-level imports the first time a page or load needs them.
+from workout_collection import WorkoutCollection
+from store import STORE_FILE, WorkoutStore
+from view_cache import ViewCache
+from instrumentation import Recorder, stage, timed, use_recorder
+from metrics import home_metrics
+from datetime import datetime, timedelta
 import os
+import time
 
+# Multi-athlete SQLite store; the Team page is shown when it exists
+STORE_PATH = os.environ.get("STRONG_STORE", STORE_FILE)
+ALL_ATHLETES = "All athletes"
+# Seconds between reruns while a background load is in progress
+LOAD_POLL_SECONDS = 0.5
+# A running load's partial workouts are republished only once this many times as
+# many rows have been read, since each publish rebuilds every per-dataset view
+PUBLISH_GROWTH = 2
+# Default window read from a partitioned dataset: the last year of data
+DATASET_WINDOW_DAYS = 365
+# Bound on memoized page aggregations kept in session state (see cached_view)
+VIEW_CACHE_ENTRIES = 64
+# Widget key of the date range shared by the Home and Graphs pages
+DATE_RANGE_KEY = "date_range"
+# PR timeline choices on the Graphs page -> PersonalRecords record type
+RECORD_LABELS = {
+    "Estimated 1RM": "e1rm",
+    "Heaviest weight": "weight",
+    "Best set volume": "volume",
+    "Most reps at a weight": "reps",
+}
+# Training-load choices on the Graphs page -> TrainingLoad metric
+LOAD_LABELS = {
+    "Tonnage (weight x reps)": "tonnage",
+    "Volume (sets)": "volume",
+}
+
+@timed("load_workouts", count=len)
 def load_workouts():
-    """Load workouts from CSV. Path can be overridden by a command-line argument."""
+    """
+    Load workouts from CSV. Path can be overridden by a command-line argument.
+    A file already in the on-disk parse cache is loaded right away, as a lazy
+    CachedWorkouts; otherwise it is parsed in the background (see
+    start_background_load) and [] is returned.
+    A dataset directory from sets_dataset is opened instead, and its workouts
+    are read per date window by show_dataset_window.
+    """
     data_path = ""
     if len(sys.argv) > 1:
         data_path = sys.argv[1]
-    
+
+    if os.path.isdir(data_path):
+        from sets_dataset import SetsDataset, is_dataset
+        if is_dataset(data_path):
+            st.session_state["sets_dataset"] = SetsDataset(data_path)
+        return []
+
     # Check if file exists before parsing
     if not os.path.isfile(data_path):
         # Return an empty list if no valid file is found
         return []
 
     try:
-        return parse_csv(data_path)
+        from parse_cache import cache_path, load_cached
+        # Hash the CSV once, for both the cache lookup and the background load's cache write
+        entry = cache_path(data_path)
+        cached = load_cached(entry, data_path)
+        if cached is not None:
+            return cached
+        start_background_load(data_path, data_path, cache_entry=entry)
+        return []
     except Exception:
         # If there's a parsing error, return an empty list
         return []
 
+def show_dataset_window(dataset):
+    """
+    Sidebar date window for a partitioned dataset. Only the sets inside the window
+    are read (from the year partitions it overlaps) and become the loaded workouts.
+    """
+    if not len(dataset):
+        # A dataset exported from a header-only CSV has no dates to pick from
+        st.sidebar.info("The opened dataset has no sets.")
+        st.session_state["workouts"] = []
+        return
+    from columnar import workouts_from_frame
+    default_start = max(dataset.min_date, dataset.max_date - timedelta(days=DATASET_WINDOW_DAYS))
+    window = st.sidebar.date_input("Dataset window", [default_start, dataset.max_date],
+                                   min_value=dataset.min_date, max_value=dataset.max_date)
+    if len(window) != 2:
+        window = [default_start, dataset.max_date]
+    loaded_key = (dataset.path, tuple(window))
+    if st.session_state.get("dataset_window") != loaded_key:
+        st.session_state["workouts"] = workouts_from_frame(dataset.frame(*window))
+        st.session_state["dataset_window"] = loaded_key
+    st.sidebar.caption(f"{len(st.session_state['workouts']):,} workouts read from "
+                       f"{len(dataset.files_for(*window))} year partition(s).")
+
+def start_background_load(source, label, cache_entry=None):
+    """Start parsing source on a worker thread, cancelling any load still running."""
+    from background import BackgroundLoad
+    st.session_state.pop("sets_dataset", None)
+    previous = st.session_state.get("background_load")
+    if previous is not None and previous.running:
+        previous.cancel()
+    st.session_state["background_load"] = BackgroundLoad(source, label, cache_entry=cache_entry).start()
+    st.session_state["background_version"] = 0
+    st.session_state["background_rows"] = 0
+
+def poll_background_load():
+    """
+    Publish a background load's partial workouts into session state and show its
+    progress in the sidebar. Returns True while the load is still running.
+    Partial results are published at geometrically growing row counts
+    (PUBLISH_GROWTH), so rebuilding the pages' views stays linear in the export.
+    """
+    load = st.session_state.get("background_load")
+    if load is None:
+        return False
+    rows_read = load.rows_read
+    grown = rows_read >= PUBLISH_GROWTH * st.session_state.get("background_rows", 0)
+    if load.version != st.session_state.get("background_version") and (grown or not load.running):
+        st.session_state["workouts"] = load.workouts()
+        st.session_state["background_version"] = load.version
+        st.session_state["background_rows"] = rows_read
+
+    if load.running:
+        st.sidebar.progress(load.progress, text=f"Loading {load.label}: {load.rows_read:,} rows read")
+        if st.sidebar.button("Cancel load"):
+            load.cancel()
+        return True
+
+    count = len(st.session_state["workouts"])
+    if load.status == "done":
+        st.sidebar.success(f"Loaded {count} workouts from {load.label}.")
+    elif load.status == "cancelled":
+        st.sidebar.info(f"Load cancelled; kept the {count} workouts read so far.")
+    else:
+        st.sidebar.error(f"An error occurred: {load.error}")
+    del st.session_state["background_load"]
+    return False
+
+def dataset_view(workouts, name, build):
+    """
+    Return a structure derived from the loaded workouts (e.g. the WorkoutCollection),
+    built once per dataset and kept in session state across reruns. Each newly
+    loaded dataset gets the next generation number, its identity for cached_view.
+    """
+    views = st.session_state.get("dataset_views")
+    if views is None or views["workouts"] is not workouts:
+        generation = views["generation"] + 1 if views is not None else 0
+        views = {"workouts": workouts, "generation": generation}
+        st.session_state["dataset_views"] = views
+    if name not in views:
+        views[name] = build(workouts)
+    return views[name]
+
+def build_collection(workouts):
+    """
+    WorkoutCollection of the loaded workouts. A parse-cache hit (CachedWorkouts)
+    builds it from its per-workout summary, so Home needs no Workout objects.
+    """
+    if hasattr(workouts, "collection"):
+        return workouts.collection()
+    return WorkoutCollection(workouts)
+
+def cached_view(workouts, page, date_range, view, build):
+    """
+    Memoize a page aggregation across reruns, keyed by (dataset generation, date
+    range, page, view). view names the aggregation plus any other widget values
+    build depends on. Entries live in a bounded LRU ViewCache in session state.
+    """
+    cache = st.session_state.get("view_cache")
+    if cache is None:
+        cache = st.session_state["view_cache"] = ViewCache(VIEW_CACHE_ENTRIES)
+    # Every load is a new generation, even of the same export: re-parsing after a
+    # mapping edit changes body parts without changing any totals
+    dataset_view(workouts, "collection", build_collection)
+    generation = st.session_state["dataset_views"]["generation"]
+    return cache.get((generation, tuple(date_range), page, view), build)
+
+def cached_chart(workouts, page, date_range, view, build):
+    """
+    Draw the altair chart from build(), memoized like cached_view as its Vega-Lite
+    spec, so a hit also skips building and validating the chart.
+    """
+    from charts import chart_spec
+    spec = cached_view(workouts, page, date_range, ("chart", view), lambda: chart_spec(build()))
+    st.vega_lite_chart(spec=spec, use_container_width=True)
+
+def shared_date_range(min_date, max_date):
+    """
+    Date range picker shared by the Home and Graphs pages: one keyed widget, so the
+    range carries over when switching between them. Reset clears it back to the
+    whole dataset before the next rerun draws it.
+    """
+    date_range = st.date_input("Select a date range", [min_date, max_date], key=DATE_RANGE_KEY)
+    st.button("Reset date range", on_click=lambda: st.session_state.pop(DATE_RANGE_KEY, None))
+    if len(date_range) != 2:
+        date_range = [min_date, max_date]
+    return date_range
+
+@timed("filter_workouts", count=len)
 def filter_workouts(workouts, date_range):
-    """Filter workouts by the given date range."""
+    """Filter workouts by the given date range. A WorkoutCollection is sliced with bisect."""
     if len(date_range) == 2:
         start, end = date_range
+        if isinstance(workouts, WorkoutCollection):
+            return workouts.between(start, end)
         return [w for w in workouts if start <= w.date.date() <= end]
     return workouts
 
 def show_home_page(workouts, min_date, max_date):
     """Display the Home view with summary metrics."""
     st.title("Workout Data Analysis (Home)")
-    date_range = st.date_input("Select a date range", [min_date, max_date])
-    if st.button("Reset date range"):
-        date_range = [min_date, max_date]
+    date_range = shared_date_range(min_date, max_date)
 
-    filtered = filter_workouts(workouts, date_range)
+    # All six metrics come from the collection's prefix sums
+    collection = dataset_view(workouts, "collection", build_collection)
+    totals = cached_view(workouts, "Home", date_range, "totals", lambda: collection.totals(*date_range))
 
     # Populate metrics
-    st.metric("Number of total workouts", f"{len(filtered):,}")
-    st.metric("Total duration exercised (mins)", f"{sum(w.duration for w in filtered):,}")
-    st.metric("Total weight lifted (lbs)", f"{sum(w.total_weight_lifted for w in filtered):,}")
-    st.metric("Total reps performed", f"{sum(w.total_reps_performed for w in filtered):,}")
-    st.metric("Total number of exercises", f"{sum(w.number_of_exercises for w in filtered):,}")
-    st.metric("Total number of exercise sets", f"{sum(w.number_of_exercise_sets for w in filtered):,}")
+    for label, value in home_metrics(totals).items():
+        st.metric(label, value)
 
 def show_graphs_page(workouts, min_date, max_date):
     """Display the Graphs view with line chart and stacked bar chart."""
+    from charts import body_part_chart, line_chart, pr_timeline_chart, training_load_chart
+    from downsample import cap_periods, downsample_series, thin_events
+    from exercise_history import ExerciseHistory
+    from records import PersonalRecords
+    from rollups import Rollups
+    from training_load import TrainingLoad
     st.title("Workout Data Analysis (Graphs)")
-    date_range = st.date_input("Select a date range", [min_date, max_date])
-    if st.button("Reset date range"):
+    date_range = shared_date_range(min_date, max_date)
+    # Charts are sliced from rollups built once per dataset, not from the raw sets,
+    # and each chart's data is memoized per date range and widget choice
+    rollups = dataset_view(workouts, "rollups", Rollups)
+
+    # Line chart for total weight lifted over time, downsampled for long ranges
+    df_line = cached_view(workouts, "Graphs", date_range, "daily_totals",
+                          lambda: rollups.daily_totals(*date_range))
+    if not df_line.empty:
+        line, points_saved = cached_view(workouts, "Graphs", date_range, "weight_line",
+                                         lambda: downsample_series(df_line["total_weight_lifted"]))
+        st.subheader("Total Weight Lifted Over Time")
+        cached_chart(workouts, "Graphs", date_range, "weight_line",
+                     lambda: line_chart(line, "Total weight lifted"))
+        if points_saved:
+            st.caption(f"Showing {len(line):,} of {len(df_line):,} days ({points_saved:,} points saved).")
+    else:
+        st.write("No data in selected date range.")
+
+    # Stacked bar chart: number of exercise sets by body part per period.
+    # Too many bars for the range rolls up to the next coarser period.
+    requested = st.selectbox("Group sets by", ["Week", "Month", "Year"])
+    df_bar, period, segments_saved = cached_view(
+        workouts, "Graphs", date_range, ("body_part_sets", requested),
+        lambda: cap_periods(lambda g: rollups.body_part_sets(*date_range, granularity=g), requested.lower()))
+    granularity = period.capitalize()
+    if period != requested.lower():
+        st.caption(f"Rolled up to {period}s to keep the chart readable ({segments_saved:,} bar segments saved).")
+
+    if not df_bar.empty:
+        st.subheader(f"Exercise Sets by Body Part per {granularity}")
+        cached_chart(workouts, "Graphs", date_range, ("body_part_sets", requested),
+                     lambda: body_part_chart(df_bar, granularity))
+    else:
+        st.write("No body-part data in selected range.")
+
+    # Rolling training load, computed once per dataset over every calendar day
+    load = dataset_view(workouts, "training_load", TrainingLoad)
+    if load.body_parts:
+        load_label = st.selectbox("Training load", list(LOAD_LABELS))
+        body_part = st.selectbox("Training load body part", load.body_parts)
+        series = cached_view(workouts, "Graphs", date_range, ("training_load", load_label, body_part),
+                             lambda: load.series(LOAD_LABELS[load_label], body_part, *date_range))
+        if series["acwr"].notna().any():
+            st.subheader(f"Training Load: {load_label}, {body_part}")
+            view = ("training_load", load_label, body_part)
+            cached_chart(workouts, "Graphs", date_range, (*view, "lines"), lambda: line_chart(
+                series[["acute", "chronic"]].rename(
+                    columns={"acute": "Last 7 days", "chronic": "Weekly average, last 28 days"}),
+                load_label))
+            cached_chart(workouts, "Graphs", date_range, (*view, "acwr"), lambda: training_load_chart(series))
+            monotony = series["monotony"].dropna()
+            if not monotony.empty:
+                st.caption(f"Monotony over the last week of the range: {monotony.iloc[-1]:.2f} "
+                           "(mean / standard deviation of daily load; above 2 means little variation).")
+        else:
+            st.write("Training load needs at least 28 days of data in the selected range.")
+
+    # PR timeline from running bests computed once per dataset
+    records = dataset_view(workouts, "records",
+                           lambda w: PersonalRecords(dataset_view(w, "history", ExerciseHistory)))
+    record_label = st.selectbox("Personal record", list(RECORD_LABELS))
+    events, points_saved = cached_view(
+        workouts, "Graphs", date_range, ("records", record_label),
+        lambda: thin_events(records.between(*date_range, record=RECORD_LABELS[record_label])))
+    if not events.empty:
+        st.subheader(f"Personal Records: {record_label}")
+        cached_chart(workouts, "Graphs", date_range, ("records", record_label),
+                     lambda: pr_timeline_chart(events, record_label))
+        if points_saved:
+            st.caption(f"Showing the last record per exercise and period ({points_saved:,} points saved).")
+    else:
+        st.write("No personal records in selected range.")
+
+def show_progress_page(workouts, min_date, max_date):
+    """Display one exercise's history: last performed, top weight and volume per session."""
+    from downsample import downsample_series
+    from exercise_history import ExerciseHistory
+    st.title("Workout Data Analysis (Progress)")
+    history = dataset_view(workouts, "history", ExerciseHistory)
+    if len(history) == 0:
+        st.write("No exercises recorded yet.")
+        return
+    name = st.selectbox("Exercise", history.names())
+    date_range = st.date_input("Select a date range", [min_date, max_date], key="progress_date_range")
+    if len(date_range) != 2:
         date_range = [min_date, max_date]
 
-    filtered = filter_workouts(workouts, date_range)
+    last = history.last_performed(name)
+    st.metric("Last performed", last.strftime("%Y-%m-%d") if last else "Never")
+    st.metric("Total sets ever", f"{len(history.sets(name).dates):,}")
+
+    sessions = history.sessions(name, *date_range)
+    if sessions.empty:
+        st.write("No sets of this exercise in selected date range.")
+        return
+    top, _ = downsample_series(sessions["top_weight"])
+    st.subheader(f"Top Weight per Session: {name}")
+    st.line_chart(top)
+    volume, _ = downsample_series(sessions["volume"])
+    st.subheader(f"Volume (weight x reps) per Session: {name}")
+    st.line_chart(volume)
 
-    # Line chart for total weight lifted over time
-    weights_by_day = {}
-    for w in filtered:
-        d = w.date.date()
-        weights_by_day[d] = weights_by_day.get(d, 0) + w.total_weight_lifted
+def show_team_page(store):
+    """Display metrics and charts for one or all athletes, queried from the SQLite store."""
+    import pandas as pd
+    from charts import body_part_chart
+    st.title("Workout Data Analysis (Team)")
+    choice = st.selectbox("Athlete", [ALL_ATHLETES, *store.athletes()])
+    athlete = None if choice == ALL_ATHLETES else choice
+    min_date, max_date = store.date_bounds(athlete)
+    if min_date is None:
+        st.write("No workouts stored yet.")
+        return
 
-    if weights_by_day:
-        df_line = pd.DataFrame({
-            "date": list(weights_by_day.keys()),
-            "total_weight_lifted": list(weights_by_day.values())
-        }).sort_values("date")
-        df_line.set_index("date", inplace=True)
+    date_range = st.date_input("Select a date range", [min_date, max_date], key="team_date_range")
+    if len(date_range) != 2:
+        date_range = [min_date, max_date]
+
+    totals = store.metrics(*date_range, athlete=athlete)
+    st.metric("Number of total workouts", f"{totals['workouts']:,}")
+    st.metric("Total weight lifted (lbs)", f"{totals['total_weight_lifted']:,}")
+    st.metric("Total number of exercise sets", f"{totals['number_of_exercise_sets']:,}")
 
+    daily = store.daily_weight(*date_range, athlete=athlete)
+    if daily:
+        df_line = pd.DataFrame(daily, columns=["date", "total_weight_lifted"]).set_index("date")
         st.subheader("Total Weight Lifted Over Time")
         st.line_chart(df_line["total_weight_lifted"])
-    else:
-        st.write("No data in selected date range.")
 
-    # Stacked bar chart: number of exercise sets by body part per week
-    weekly_bodypart_counts = {}
-    for w in filtered:
-        iso_year, iso_week, _ = w.date.isocalendar()
-        week_key = f"{iso_year}-W{iso_week}"
-        if week_key not in weekly_bodypart_counts:
-            weekly_bodypart_counts[week_key] = {}
-
-        # For each exercise, add the number of sets
-        for e in w.exercises:
-            bp = e.body_part.value  # e.body_part is an enum from parse_raw_data.py
-            set_count = len(e.exercise_sets)
-            weekly_bodypart_counts[week_key][bp] = (
-                weekly_bodypart_counts[week_key].get(bp, 0) + set_count
-            )
-
-    if weekly_bodypart_counts:
-        chart_data = []
-        for week_key, bodyparts_dict in weekly_bodypart_counts.items():
-            for bp, sets_total in bodyparts_dict.items():
-                chart_data.append({
-                    "week": week_key,
-                    "body_part": bp,
-                    "sets_count": sets_total
-                })
-
-        df_bar = pd.DataFrame(chart_data)
-        chart = (
-            alt.Chart(df_bar)
-            .mark_bar()
-            .encode(
-                x=alt.X("week:N", title="Week"),
-                y=alt.Y("sum(sets_count):Q", title="Number of Exercise Sets"),
-                color=alt.Color("body_part:N", title="Body Part", scale=alt.Scale(scheme='category20'))
-            )
-            .properties(width=600)
-        )
+    df_bar = pd.DataFrame(
+        store.weekly_body_part_sets(*date_range, athlete=athlete),
+        columns=["period", "body_part", "sets_count"],
+    )
+    if not df_bar.empty:
         st.subheader("Exercise Sets by Body Part per Week")
-        st.altair_chart(chart, use_container_width=True)
-    else:
-        st.write("No body-part data in selected range.")
+        st.altair_chart(body_part_chart(df_bar, "Week"), use_container_width=True)
 
 def show_upload_page():
     """
@@ -126,77 +382,127 @@ def show_upload_page():
     st.write("Please provide a CSV file. You can write a path or drag & drop it below.")
 
     # Text input for a local file path
-    file_path = st.text_input("Local CSV file path (optional)")
+    file_path = st.text_input("Local CSV file or dataset directory path (optional)")
 
     # Drag & drop
     uploaded_file = st.file_uploader("Drag & drop a CSV file", type=["csv"])
 
-    # Button to trigger loading
+    # Button to trigger loading; uncached files are parsed in the background
     if st.button("Load Data"):
         if file_path.strip():
-            with st.spinner("Loading data from local path..."):
-                try:
-                    new_workouts = parse_csv(file_path.strip())
-                    st.success(f"Loaded {len(new_workouts)} workouts from {file_path.strip()}.")
-                    st.session_state["workouts"] = new_workouts
-                except Exception as e:
-                    st.error(f"An error occurred: {e}")
+            path = file_path.strip()
+            try:
+                from parse_cache import cache_path, load_cached
+                from sets_dataset import SetsDataset, is_dataset
+                if is_dataset(path):
+                    st.session_state["sets_dataset"] = SetsDataset(path)
+                    st.session_state.pop("dataset_window", None)
+                    st.success(f"Opened dataset {path}; pick a window in the sidebar.")
+                else:
+                    entry = cache_path(path)
+                    cached = load_cached(entry, path)
+                    if cached is not None:
+                        st.session_state.pop("sets_dataset", None)
+                        st.success(f"Loaded {len(cached)} workouts from {path}.")
+                        st.session_state["workouts"] = cached
+                    else:
+                        start_background_load(path, path, cache_entry=entry)
+                        st.info(f"Loading {path} in the background; progress is shown in the sidebar.")
+            except Exception as e:
+                st.error(f"An error occurred: {e}")
         elif uploaded_file is not None:
-            with st.spinner("Parsing uploaded data..."):
-                # Write to a temporary file, then parse
-                temp = tempfile.NamedTemporaryFile(delete=False, suffix=".csv")
-                temp.write(uploaded_file.read())
-                temp.close()
-                try:
-                    new_workouts = parse_csv(temp.name)
-                    os.remove(temp.name)
-                    st.success(f"Loaded {len(new_workouts)} workouts from uploaded file.")
-                    st.session_state["workouts"] = new_workouts
-                except Exception as e:
-                    st.error(f"An error occurred: {e}")
+            # UploadedFile is an in-memory bytes buffer, parsed directly by the worker
+            start_background_load(uploaded_file, "uploaded file")
+            st.info("Parsing the uploaded file in the background; progress is shown in the sidebar.")
         else:
             st.info("No file or path provided. Please try again.")
 
+def session_recorder():
+    """
+    This session's timing Recorder, kept in session state so concurrent sessions
+    don't share or mix their reruns, and made active for the calling thread.
+    """
+    recorder = st.session_state.get("timing_recorder")
+    if recorder is None:
+        recorder = st.session_state["timing_recorder"] = Recorder()
+    use_recorder(recorder)
+    return recorder
+
+def show_diagnostics_panel():
+    """Sidebar table of per-stage timings for the last reruns, when toggled on."""
+    if not st.sidebar.checkbox("Show diagnostics"):
+        # Closing the panel also ends this session's memory tracing
+        session_recorder().set_trace_memory(False)
+        return
+    cache = st.session_state.get("view_cache")
+    if cache is not None:
+        stats = cache.stats()
+        st.sidebar.caption(f"View cache: {stats['hits']:,} hits, {stats['misses']:,} misses, "
+                           f"{stats['entries']}/{stats['max_entries']} entries "
+                           f"({stats['evictions']:,} evicted).")
+    recorder = session_recorder()
+    recorder.set_trace_memory(st.sidebar.checkbox("Trace Python memory (slower)"))
+    rows = recorder.stage_rows()
+    if rows:
+        import pandas as pd
+        st.sidebar.dataframe(pd.DataFrame(rows), hide_index=True)
+    else:
+        st.sidebar.write("No timings recorded yet.")
+
 def main():
     """Main entry point - use session state for storing workouts, route pages accordingly."""
+    session_recorder().start_run(datetime.now().strftime("%H:%M:%S"))
     # Initialize session state for workouts if not present
     if "workouts" not in st.session_state:
         initial_workouts = load_workouts()
         st.session_state["workouts"] = initial_workouts
 
+    loading = poll_background_load()
+    if st.session_state.get("sets_dataset") is not None:
+        show_dataset_window(st.session_state["sets_dataset"])
     workouts = st.session_state["workouts"]
 
     # If no workouts found, default to "Upload Data" page
     if not workouts:
-        page_options = ["Upload Data", "Home", "Graphs"]
+        page_options = ["Upload Data", "Home", "Graphs", "Progress"]
         default_index = 0
     else:
-        page_options = ["Home", "Graphs", "Upload Data"]
+        page_options = ["Home", "Graphs", "Progress", "Upload Data"]
         default_index = 0
 
+    has_store = os.path.isfile(STORE_PATH)
+    if has_store:
+        page_options.append("Team")
+
     page = st.sidebar.selectbox("Navigation", page_options, index=default_index)
 
-    # Determine date range
-    if workouts:
-        dates = [w.date for w in workouts]
-        min_date = min(dates).date()
-        max_date = max(dates).date()
-    else:
-        # Dummy date range for when no workouts found
-        min_date, max_date = date.today(), date.today()
+    with stage(f"page:{page}", rows=len(workouts)):
+        if page in ("Home", "Graphs", "Progress"):
+            if workouts:
+                # The collection is built once per dataset (from the cache summary on a hit);
+                # only the shown page builds its own views
+                collection = dataset_view(workouts, "collection", build_collection)
+                min_date, max_date = collection.min_date, collection.max_date
+                if page == "Home":
+                    show_home_page(workouts, min_date, max_date)
+                elif page == "Graphs":
+                    show_graphs_page(workouts, min_date, max_date)
+                else:
+                    show_progress_page(workouts, min_date, max_date)
+            else:
+                st.write("No data available. Please upload some data first.")
+        elif page == "Upload Data":
+            show_upload_page()
+        elif page == "Team" and has_store:
+            with WorkoutStore(STORE_PATH) as store:
+                show_team_page(store)
 
-    if page == "Home":
-        if workouts:
-            show_home_page(workouts, min_date, max_date)
-        else:
-            st.write("No data available. Please upload some data first.")
-    elif page == "Graphs":
-        if workouts:
-            show_graphs_page(workouts, min_date, max_date)
-        else:
-            st.write("No data available. Please upload some data first.")
-    elif page == "Upload Data":
-        show_upload_page()
+    show_diagnostics_panel()
+
+    if loading:
+        # Rerun to pick up the next batch; widget interaction interrupts the wait
+        time.sleep(LOAD_POLL_SECONDS)
+        st.rerun()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
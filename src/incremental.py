@@ -0,0 +1,108 @@
+"""
+Incremental re-ingest of cumulative Strong exports.
+
+Every export repeats the full history and appends the newest workouts, so after
+the first parse we remember how many bytes were consumed and a SHA-256 of all of
+them. When the next export starts with exactly those bytes only the new tail is
+parsed and merged into the stored workouts. If anything before the offset
+changed (history edited, deleted or reordered, even without changing its
+length), every workout is rebuilt from the whole file, and a (Date, Workout
+Name) high-water mark tells which of them are new since the last ingest.
+"""
+import csv
+import hashlib
+import io
+import os
+import pickle
+
+from parse_raw_data import load_mappings, merge_workouts, parse_rows
+
+CHUNK_BYTES = 1024 * 1024
+
+def _prefix_digest(f, offset):
+    """SHA-256 object over the first offset bytes of f, read in chunks; f is left at offset."""
+    digest = hashlib.sha256()
+    f.seek(0)
+    remaining = offset
+    while remaining:
+        chunk = f.read(min(CHUNK_BYTES, remaining))
+        if not chunk:
+            break
+        digest.update(chunk)
+        remaining -= len(chunk)
+    return digest
+
+class IncrementalIngest:
+    """Parsed workouts for one athlete's cumulative export, plus where the last ingest stopped."""
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget everything ingested so far."""
+        # (Date, Workout Name) -> Workout, same keys as parse_raw_data.parse_rows
+        self.workouts = {}
+        self.header = None
+        self.offset = 0
+        self.fingerprint = None
+        self.high_water = None
+
+    def ingest(self, file_path):
+        """
+        Bring self.workouts up to date with the export at file_path.
+        Returns the workouts that were added or gained sets.
+        """
+        with open(file_path, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(0)
+            header = next(csv.reader(io.StringIO(f.readline().decode("utf-8"))), None)
+            if header != self.header:
+                # A different export layout is not the same history, start over
+                self.reset()
+                self.header = header
+
+            digest = _prefix_digest(f, self.offset) if self.offset and size >= self.offset else None
+            if digest is not None and digest.hexdigest() == self.fingerprint:
+                # Same history as last time: only the appended tail is new
+                tail = f.read()
+                digest.update(tail)
+                rows = csv.DictReader(io.StringIO(tail.decode("utf-8")), fieldnames=self.header)
+                new_workouts = parse_rows(rows, load_mappings())
+                merge_workouts(self.workouts, new_workouts)
+                changed = list(new_workouts)
+            else:
+                # History edited, deleted or reordered: rebuild from the whole file,
+                # and report as new only the workouts past the old high-water mark
+                high_water = self.high_water
+                self.reset()
+                self.header = header
+                f.seek(0)
+                data = f.read()
+                digest = hashlib.sha256(data)
+                self.workouts = parse_rows(csv.DictReader(io.StringIO(data.decode("utf-8"))), load_mappings())
+                changed = [key for key in self.workouts if high_water is None or key > high_water]
+
+            self.offset = size
+            self.fingerprint = digest.hexdigest()
+
+        if changed:
+            newest = max(changed)
+            if self.high_water is None or newest > self.high_water:
+                self.high_water = newest
+        return [self.workouts[key] for key in changed]
+
+    def workouts_list(self):
+        """All ingested workouts, in the order they were first seen."""
+        return list(self.workouts.values())
+
+    def save(self, path):
+        """Persist the ingested workouts and ingest position for the next refresh."""
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path):
+        """Load a previously saved IncrementalIngest, or a fresh one if path does not exist."""
+        if not os.path.isfile(path):
+            return IncrementalIngest()
+        with open(path, "rb") as f:
+            return pickle.load(f)
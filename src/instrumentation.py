@@ -0,0 +1,165 @@
+"""
+Lightweight per-stage timing for the parser and the dashboard.
+
+Wrap a block in `with stage("name"):` or decorate a function with `@timed("name")`
+to record its wall time, a row count and memory. Records are grouped into runs
+(one per Streamlit rerun, see start_run) and the last MAX_RUNS are kept in
+memory for the GUI's diagnostics panel. Setting STRONG_TIMING_LOG to a file path
+also writes every record there as a JSON line for offline analysis.
+
+The module-level stage / timed record into the recorder made active for the
+calling thread with use_recorder, so each Streamlit session keeps its own
+history; threads that never pick one share DEFAULT_RECORDER.
+
+Memory is read from the process high-water RSS (cheap, Unix only), which never
+goes down: process_peak_rss_mb is that lifetime peak when the stage ended and
+rss_growth_mb is how far the stage pushed it up. With trace_memory enabled,
+tracemalloc also reports the Python allocation peak within each stage; it slows
+the traced code down noticeably, so it is off by default.
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MAX_RUNS = 20
+logger = logging.getLogger("strong.timing")
+
+# tracemalloc is process-wide: it runs while any recorder (one per Streamlit
+# session) wants tracing, and stops once none does. A dropped recorder leaves the set.
+_tracing_recorders = weakref.WeakSet()
+_tracing_lock = threading.Lock()
+
+def _peak_rss_mb():
+    """Process lifetime peak resident set size in MB, or None where unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux and bytes on macOS
+    return round(peak / (1024 * 1024 if os.uname().sysname == "Darwin" else 1024), 1)
+
+class Recorder:
+    """Collects stage records into a bounded history of runs."""
+    def __init__(self, max_runs=MAX_RUNS):
+        self.runs = deque(maxlen=max_runs)
+        self.current = None
+        self.trace_memory = False
+
+    def set_trace_memory(self, enabled):
+        """
+        Turn tracemalloc-based stage peaks on or off for this recorder. Tracing
+        itself stops only when no other recorder still wants it.
+        """
+        with _tracing_lock:
+            if enabled:
+                _tracing_recorders.add(self)
+            else:
+                _tracing_recorders.discard(self)
+                if not _tracing_recorders and tracemalloc.is_tracing():
+                    tracemalloc.stop()
+        self.trace_memory = enabled
+
+    def start_run(self, label):
+        """Begin a new run; later stages are recorded under it."""
+        self.current = {"run": label, "started": time.time(), "stages": []}
+        self.runs.append(self.current)
+        return self.current
+
+    @contextmanager
+    def stage(self, name, rows=None):
+        """
+        Time the enclosed block. Yields the record dict so the block can set
+        record["rows"] once it knows the count.
+        """
+        record = {"stage": name, "rows": rows}
+        tracing = self.trace_memory
+        if tracing:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        rss_before = _peak_rss_mb()
+        t0 = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = round(time.perf_counter() - t0, 6)
+            rss_after = _peak_rss_mb()
+            record["process_peak_rss_mb"] = rss_after
+            record["rss_growth_mb"] = None if rss_after is None else round(rss_after - rss_before, 1)
+            if tracing and tracemalloc.is_tracing():
+                peak = tracemalloc.get_traced_memory()[1]
+                record["peak_traced_mb"] = round(peak / (1024 * 1024), 1)
+            if self.current is None:
+                self.start_run(name)
+            self.current["stages"].append(record)
+            if logger.handlers:
+                logger.info(json.dumps({"run": self.current["run"], **record}))
+
+    def timed(self, name, count=None):
+        """Decorator form of stage(); count(result) supplies the row count."""
+        return _timed(self.stage, name, count)
+
+    def stage_rows(self):
+        """Flat list of every recorded stage, newest run first, for tables and logs."""
+        return [
+            {"run": run["run"], **record}
+            for run in reversed(self.runs)
+            for record in run["stages"]
+        ]
+
+def configure_json_log(path):
+    """Append each stage record to path as one JSON object per line."""
+    handler = logging.FileHandler(path, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+def _timed(stage_fn, name, count):
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage_fn(name) as record:
+                result = fn(*args, **kwargs)
+                if count is not None:
+                    try:
+                        record["rows"] = count(result)
+                    except TypeError:
+                        pass
+                return result
+        return wrapper
+    return decorator
+
+DEFAULT_RECORDER = Recorder()
+_active = ContextVar("strong_timing_recorder", default=DEFAULT_RECORDER)
+
+def use_recorder(recorder):
+    """Make recorder the one stage / timed record into for the calling thread."""
+    _active.set(recorder)
+
+def active_recorder():
+    """The calling thread's recorder (DEFAULT_RECORDER unless use_recorder picked one)."""
+    return _active.get()
+
+def stage(name, rows=None):
+    """Recorder.stage on the calling thread's recorder."""
+    return active_recorder().stage(name, rows)
+
+def timed(name, count=None):
+    """Recorder.timed that records into the calling thread's recorder at call time."""
+    return _timed(stage, name, count)
+
+if os.environ.get("STRONG_TIMING_LOG"):
+    configure_json_log(os.environ["STRONG_TIMING_LOG"])
@@ -0,0 +1,20 @@
+"""
+Summary metrics shared by the GUI's Home page and the headless reports (report.py).
+
+Standard library only, so the GUI can import it up front without pulling in the
+charting and dataframe libraries.
+"""
+
+# Home page metrics: label -> WorkoutCollection.totals key
+HOME_METRICS = {
+    "Number of total workouts": "workouts",
+    "Total duration exercised (mins)": "duration",
+    "Total weight lifted (lbs)": "total_weight_lifted",
+    "Total reps performed": "total_reps_performed",
+    "Total number of exercises": "number_of_exercises",
+    "Total number of exercise sets": "number_of_exercise_sets",
+}
+
+def home_metrics(totals):
+    """The Home page's {label: formatted value} for a WorkoutCollection.totals() dict."""
+    return {label: f"{totals[key]:,}" for label, key in HOME_METRICS.items()}
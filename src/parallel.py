@@ -0,0 +1,131 @@
+"""
+Multi-process parsing of large Strong exports, or of a directory of exports.
+
+A single export is split into byte ranges that start at row boundaries, each range
+is parsed with parse_raw_data.parse_rows in a process pool, and the per-chunk
+results are stitched back together in file order with merge_workouts, so a
+workout whose rows straddle a chunk boundary comes out whole. The result is the
+same list parse_csv returns.
+
+Handing Workout objects back from the workers means pickling them, and unpickling
+in the parent is serial, which caps the speedup of parse_csv_parallel at roughly
+3x. read_sets_frame_parallel returns typed columnar frames instead, which cross
+the process boundary as flat arrays and keep scaling with the number of cores.
+"""
+import csv
+import io
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from columnar import read_sets_frame
+from parse_raw_data import load_mappings, merge_workouts, parse_csv, parse_rows
+
+# A data row starts with "YYYY-MM-DD HH:MM:SS," right after a newline. Matching the
+# timestamp (not just any newline) keeps line breaks inside quoted notes from being
+# taken as row boundaries.
+ROW_START = re.compile(rb"\n(?=\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},)")
+# Files smaller than this are parsed serially; the pool costs more than it saves
+MIN_PARALLEL_BYTES = 8 * 1024 * 1024
+SCAN_BYTES = 64 * 1024
+
+def _next_row_start(f, offset, size):
+    """Byte offset of the first row starting after offset, or size if there is none."""
+    f.seek(offset)
+    # Keep the last few bytes of each window so a boundary can't be split between reads
+    carry = b""
+    position = offset
+    while position < size:
+        window = carry + f.read(SCAN_BYTES)
+        match = ROW_START.search(window)
+        if match:
+            return position - len(carry) + match.start() + 1
+        position += len(window) - len(carry)
+        carry = window[-32:]
+    return size
+
+def chunk_ranges(file_path, num_chunks):
+    """
+    Split the data rows of an export into at most num_chunks (start, end) byte
+    ranges, each beginning at a row boundary. Returns (header_fields, ranges).
+    """
+    with open(file_path, "rb") as f:
+        header = next(csv.reader([f.readline().decode("utf-8")]))
+        data_start = f.tell()
+        size = f.seek(0, os.SEEK_END)
+
+        step = max(1, (size - data_start) // num_chunks)
+        starts = [data_start]
+        for i in range(1, num_chunks):
+            start = _next_row_start(f, data_start + i * step, size)
+            if starts[-1] < start < size:
+                starts.append(start)
+    ranges = list(zip(starts, starts[1:] + [size]))
+    return header, ranges
+
+def _parse_range(file_path, header, start, end, mappings):
+    """Worker: parse the rows in one byte range into a (Date, Workout Name) -> Workout dict."""
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+    return parse_rows(csv.DictReader(io.StringIO(text), fieldnames=header), mappings)
+
+def _read_range_frame(file_path, header_line, start, end, mappings):
+    """Worker: read one byte range into a typed sets frame."""
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        data = header_line + f.read(end - start)
+    return read_sets_frame(io.BytesIO(data), mappings)
+
+def read_sets_frame_parallel(file_path, max_workers=None, num_chunks=None):
+    """Parallel columnar.read_sets_frame: same frame, read in byte-range chunks across a pool."""
+    max_workers = max_workers or os.cpu_count() or 1
+    if num_chunks is None:
+        if os.path.getsize(file_path) < MIN_PARALLEL_BYTES or max_workers == 1:
+            return read_sets_frame(file_path)
+        num_chunks = max_workers * 4
+
+    mappings = load_mappings()
+    _, ranges = chunk_ranges(file_path, num_chunks)
+    with open(file_path, "rb") as f:
+        header_line = f.readline()
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_read_range_frame, file_path, header_line, start, end, mappings)
+            for start, end in ranges
+        ]
+        frames = [future.result() for future in futures]
+    return pd.concat(frames, ignore_index=True)
+
+def parse_csv_parallel(file_path, max_workers=None, num_chunks=None):
+    """
+    Parse one export across a process pool. Returns the same list as parse_csv.
+    num_chunks defaults to four per worker so uneven chunks still balance out.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    if num_chunks is None:
+        if os.path.getsize(file_path) < MIN_PARALLEL_BYTES or max_workers == 1:
+            return parse_csv(file_path)
+        num_chunks = max_workers * 4
+
+    mappings = load_mappings()
+    header, ranges = chunk_ranges(file_path, num_chunks)
+    workouts = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_parse_range, file_path, header, start, end, mappings)
+            for start, end in ranges
+        ]
+        # Stitch in file order so workout, exercise and set order match a serial parse
+        for future in futures:
+            merge_workouts(workouts, future.result())
+    return list(workouts.values())
+
+def parse_directory(dir_path, max_workers=None):
+    """Parse every .csv export in dir_path concurrently. Returns {file name: workouts}."""
+    names = sorted(n for n in os.listdir(dir_path) if n.lower().endswith(".csv"))
+    paths = [os.path.join(dir_path, n) for n in names]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(names, pool.map(parse_csv, paths)))
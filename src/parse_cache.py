@@ -0,0 +1,177 @@
+"""
+Persistent on-disk cache of parsed Strong exports.
+
+Parsed exports are stored as Parquet files of the typed sets frame from
+columnar.read_sets_frame, next to a small per-workout summary
+(columnar.workout_summary). The cache key is the SHA-256 of the CSV content plus
+a hash of exercise_body_part_mapping.json, so editing either one misses the
+cache and reparses. The directory is kept under MAX_CACHE_BYTES by evicting the
+least recently used entries.
+
+A hit (load_cached) reads only the summary, which is enough for the workout
+count, date bounds and Home totals; the sets frame is read and turned into
+Workout objects the first time something iterates the workouts.
+"""
+import hashlib
+import os
+from collections.abc import Sequence
+
+import pandas as pd
+
+import parse_raw_data
+from columnar import read_sets_frame, workout_summary, workouts_from_frame
+from workout_collection import METRICS, WorkoutCollection
+
+dirname = os.path.dirname(__file__)
+# STRONG_CACHE_DIR moves the cache, e.g. for benchmarks that must start cold
+CACHE_DIR = os.environ.get("STRONG_CACHE_DIR", os.path.join(dirname, '../data/cache'))
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+CACHE_SUFFIX = ".parquet"
+SUMMARY_SUFFIX = ".workouts" + CACHE_SUFFIX
+# Bump when the layout of the cached frame changes
+CACHE_FORMAT_VERSION = "1"
+
+def file_digest(path, chunk_size=1024 * 1024):
+    """SHA-256 hex digest of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def mapping_version():
+    """Version of the exercise→body part mapping: a hash of the JSON file, or "none" if missing."""
+    if os.path.isfile(parse_raw_data.MAPPING_FILE):
+        return file_digest(parse_raw_data.MAPPING_FILE)
+    return "none"
+
+def cache_key(file_path):
+    """Cache key for a CSV: content hash + mapping version + cache format."""
+    return f"{file_digest(file_path)}-{mapping_version()[:16]}-v{CACHE_FORMAT_VERSION}"
+
+def evict(cache_dir=None, max_bytes=None):
+    """Delete least recently used cache entries until the directory fits in max_bytes."""
+    cache_dir = cache_dir or CACHE_DIR
+    max_bytes = MAX_CACHE_BYTES if max_bytes is None else max_bytes
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(CACHE_SUFFIX):
+            path = os.path.join(cache_dir, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        os.remove(path)
+        total -= size
+
+def cache_path(file_path, cache_dir=None):
+    """Where the cached frame for file_path's current content would be stored."""
+    return os.path.join(cache_dir or CACHE_DIR, cache_key(file_path) + CACHE_SUFFIX)
+
+def summary_path(path):
+    """Where the per-workout summary of the cache entry at path is stored."""
+    return path[:-len(CACHE_SUFFIX)] + SUMMARY_SUFFIX
+
+def is_cached(file_path, cache_dir=None):
+    """True if a cached frame exists for file_path's current content and mapping."""
+    return os.path.isfile(cache_path(file_path, cache_dir))
+
+def _write_parquet(path, frame):
+    # Write to a temp name first so a crash never leaves a half-written entry
+    temp_path = path + ".tmp"
+    frame.to_parquet(temp_path, index=False)
+    os.replace(temp_path, path)
+
+def store_frame(path, frame, cache_dir=None, max_bytes=None):
+    """Write a sets frame and its workout summary to the cache entry at path, then evict down to max_bytes."""
+    cache_dir = cache_dir or CACHE_DIR
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_parquet(summary_path(path), workout_summary(frame))
+        _write_parquet(path, frame)
+        evict(cache_dir, max_bytes)
+    except OSError:
+        # A read-only or full disk only costs us the cache, not the parse
+        pass
+
+def load_frame(file_path, cache_dir=None, max_bytes=None):
+    """Return the typed sets frame for file_path, from the cache if possible."""
+    path = cache_path(file_path, cache_dir)
+    if os.path.isfile(path):
+        # Touch the entry so eviction treats it as recently used
+        os.utime(path)
+        return pd.read_parquet(path)
+
+    frame = read_sets_frame(file_path)
+    store_frame(path, frame, cache_dir, max_bytes)
+    return frame
+
+class CachedWorkouts(Sequence):
+    """
+    The workouts of a cache hit, as a read-only sequence. The per-workout summary
+    is loaded up front; the Workout objects are built from the cached sets frame
+    (or, if it was evicted since, from source) on first access.
+    """
+    def __init__(self, path, summary, source=None):
+        self.path = path
+        self.summary = summary
+        self.source = source
+        self._workouts = None
+
+    def __len__(self):
+        return len(self.summary)
+
+    def __getitem__(self, index):
+        return self.workouts()[index]
+
+    def __iter__(self):
+        return iter(self.workouts())
+
+    def workouts(self):
+        """The list of Workout objects parse_csv would return, built on the first call."""
+        if self._workouts is None:
+            try:
+                frame = pd.read_parquet(self.path)
+            except OSError:
+                if self.source is None:
+                    raise
+                frame = read_sets_frame(self.source)
+            self._workouts = workouts_from_frame(frame)
+        return self._workouts
+
+    def collection(self):
+        """WorkoutCollection built from the summary, without building any Workout objects."""
+        totals = {m: self.summary[m].tolist() for m in METRICS}
+        return WorkoutCollection.from_summary(self.summary["date"].dt.date.tolist(), totals, self)
+
+def load_cached(path, source=None):
+    """
+    CachedWorkouts for the cache entry at path (from cache_path), or None if it
+    is not cached. An entry without a summary gets one from its sets frame.
+    """
+    if not os.path.isfile(path):
+        return None
+    # Touch the entry so eviction treats it as recently used
+    os.utime(path)
+    summary_file = summary_path(path)
+    if os.path.isfile(summary_file):
+        os.utime(summary_file)
+        summary = pd.read_parquet(summary_file)
+    else:
+        summary = workout_summary(pd.read_parquet(path))
+        try:
+            _write_parquet(summary_file, summary)
+        except OSError:
+            pass
+    return CachedWorkouts(path, summary, source)
+
+def cached_parse_csv(file_path, cache_dir=None, max_bytes=None):
+    """
+    Drop-in for parse_csv(file_path) that goes through the on-disk cache. A hit
+    skips the CSV parse, but the workout objects are still built from the frame;
+    load_cached defers that until the workouts are iterated.
+    """
+    return workouts_from_frame(load_frame(file_path, cache_dir, max_bytes))
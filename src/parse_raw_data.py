@@ -1,14 +1,23 @@
 import csv
+import gc
+import io
 import json
 import os
 import random
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
 from enum import Enum
+from itertools import groupby
+
+from instrumentation import timed
 
 # Path to your JSON mapping file
 dirname = os.path.dirname(__file__)
 MAPPING_FILE = os.path.join(dirname, '../data/exercise_body_part_mapping.json')
 EXIT_FLAG = "__USER_EXIT__"  # A sentinel to detect user exit
+FIELD_CACHE_SIZE = 4096  # Bound on the memoized date / duration strings
 
 class BodyPart(Enum):
     TRAPS = "Traps"
@@ -30,13 +39,64 @@ class BodyPart(Enum):
     CARDIO = "Cardio"
     OTHER = "Other"
 
+# Reverse lookup table, built once: BodyPart value string -> member
+BODY_PARTS_BY_VALUE = {bp.value: bp for bp in BodyPart}
+
 class Workout:
+    """
+    A single workout. Set totals are kept as running sums, so the aggregate
+    properties are O(1) reads; add sets through add_set / Exercise.add_set
+    rather than appending to exercise_sets directly.
+    """
+    __slots__ = ("name", "date", "duration", "notes", "exercises", "_exercises_by_name",
+                 "_number_of_sets", "_total_weight", "_total_reps")
+
     def __init__(self, name, date, duration, notes=""):
         self.name = name
         self.date = date
         self.duration = duration
         self.notes = notes
         self.exercises = []
+        self._exercises_by_name = {}
+        self._number_of_sets = 0
+        self._total_weight = 0
+        self._total_reps = 0
+
+    def get_exercise(self, name):
+        """Return the Exercise with this name in the workout, or None. Dict lookup, not a scan."""
+        if name not in self._exercises_by_name and len(self._exercises_by_name) != len(self.exercises):
+            # exercises was appended to directly, bring the index back in sync
+            self._exercises_by_name = {e.name: e for e in self.exercises}
+        return self._exercises_by_name.get(name)
+
+    def add_exercise(self, exercise):
+        """Append an Exercise, index it by name and fold any sets it already has into the totals."""
+        self.exercises.append(exercise)
+        self._exercises_by_name[exercise.name] = exercise
+        exercise.workout = self
+        for s in exercise.exercise_sets:
+            self.count_set(s)
+        return exercise
+
+    def add_set(self, exercise_name, exercise_set, body_part=None):
+        """Add a set under exercise_name, creating the Exercise if needed. Returns the Exercise."""
+        exercise = self.get_exercise(exercise_name)
+        if exercise is None:
+            exercise = self.add_exercise(Exercise(exercise_name, body_part=body_part))
+        exercise.add_set(exercise_set)
+        return exercise
+
+    def count_set(self, exercise_set):
+        """Update the running totals for a set added to one of this workout's exercises."""
+        self._number_of_sets += 1
+        self._total_weight += exercise_set.weight
+        self._total_reps += exercise_set.reps
+
+    def count_sets(self, exercise_sets):
+        """count_set for a batch of sets."""
+        self._number_of_sets += len(exercise_sets)
+        self._total_weight += sum(s.weight for s in exercise_sets)
+        self._total_reps += sum(s.reps for s in exercise_sets)
 
     @property
     def number_of_exercises(self):
@@ -44,22 +104,52 @@ class Workout:
 
     @property
     def number_of_exercise_sets(self):
-        return sum(len(e.exercise_sets) for e in self.exercises)
+        return self._number_of_sets
 
     @property
     def total_weight_lifted(self):
-        return sum(sum(s.weight for s in e.exercise_sets) for e in self.exercises)
+        return self._total_weight
 
     @property
     def total_reps_performed(self):
-        return sum(sum(s.reps for s in e.exercise_sets) for e in self.exercises)
+        return self._total_reps
 
 class Exercise:
+    __slots__ = ("name", "exercise_sets", "body_part", "workout", "_last_performed")
+
     def __init__(self, name, body_part=None):
         self.name = name
         self.exercise_sets = []
         # Randomly assign an enum value if not provided
         self.body_part = body_part
+        # Set by Workout.add_exercise so new sets also update the workout totals
+        self.workout = None
+        self._last_performed = None
+
+    def add_set(self, exercise_set):
+        """Append a set, keeping last_performed and the owning workout's totals current."""
+        if not isinstance(self.exercise_sets, list):
+            # Compacted into a set_store.SetStore view; appending goes back to a list
+            self.exercise_sets = list(self.exercise_sets)
+        self.exercise_sets.append(exercise_set)
+        if self._last_performed is None or exercise_set.date > self._last_performed:
+            self._last_performed = exercise_set.date
+        if self.workout is not None:
+            self.workout.count_set(exercise_set)
+        return exercise_set
+
+    def add_sets(self, exercise_sets):
+        """add_set for a list of sets, with one totals update for the batch."""
+        if not exercise_sets:
+            return
+        if not isinstance(self.exercise_sets, list):
+            self.exercise_sets = list(self.exercise_sets)
+        self.exercise_sets.extend(exercise_sets)
+        latest = max(s.date for s in exercise_sets)
+        if self._last_performed is None or latest > self._last_performed:
+            self._last_performed = latest
+        if self.workout is not None:
+            self.workout.count_sets(exercise_sets)
 
     @property
     def number_of_times_performed(self):
@@ -67,11 +157,12 @@ class Exercise:
 
     @property
     def last_performed(self):
-        if not self.exercise_sets:
-            return None
-        return max(s.date for s in self.exercise_sets)
+        return self._last_performed
 
 class ExerciseSet:
+    # Millions of these are created, so no per-instance __dict__
+    __slots__ = ("workout", "date", "set_number", "weight", "reps", "notes")
+
     def __init__(self, workout, date, set_number, weight, reps, notes=""):
         self.workout = workout
         self.date = date
@@ -130,79 +221,195 @@ def prompt_for_body_part(exercise_name):
         print("Invalid index. Skipping.")
         return None
 
-def parse_csv(file_path):
-    mappings = load_mappings()
-    workouts = {}
-
-    with open(file_path, mode="r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            date_str = row["Date"]
-            workout_name = row["Workout Name"]
-            duration_str = row["Duration"]
-            exercise_name = row["Exercise Name"]
-            set_order = row["Set Order"]
-            weight = row["Weight"]
-            reps = row["Reps"]
-            notes = row["Notes"] or ""
-            workout_notes = row["Workout Notes"] or ""
-
-            # Parse fields
-            date_parsed = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-            set_number = int(set_order) if set_order else 1
-            weight = int(float(weight)) if weight else 0
-            reps = int(reps) if reps else 0
-            duration = parse_duration(duration_str) if duration_str else 0
-
-            # Get or create the Workout
-            workout_key = (date_str, workout_name)
-            if workout_key not in workouts:
-                workout_obj = Workout(workout_name, date_parsed, duration, workout_notes)
+@contextmanager
+def gc_paused():
+    """
+    Pause the cyclic garbage collector while a parse builds its objects. Every
+    object built is kept, so the collections triggered by the allocation count
+    would repeatedly walk the growing object graph and free nothing.
+
+    gc.disable() applies to the whole process, not just the calling thread, so
+    this is only for one-shot command-line parses. The GUI parses on a worker
+    thread while other sessions keep running and must not use it.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+@contextmanager
+def open_source(source):
+    """
+    Open a CSV source as a text stream. source can be a file path, a text stream,
+    a bytes buffer, or a binary file-like object (e.g. Streamlit's UploadedFile).
+    Streams passed in are left open.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, mode="r", encoding="utf-8", newline="") as f:
+            yield f
+    elif isinstance(source, io.TextIOBase):
+        yield source
+    else:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(source)
+        # Decode incrementally rather than copying the whole buffer into a str
+        text = io.TextIOWrapper(source, encoding="utf-8", newline="")
+        try:
+            yield text
+        finally:
+            # Detach so closing the wrapper doesn't close the caller's stream
+            text.detach()
+
+@lru_cache(maxsize=FIELD_CACHE_SIZE)
+def parse_date(date_str):
+    """Parse an export timestamp, memoized: each workout's rows repeat the same string."""
+    return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+
+# Durations repeat across workouts ("1h 5m"), so the few distinct strings are memoized
+_cached_duration = lru_cache(maxsize=FIELD_CACHE_SIZE)(parse_duration)
+
+def parse_rows(rows, mappings=None, workouts=None):
+    """
+    Parse Strong CSV rows (dicts keyed by the export header) into workouts.
+    Returns a dict of (Date, Workout Name) -> Workout; pass an existing dict as
+    workouts to add the rows to it.
+
+    A workout's rows are contiguous in an export, so the workout-level fields
+    (date, duration, notes) are parsed once at the start of each row group and
+    reused for the rest of it.
+    """
+    if mappings is None:
+        mappings = load_mappings()
+    if workouts is None:
+        workouts = {}
+
+    group_key = None
+    workout_obj = None
+    date_parsed = None
+    # Repeated notes share one string object instead of one copy per set
+    notes_table = {}
+    for row in rows:
+        exercise_name = row["Exercise Name"]
+        set_order = row["Set Order"]
+        weight = row["Weight"]
+        reps = row["Reps"]
+        notes = row["Notes"] or ""
+        notes = notes_table.setdefault(notes, notes)
+
+        # Parse fields
+        set_number = int(set_order) if set_order else 1
+        weight = int(float(weight)) if weight else 0
+        reps = int(reps) if reps else 0
+
+        # Get or create the Workout when a new row group starts
+        workout_key = (row["Date"], row["Workout Name"])
+        if workout_key != group_key:
+            group_key = workout_key
+            date_str, workout_name = workout_key
+            date_parsed = parse_date(date_str)
+            workout_obj = workouts.get(workout_key)
+            if workout_obj is None:
+                duration_str = row["Duration"]
+                duration = _cached_duration(duration_str) if duration_str else 0
+                workout_notes = row["Workout Notes"] or ""
+                workout_obj = Workout(sys.intern(workout_name), date_parsed, duration,
+                                      notes_table.setdefault(workout_notes, workout_notes))
                 workouts[workout_key] = workout_obj
-            else:
-                workout_obj = workouts[workout_key]
 
+        # Check if exercise already exists
+        exercise_obj = workout_obj.get_exercise(exercise_name)
+        if exercise_obj is None:
             # Determine body part from JSON or random
             if exercise_name in mappings:
-                body_part_str = mappings[exercise_name]
                 # Convert string to BodyPart enum if possible
-                try:
-                    # next(...) gets the BodyPart member whose value matches
-                    the_body_part = next(bp for bp in BodyPart if bp.value == body_part_str)
-                except StopIteration:
+                the_body_part = BODY_PARTS_BY_VALUE.get(mappings[exercise_name])
+                if the_body_part is None:
                     the_body_part = random.choice(list(BodyPart))
             else:
                 # Not in JSON, remain None for now
                 the_body_part = None
+            exercise_obj = workout_obj.add_exercise(
+                Exercise(sys.intern(exercise_name), body_part=the_body_part))
+
+        # Create the ExerciseSet (add_set keeps the workout totals current)
+        exercise_set = ExerciseSet(
+            workout=workout_obj.name,
+            date=date_parsed,
+            set_number=set_number,
+            weight=weight,
+            reps=reps,
+            notes=notes,
+        )
+        exercise_obj.add_set(exercise_set)
+
+    return workouts
+
+def merge_workouts(workouts, new_workouts):
+    """
+    Merge a (Date, Workout Name) -> Workout dict into workouts. Workouts with the
+    same key are combined, appending the new sets after the existing ones.
+    """
+    for key, new in new_workouts.items():
+        existing = workouts.get(key)
+        if existing is None:
+            workouts[key] = new
+            continue
+        for exercise in new.exercises:
+            for s in exercise.exercise_sets:
+                existing.add_set(exercise.name, s, body_part=exercise.body_part)
+    return workouts
+
+@timed("parse_csv", count=len)
+def parse_csv(source):
+    """Parse a Strong export (path, text stream or bytes buffer, see open_source) into workouts."""
+    with open_source(source) as f:
+        workouts = parse_rows(csv.DictReader(f))
+    return list(workouts.values())
 
-            # Check if exercise already exists
-            exercise_obj = None
-            for e in workout_obj.exercises:
-                if e.name == exercise_name:
-                    exercise_obj = e
-                    break
-            if exercise_obj is None:
-                exercise_obj = Exercise(exercise_name, body_part=the_body_part)
-                workout_obj.exercises.append(exercise_obj)
-
-            # Create the ExerciseSet
-            exercise_set = ExerciseSet(
-                workout=workout_obj.name,
-                date=date_parsed,
-                set_number=set_number,
-                weight=weight,
-                reps=reps,
-                notes=notes,
-            )
-            exercise_obj.exercise_sets.append(exercise_set)
+def iter_workouts(source):
+    """
+    Yield workouts one at a time, as soon as their contiguous block of rows ends,
+    so only one workout is held in memory. A workout whose rows are split across
+    non-adjacent blocks is yielded once per block.
+    """
+    mappings = load_mappings()
+    with open_source(source) as f:
+        blocks = groupby(csv.DictReader(f), key=lambda row: (row["Date"], row["Workout Name"]))
+        for _, rows in blocks:
+            yield from parse_rows(rows, mappings).values()
 
-    return list(workouts.values())
+def export_cli(argv):
+    """
+    `export STRONG.csv OUT_DIR [--format arrow|parquet]`: write the export, with
+    body parts from the mapping file, as a year-partitioned dataset (see sets_dataset).
+    """
+    import argparse
+    from sets_dataset import FORMATS, export_dataset
+
+    parser = argparse.ArgumentParser(prog="parse_raw_data.py export",
+                                     description="Convert a Strong CSV to a dataset partitioned by year.")
+    parser.add_argument("csv_path")
+    parser.add_argument("out_dir")
+    parser.add_argument("--format", choices=sorted(FORMATS), default="arrow")
+    args = parser.parse_args(argv)
+    metadata = export_dataset(args.csv_path, args.out_dir, args.format, load_mappings())
+    print(f"Wrote {metadata['rows']} sets ({metadata['min_date']} to {metadata['max_date']}) "
+          f"to {args.out_dir} as {args.format}.")
+    return metadata
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["export"]:
+        export_cli(sys.argv[2:])
+        sys.exit(0)
+
     file_path = "/Users/parkerlacy/coding/strong-data/data/raw/strong.csv"
 
-    # Perform initial parsing
-    parsed_workouts = parse_csv(file_path)
+    # Perform initial parsing; nothing else runs in this process meanwhile
+    with gc_paused():
+        parsed_workouts = parse_csv(file_path)
 
     # Gather all unique exercise names that have no known mapping
     # (i.e., assigned a random body part or None).
@@ -215,16 +422,24 @@ if __name__ == "__main__":
     # Load existing mapping from JSON
     mapping_dict = load_mappings()
 
-    # Prompt the user for those exercises
-    for ex_name in exercises_without_mapping:
-        if ex_name not in mapping_dict:
-            chosen_part_str = prompt_for_body_part(ex_name)
-            # If user decides to exit, break out and save what we have so far
-            if chosen_part_str == EXIT_FLAG:
-                print(f"\nExiting, saving {len(parsed_workouts)} partial mappings...")
-                break
-            elif chosen_part_str:
-                mapping_dict[ex_name] = chosen_part_str
+    # Auto-assign names that closely match an already mapped exercise, in one batch
+    from classifier import BodyPartIndex
+    unmapped = sorted(name for name in exercises_without_mapping if name not in mapping_dict)
+    auto_assigned, ambiguous = BodyPartIndex(mapping_dict).classify(unmapped)
+    for ex_name, body_part in auto_assigned.items():
+        print(f"  {ex_name} -> {body_part}")
+    mapping_dict.update(auto_assigned)
+    print(f"\nAuto-assigned {len(auto_assigned)} exercises, {len(ambiguous)} left to choose.")
+
+    # Prompt the user for the ambiguous ones
+    for ex_name in ambiguous:
+        chosen_part_str = prompt_for_body_part(ex_name)
+        # If user decides to exit, break out and save what we have so far
+        if chosen_part_str == EXIT_FLAG:
+            print(f"\nExiting, saving {len(parsed_workouts)} partial mappings...")
+            break
+        elif chosen_part_str:
+            mapping_dict[ex_name] = chosen_part_str
 
     # Save updated mappings
     save_mappings(mapping_dict)
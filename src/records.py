@@ -0,0 +1,155 @@
+"""
+Personal records and estimated one-rep maxes.
+
+Every set of every exercise goes into one frame sorted by exercise and date.
+Running bests (heaviest weight, biggest set volume, best estimated 1RM, and most
+reps at each weight) are grouped cumulative maxima over that frame, so the whole
+PR timeline comes from one vectorized pass. The bests are kept, so appended
+workouts are folded in by seeding the same pass with them instead of starting over.
+"""
+import numpy as np
+import pandas as pd
+
+from exercise_history import ExerciseHistory
+
+# Record type -> columns its running best is grouped by
+RECORD_TYPES = {
+    "weight": ["exercise"],
+    "volume": ["exercise"],
+    "e1rm": ["exercise"],
+    "reps": ["exercise", "weight"],
+}
+TIMELINE_COLUMNS = ["date", "exercise", "record", "value", "weight", "reps"]
+
+def epley(weights, reps):
+    """Epley estimate, weight x (1 + reps / 30). One rep is the weight itself; 0 reps gives 0."""
+    weights = np.asarray(weights, dtype=float)
+    reps = np.asarray(reps, dtype=float)
+    return np.where(reps > 1, weights * (1 + reps / 30), np.where(reps == 1, weights, 0.0))
+
+def brzycki(weights, reps):
+    """Brzycki estimate, weight x 36 / (37 - reps), for 1 to 36 reps (0 otherwise)."""
+    weights = np.asarray(weights, dtype=float)
+    reps = np.asarray(reps, dtype=float)
+    valid = (reps >= 1) & (reps < 37)
+    return np.where(valid, weights * 36 / (37 - np.where(valid, reps, 0)), 0.0)
+
+FORMULAS = {"epley": epley, "brzycki": brzycki}
+
+def sets_frame(history):
+    """Every set in an ExerciseHistory as one frame, sorted by exercise and then date."""
+    names = sorted(history.names())
+    parts = [history.sets(name) for name in names]
+    if not parts:
+        return pd.DataFrame({
+            "exercise": pd.Series(dtype=object), "date": pd.Series(dtype="datetime64[us]"),
+            "weight": pd.Series(dtype=np.int64), "reps": pd.Series(dtype=np.int64),
+        })
+    return pd.DataFrame({
+        "exercise": np.repeat(np.array(names, dtype=object), [len(p.dates) for p in parts]),
+        "date": np.concatenate([p.dates for p in parts]).astype("datetime64[us]"),
+        "weight": np.concatenate([p.weights for p in parts]),
+        "reps": np.concatenate([p.reps for p in parts]),
+    })
+
+class PersonalRecords:
+    """
+    Running bests and the PR timeline for a dataset. Build with from_workouts (or
+    from an existing ExerciseHistory) and add later workouts with update().
+    """
+    def __init__(self, history, formula="epley"):
+        self.formula = formula
+        self.estimate = FORMULAS[formula]
+        # record type -> Series of current bests, indexed like RECORD_TYPES' group keys
+        self.bests = {record: None for record in RECORD_TYPES}
+        self.latest = None
+        self.timeline = pd.DataFrame(columns=TIMELINE_COLUMNS)
+        self._add(sets_frame(history))
+
+    @classmethod
+    def from_workouts(cls, workouts, formula="epley"):
+        return cls(ExerciseHistory(workouts), formula)
+
+    def update(self, workouts):
+        """
+        Fold in workouts appended since the last build or update and return their
+        PR events. Workouts dated before the newest one already included would
+        need a rebuild and raise ValueError; re-sent sets of that newest workout
+        are harmless, since only values beating the running best count.
+        """
+        frame = sets_frame(ExerciseHistory(workouts))
+        if self.latest is not None and len(frame) and frame["date"].min() < self.latest:
+            raise ValueError("update() only accepts workouts dated after the ones already included")
+        return self._add(frame)
+
+    def _add(self, frame):
+        """Find the PR sets in a date-sorted sets frame, seeded with the current bests."""
+        frame = frame.assign(
+            volume=frame["weight"] * frame["reps"],
+            e1rm=self.estimate(frame["weight"], frame["reps"]).round(1),
+        )
+        events = []
+        for record, keys in RECORD_TYPES.items():
+            values = frame[record]
+            groups = [frame[k] for k in keys]
+            # Best so far before each set: the grouped running max, shifted by one set
+            before = values.groupby(groups).cummax().groupby(groups).shift()
+            prior = before.to_numpy(dtype=float)
+            if self.bests[record] is not None:
+                index = (pd.MultiIndex.from_frame(frame[keys]) if len(keys) > 1
+                         else frame["exercise"])
+                prior = np.fmax(prior, self.bests[record].reindex(index).to_numpy(dtype=float))
+            is_pr = values.to_numpy(dtype=float) > np.nan_to_num(prior, nan=0.0)
+            events.append(frame.loc[is_pr, ["date", "exercise", "weight", "reps"]]
+                          .assign(record=record, value=values[is_pr]))
+
+            new_bests = values.groupby(groups).max()
+            if self.bests[record] is not None:
+                new_bests = pd.concat([self.bests[record], new_bests]).groupby(level=keys).max()
+            self.bests[record] = new_bests
+
+        if len(frame):
+            newest = frame["date"].max()
+            self.latest = newest if self.latest is None else max(self.latest, newest)
+        new_events = self._collapse(pd.concat(events))
+        if self.timeline.empty:
+            self.timeline = new_events
+        elif not new_events.empty:
+            self.timeline = self._collapse(pd.concat([self.timeline, new_events]))
+        return new_events
+
+    @staticmethod
+    def _collapse(events):
+        """
+        One event per day, exercise and record type (and weight, for rep records),
+        keeping the best set, in date order.
+        """
+        if events.empty:
+            return pd.DataFrame(columns=TIMELINE_COLUMNS)
+        events = events.assign(_weight=events["weight"].where(events["record"] == "reps", -1))
+        events = events.sort_values(["date", "value"], kind="stable").drop_duplicates(
+            ["date", "exercise", "record", "_weight"], keep="last")
+        return events.sort_values("date", kind="stable")[TIMELINE_COLUMNS].reset_index(drop=True)
+
+    def best(self, exercise, record="e1rm"):
+        """Current best of one record type for an exercise ({weight: reps} for "reps"), or None."""
+        bests = self.bests[record]
+        if bests is None:
+            return None
+        if record == "reps":
+            if exercise not in bests.index.get_level_values(0):
+                return {}
+            return {int(w): int(r) for w, r in bests.xs(exercise, level=0).items()}
+        value = bests.get(exercise)
+        return None if value is None else value.item()
+
+    def between(self, start, end, record=None):
+        """Timeline events dated start..end (dates inclusive), optionally of one record type."""
+        events = self.timeline
+        if events.empty:
+            return events
+        dates = events["date"]
+        mask = (dates >= pd.Timestamp(start)) & (dates < pd.Timestamp(end) + pd.Timedelta(days=1))
+        if record is not None:
+            mask &= events["record"] == record
+        return events[mask]
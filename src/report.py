@@ -0,0 +1,163 @@
+"""
+Headless reports for a directory of athlete exports.
+
+Each .csv export in the directory gets its own output directory with a
+summary.json of the Home page metrics and Graphs page aggregations (yearly
+totals, sets per body part, personal records, latest training load) and the
+Graphs page charts as static files. Exports are independent, so they are
+reported in parallel, one per worker process. Workers only return a short
+status line, so no workouts cross the process boundary. A failed export is
+recorded in index.json and does not stop the batch.
+
+Usage: python src/report.py EXPORTS_DIR OUT_DIR [--workers N] [--charts html|png]
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from metrics import home_metrics
+from parse_raw_data import gc_paused
+
+CHART_FORMATS = ("html", "png")
+INDEX_FILE = "index.json"
+
+def _plain(value):
+    """numpy / pandas scalars as JSON values (NaN becomes null)."""
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+def athlete_report(workouts):
+    """
+    Summary dict and {name: altair chart} for one athlete's workouts, over their
+    whole history. Uses the same structures as the GUI pages.
+    """
+    # Deferred so only the report workers pay for these
+    from charts import body_part_chart, line_chart, pr_timeline_chart, training_load_chart
+    from downsample import cap_periods, downsample_series, thin_events
+    from records import PersonalRecords
+    from rollups import Rollups
+    from training_load import TrainingLoad
+    from workout_collection import WorkoutCollection
+
+    collection = WorkoutCollection(workouts)
+    if not len(collection):
+        return {"workouts": 0}, {}
+    start, end = collection.min_date, collection.max_date
+    rollups = Rollups(workouts)
+    records = PersonalRecords.from_workouts(workouts)
+    load = TrainingLoad(workouts)
+
+    df_bar, period, _ = cap_periods(lambda g: rollups.body_part_sets(start, end, granularity=g), "week")
+    yearly = rollups.totals(start, end, granularity="year")
+    totals = collection.totals(start, end)
+    summary = {
+        "first_workout": start.isoformat(),
+        "last_workout": end.isoformat(),
+        "totals": {key: _plain(value) for key, value in totals.items()},
+        "home_metrics": home_metrics(totals),
+        "by_year": {year: {k: _plain(v) for k, v in row.items()} for year, row in yearly.iterrows()},
+        "body_part_sets": {
+            "period": period,
+            "rows": [[p, bp, _plain(n)] for p, bp, n in df_bar[["period", "body_part", "sets_count"]].values],
+        },
+        "personal_records": {
+            record: {name: _plain(value) for name, value in records.bests[record].items()}
+            for record in ("weight", "volume", "e1rm")
+        },
+        "training_load": {
+            body_part: {
+                metric: {measure: _plain(value) for measure, value in load.series(metric, body_part).iloc[-1].items()}
+                for metric in ("tonnage", "volume")
+            }
+            for body_part in load.body_parts
+        },
+    }
+
+    line, _ = downsample_series(rollups.daily_totals(start, end)["total_weight_lifted"])
+    events, _ = thin_events(records.between(start, end, record="e1rm"))
+    charts = {
+        "weight_over_time": line_chart(line, "Total weight lifted"),
+        "body_part_sets": body_part_chart(df_bar, period.capitalize()),
+        "personal_records": pr_timeline_chart(events, "Estimated 1RM"),
+        "training_load": training_load_chart(load.series("tonnage")),
+    }
+    return summary, charts
+
+def write_athlete_report(csv_path, out_dir, chart_format="html"):
+    """
+    Parse one export and write OUT_DIR/<athlete>/summary.json and its charts.
+    Returns a status dict; errors are caught and returned, not raised.
+    """
+    import altair as alt
+    from parse_raw_data import parse_csv
+
+    athlete = os.path.splitext(os.path.basename(csv_path))[0]
+    started = time.perf_counter()
+    try:
+        workouts = parse_csv(csv_path)
+        summary, charts = athlete_report(workouts)
+        athlete_dir = os.path.join(out_dir, athlete)
+        os.makedirs(athlete_dir, exist_ok=True)
+        with open(os.path.join(athlete_dir, "summary.json"), "w", encoding="utf-8") as f:
+            json.dump({"athlete": athlete, **summary}, f, indent=2)
+        for name, chart in charts.items():
+            # Whole-history daily series can pass altair's 5,000-row default limit
+            with alt.data_transformers.disable_max_rows():
+                chart.save(os.path.join(athlete_dir, f"{name}.{chart_format}"))
+        status = {"athlete": athlete, "status": "ok", "workouts": len(workouts)}
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        # One bad export is reported in the index instead of failing the whole batch
+        status = {"athlete": athlete, "status": "failed", "error": f"{type(e).__name__}: {e}"}
+    status["seconds"] = round(time.perf_counter() - started, 3)
+    return status
+
+def run_reports(exports_dir, out_dir, max_workers=None, chart_format="html"):
+    """
+    Report every .csv export in exports_dir into out_dir, one export per worker
+    process, and write out_dir/index.json. Returns the status list, in file-name order.
+    """
+    if chart_format not in CHART_FORMATS:
+        raise ValueError(f"chart_format must be one of {CHART_FORMATS}, got {chart_format!r}")
+    names = sorted(n for n in os.listdir(exports_dir) if n.lower().endswith(".csv"))
+    paths = [os.path.join(exports_dir, n) for n in names]
+    os.makedirs(out_dir, exist_ok=True)
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(paths) <= 1:
+        statuses = [write_athlete_report(p, out_dir, chart_format) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            statuses = list(pool.map(write_athlete_report, paths, [out_dir] * len(paths),
+                                     [chart_format] * len(paths)))
+    with open(os.path.join(out_dir, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump(statuses, f, indent=2)
+    return statuses
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write per-athlete JSON summaries and charts.")
+    parser.add_argument("exports_dir")
+    parser.add_argument("out_dir")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--charts", choices=CHART_FORMATS, default="html",
+                        help="chart file format; png needs the vl-convert-python package")
+    args = parser.parse_args(argv)
+    started = time.perf_counter()
+    # A one-shot command: pausing the collector only affects this process (and
+    # forked workers), and every parsed object is kept until its report is written
+    with gc_paused():
+        statuses = run_reports(args.exports_dir, args.out_dir, args.workers, args.charts)
+    failed = [s for s in statuses if s["status"] != "ok"]
+    for s in failed:
+        print(f"{s['athlete']}: {s['error']}", file=sys.stderr)
+    print(f"Reported {len(statuses) - len(failed)} of {len(statuses)} athletes "
+          f"in {time.perf_counter() - started:.1f}s to {args.out_dir}.")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Materialized daily rollups for the Graphs page.
+
+Built once per dataset: one row per training day with the day's totals, and one
+row per (day, body part) with the number of sets. Date-range queries slice these
+small, date-sorted frames with searchsorted, and week / month / year views are
+grouped from the daily rows using precomputed period labels, so no raw sets are
+rescanned on a rerun.
+"""
+import numpy as np
+import pandas as pd
+
+# Label used for exercises with no body part mapping yet
+UNASSIGNED = "Unassigned"
+GRANULARITIES = ("day", "week", "month", "year")
+DAILY_COLUMNS = [
+    "workouts",
+    "duration",
+    "total_weight_lifted",
+    "total_reps_performed",
+    "number_of_exercise_sets",
+]
+
+def period_labels(days):
+    """Precompute the label of each granularity for a Series of datetime64 days."""
+    iso = days.dt.isocalendar()
+    return {
+        "day": days.dt.strftime("%Y-%m-%d"),
+        # Same "2024-W1" labels the Graphs page has always used
+        "week": iso["year"].astype(str) + "-W" + iso["week"].astype(str),
+        "month": days.dt.strftime("%Y-%m"),
+        "year": days.dt.strftime("%Y"),
+    }
+
+def _with_labels(frame):
+    """Sort a frame by its date column and add one label column per granularity."""
+    frame = frame.sort_values("date", kind="stable").reset_index(drop=True)
+    for granularity, labels in period_labels(frame["date"]).items():
+        frame[granularity] = labels.to_numpy()
+    return frame
+
+class Rollups:
+    """Daily totals and daily set counts per body part for one dataset."""
+    def __init__(self, workouts):
+        daily = {}
+        body_parts = {}
+        for w in workouts:
+            day = w.date.date()
+            totals = daily.setdefault(day, [0] * len(DAILY_COLUMNS))
+            totals[0] += 1
+            totals[1] += w.duration
+            totals[2] += w.total_weight_lifted
+            totals[3] += w.total_reps_performed
+            totals[4] += w.number_of_exercise_sets
+            for e in w.exercises:
+                bp = e.body_part.value if e.body_part else UNASSIGNED
+                body_parts[(day, bp)] = body_parts.get((day, bp), 0) + len(e.exercise_sets)
+
+        self.daily = _with_labels(pd.DataFrame(
+            [[day, *totals] for day, totals in daily.items()],
+            columns=["date", *DAILY_COLUMNS],
+        ).astype({"date": "datetime64[us]"}))
+        self.body_parts = _with_labels(pd.DataFrame(
+            [[day, bp, count] for (day, bp), count in body_parts.items()],
+            columns=["date", "body_part", "sets_count"],
+        ).astype({"date": "datetime64[us]"}))
+
+    @staticmethod
+    def _slice(frame, start, end):
+        """Rows of a date-sorted frame with start <= date <= end (dates inclusive)."""
+        dates = frame["date"].to_numpy()
+        lo = np.searchsorted(dates, np.datetime64(start), side="left")
+        hi = np.searchsorted(dates, np.datetime64(end) + np.timedelta64(1, "D"), side="left")
+        return frame.iloc[lo:hi]
+
+    def daily_totals(self, start, end):
+        """Per-day totals between start and end, indexed by date."""
+        return self._slice(self.daily, start, end).set_index("date")[DAILY_COLUMNS]
+
+    def totals(self, start, end, granularity="day"):
+        """DAILY_COLUMNS summed per period ("day", "week", "month" or "year")."""
+        rows = self._slice(self.daily, start, end)
+        return rows.groupby(granularity, sort=False)[DAILY_COLUMNS].sum()
+
+    def body_part_sets(self, start, end, granularity="week"):
+        """Set counts per (period, body part) between start and end, in date order."""
+        rows = self._slice(self.body_parts, start, end)
+        return (
+            rows.groupby([granularity, "body_part"], sort=False)["sets_count"]
+            .sum()
+            .reset_index()
+            .rename(columns={granularity: "period"})
+        )
@@ -0,0 +1,106 @@
+"""
+Array-backed storage for exercise sets.
+
+compact(workouts) moves every ExerciseSet into one SetStore: parallel typed
+arrays of date (epoch seconds), set number, weight and reps, plus a notes id into
+a table of distinct notes. Each exercise's exercise_sets becomes a StoredSets
+view over its slice of the store, which builds ExerciseSet objects on access, so
+code that iterates or indexes sets keeps working while the sets take about 28
+bytes each instead of a Python object apiece.
+"""
+from array import array
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+from parse_raw_data import ExerciseSet
+
+EPOCH = datetime(1970, 1, 1)
+
+class SetStore:
+    """Struct-of-arrays storage for sets. Dates are kept to the second."""
+    def __init__(self):
+        self.dates = array("q")
+        self.set_numbers = array("i")
+        self.weights = array("q")
+        self.reps = array("i")
+        self.note_ids = array("I")
+        self.notes = []
+        self._note_index = {}
+        self._seconds = {}
+
+    def __len__(self):
+        return len(self.dates)
+
+    def append(self, exercise_set):
+        """Store one ExerciseSet's fields; returns its index."""
+        seconds = self._seconds.get(exercise_set.date)
+        if seconds is None:
+            seconds = self._seconds[exercise_set.date] = int((exercise_set.date - EPOCH).total_seconds())
+        note_id = self._note_index.get(exercise_set.notes)
+        if note_id is None:
+            note_id = self._note_index[exercise_set.notes] = len(self.notes)
+            self.notes.append(exercise_set.notes)
+        self.dates.append(seconds)
+        self.set_numbers.append(exercise_set.set_number)
+        self.weights.append(exercise_set.weight)
+        self.reps.append(exercise_set.reps)
+        self.note_ids.append(note_id)
+        return len(self.dates) - 1
+
+    def get(self, index, workout_name):
+        """Rebuild the ExerciseSet at index (workout is the owning workout's name)."""
+        return ExerciseSet(
+            workout=workout_name,
+            date=EPOCH + timedelta(seconds=self.dates[index]),
+            set_number=self.set_numbers[index],
+            weight=self.weights[index],
+            reps=self.reps[index],
+            notes=self.notes[self.note_ids[index]],
+        )
+
+    def nbytes(self):
+        """Bytes held by the arrays (the notes table is shared strings, not counted)."""
+        return sum(a.itemsize * len(a) for a in
+                   (self.dates, self.set_numbers, self.weights, self.reps, self.note_ids))
+
+class StoredSets(Sequence):
+    """Read-only view of one exercise's sets, a contiguous slice of a SetStore."""
+    __slots__ = ("store", "start", "stop", "workout_name")
+
+    def __init__(self, store, start, stop, workout_name):
+        self.store = store
+        self.start = start
+        self.stop = stop
+        self.workout_name = workout_name
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("set index out of range")
+        return self.store.get(self.start + index, self.workout_name)
+
+    def __iter__(self):
+        for i in range(self.start, self.stop):
+            yield self.store.get(i, self.workout_name)
+
+def compact(workouts, store=None):
+    """
+    Move the sets of workouts into a SetStore (a new one unless given) and
+    replace each exercise's exercise_sets with a StoredSets view. Workout totals
+    are unchanged. Adding a set to a compacted exercise turns its exercise_sets
+    back into a list. Returns the store.
+    """
+    store = SetStore() if store is None else store
+    for w in workouts:
+        for e in w.exercises:
+            start = len(store)
+            for s in e.exercise_sets:
+                store.append(s)
+            e.exercise_sets = StoredSets(store, start, len(store), w.name)
+    return store
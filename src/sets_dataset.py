@@ -0,0 +1,98 @@
+"""
+Year-partitioned Arrow / Parquet dataset of exercise sets.
+
+export_dataset converts a Strong CSV (with body parts resolved from the mapping)
+into the typed sets frame of columnar.read_sets_frame and writes it as a hive
+partitioned dataset, one directory per year (year=2024/...). SetsDataset opens
+it again: date-range reads are pushed down as a filter, so only the year
+partitions overlapping the range are opened, and the files are memory-mapped.
+With the default Arrow IPC format the mapped columns are used without copying
+or decoding; Parquet is smaller on disk but has to be decoded.
+
+Usage: python src/parse_raw_data.py export STRONG.csv OUT_DIR [--format arrow|parquet]
+"""
+import json
+import os
+from datetime import datetime, timedelta
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pyarrow import fs
+
+from columnar import read_sets_frame
+
+FORMATS = {"arrow": "ipc", "parquet": "parquet"}
+# Written next to the partitions; pyarrow skips files starting with "_" when reading
+METADATA_FILE = "_strong_dataset.json"
+PARTITIONING = ds.partitioning(pa.schema([("year", pa.int32())]), flavor="hive")
+
+def export_dataset(source, out_dir, file_format="arrow", mappings=None):
+    """
+    Write a Strong export (path, stream or bytes) to out_dir partitioned by year.
+    Partitions for years in the export are replaced. Returns the metadata dict.
+    """
+    frame = read_sets_frame(source, mappings)
+    frame["year"] = frame["date"].dt.year.astype("int32")
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    os.makedirs(out_dir, exist_ok=True)
+    ds.write_dataset(
+        table, out_dir, format=FORMATS[file_format], partitioning=PARTITIONING,
+        existing_data_behavior="delete_matching",
+    )
+    metadata = {
+        "format": file_format,
+        "rows": len(frame),
+        "min_date": frame["date"].min().strftime("%Y-%m-%d") if len(frame) else None,
+        "max_date": frame["date"].max().strftime("%Y-%m-%d") if len(frame) else None,
+    }
+    with open(os.path.join(out_dir, METADATA_FILE), "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2)
+    return metadata
+
+def is_dataset(path):
+    """True if path is a directory written by export_dataset."""
+    return os.path.isdir(path) and os.path.isfile(os.path.join(path, METADATA_FILE))
+
+class SetsDataset:
+    """A dataset written by export_dataset, opened with memory-mapped files."""
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, METADATA_FILE), "r", encoding="utf-8") as f:
+            self.metadata = json.load(f)
+        self._dataset = ds.dataset(
+            path, format=FORMATS[self.metadata["format"]], partitioning=PARTITIONING,
+            filesystem=fs.LocalFileSystem(use_mmap=True),
+        )
+
+    def __len__(self):
+        return self.metadata["rows"]
+
+    @property
+    def min_date(self):
+        value = self.metadata["min_date"]
+        return datetime.strptime(value, "%Y-%m-%d").date() if value else None
+
+    @property
+    def max_date(self):
+        value = self.metadata["max_date"]
+        return datetime.strptime(value, "%Y-%m-%d").date() if value else None
+
+    def files_for(self, start, end):
+        """Data files a start..end read has to open (those of the overlapping years)."""
+        year = ds.field("year")
+        return [f.path for f in self._dataset.get_fragments((year >= start.year) & (year <= end.year))]
+
+    def table(self, start, end):
+        """Arrow table of the sets dated start..end (dates inclusive)."""
+        date = ds.field("date")
+        year = ds.field("year")
+        # The year terms prune partitions; the date terms filter rows inside them
+        predicate = ((year >= start.year) & (year <= end.year)
+                     & (date >= pa.scalar(datetime.combine(start, datetime.min.time())))
+                     & (date < pa.scalar(datetime.combine(end + timedelta(days=1), datetime.min.time()))))
+        table = self._dataset.to_table(filter=predicate)
+        return table.drop_columns(["year"]).sort_by([("date", "ascending")])
+
+    def frame(self, start, end):
+        """Typed sets frame (as columnar.read_sets_frame) for start..end."""
+        return self.table(start, end).to_pandas()
@@ -0,0 +1,211 @@
+"""
+Embedded SQLite store for many athletes' workouts.
+
+Each athlete's parsed export is loaded into indexed workouts / exercises / sets
+tables keyed by athlete. Workout-level totals and per-exercise set counts are
+stored at load time, so the date-filtered metrics and chart queries the GUI needs
+(per athlete or for the whole team) are single indexed SQL aggregates.
+
+Usage: python src/store.py ATHLETE EXPORT.csv [DB_PATH]
+"""
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+from parse_raw_data import BODY_PARTS_BY_VALUE, Exercise, ExerciseSet, Workout, parse_csv
+
+dirname = os.path.dirname(__file__)
+STORE_FILE = os.path.join(dirname, '../data/workouts.db')
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS workouts (
+    id INTEGER PRIMARY KEY,
+    athlete TEXT NOT NULL,
+    date TEXT NOT NULL,
+    day TEXT NOT NULL,
+    week TEXT NOT NULL,
+    name TEXT NOT NULL,
+    duration INTEGER NOT NULL,
+    notes TEXT NOT NULL,
+    total_weight INTEGER NOT NULL,
+    total_reps INTEGER NOT NULL,
+    number_of_exercises INTEGER NOT NULL,
+    number_of_sets INTEGER NOT NULL,
+    UNIQUE (athlete, date, name)
+);
+CREATE INDEX IF NOT EXISTS workouts_athlete_day ON workouts (athlete, day);
+CREATE INDEX IF NOT EXISTS workouts_day ON workouts (day);
+
+CREATE TABLE IF NOT EXISTS exercises (
+    id INTEGER PRIMARY KEY,
+    workout_id INTEGER NOT NULL REFERENCES workouts (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    body_part TEXT,
+    set_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS exercises_workout ON exercises (workout_id);
+
+CREATE TABLE IF NOT EXISTS sets (
+    id INTEGER PRIMARY KEY,
+    exercise_id INTEGER NOT NULL REFERENCES exercises (id) ON DELETE CASCADE,
+    date TEXT NOT NULL,
+    set_number INTEGER NOT NULL,
+    weight INTEGER NOT NULL,
+    reps INTEGER NOT NULL,
+    notes TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sets_exercise ON sets (exercise_id);
+"""
+
+def _week_label(when):
+    """ISO week label matching the Graphs page, e.g. "2024-W1"."""
+    iso_year, iso_week, _ = when.isocalendar()
+    return f"{iso_year}-W{iso_week}"
+
+class WorkoutStore:
+    """SQLite-backed workouts for many athletes. Use as a context manager or call close()."""
+    def __init__(self, path=STORE_FILE):
+        self.path = path
+        # Streamlit reruns may land on another thread than the one that opened the store
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def replace_athlete(self, athlete, workouts):
+        """Replace everything stored for athlete with the given Workout objects."""
+        with self.conn:
+            self.conn.execute("DELETE FROM workouts WHERE athlete = ?", (athlete,))
+            for w in workouts:
+                cursor = self.conn.execute(
+                    "INSERT INTO workouts (athlete, date, day, week, name, duration, notes,"
+                    " total_weight, total_reps, number_of_exercises, number_of_sets)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (athlete, w.date.strftime(DATE_FORMAT), w.date.date().isoformat(),
+                     _week_label(w.date), w.name, w.duration, w.notes,
+                     w.total_weight_lifted, w.total_reps_performed,
+                     w.number_of_exercises, w.number_of_exercise_sets),
+                )
+                workout_id = cursor.lastrowid
+                for position, e in enumerate(w.exercises):
+                    cursor = self.conn.execute(
+                        "INSERT INTO exercises (workout_id, position, name, body_part, set_count)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        (workout_id, position, e.name,
+                         e.body_part.value if e.body_part else None, len(e.exercise_sets)),
+                    )
+                    self.conn.executemany(
+                        "INSERT INTO sets (exercise_id, date, set_number, weight, reps, notes)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        [(cursor.lastrowid, s.date.strftime(DATE_FORMAT), s.set_number,
+                          s.weight, s.reps, s.notes) for s in e.exercise_sets],
+                    )
+
+    def ingest_csv(self, athlete, source):
+        """Parse a Strong export (path, stream or bytes) and store it as athlete's data."""
+        workouts = parse_csv(source)
+        self.replace_athlete(athlete, workouts)
+        return len(workouts)
+
+    def athletes(self):
+        return [row[0] for row in self.conn.execute(
+            "SELECT DISTINCT athlete FROM workouts ORDER BY athlete")]
+
+    @staticmethod
+    def _where(start, end, athlete):
+        """WHERE clause and parameters for a day range, optionally limited to one athlete."""
+        clause = "w.day BETWEEN ? AND ?"
+        params = [start.isoformat(), end.isoformat()]
+        if athlete is not None:
+            clause += " AND w.athlete = ?"
+            params.append(athlete)
+        return clause, params
+
+    def date_bounds(self, athlete=None):
+        """(first, last) workout day as dates, or (None, None) when there is no data."""
+        query = "SELECT MIN(day), MAX(day) FROM workouts w"
+        params = []
+        if athlete is not None:
+            query += " WHERE w.athlete = ?"
+            params.append(athlete)
+        first, last = self.conn.execute(query, params).fetchone()
+        if first is None:
+            return None, None
+        return (datetime.strptime(first, "%Y-%m-%d").date(),
+                datetime.strptime(last, "%Y-%m-%d").date())
+
+    def metrics(self, start, end, athlete=None):
+        """The Home page totals for a date range, same keys as WorkoutCollection.totals."""
+        clause, params = self._where(start, end, athlete)
+        row = self.conn.execute(
+            "SELECT COUNT(*), TOTAL(duration), TOTAL(total_weight), TOTAL(total_reps),"
+            " TOTAL(number_of_exercises), TOTAL(number_of_sets)"
+            f" FROM workouts w WHERE {clause}", params).fetchone()
+        keys = ("workouts", "duration", "total_weight_lifted", "total_reps_performed",
+                "number_of_exercises", "number_of_exercise_sets")
+        return {key: int(value) for key, value in zip(keys, row)}
+
+    def daily_weight(self, start, end, athlete=None):
+        """[(day, total weight lifted)] for each training day in the range."""
+        clause, params = self._where(start, end, athlete)
+        return self.conn.execute(
+            f"SELECT day, SUM(total_weight) FROM workouts w WHERE {clause}"
+            " GROUP BY day ORDER BY day", params).fetchall()
+
+    def weekly_body_part_sets(self, start, end, athlete=None):
+        """[(week, body part, sets)] for the range; unmapped exercises count as "Unassigned"."""
+        clause, params = self._where(start, end, athlete)
+        return self.conn.execute(
+            "SELECT w.week, COALESCE(e.body_part, 'Unassigned'), SUM(e.set_count)"
+            f" FROM workouts w JOIN exercises e ON e.workout_id = w.id WHERE {clause}"
+            " GROUP BY w.week, e.body_part ORDER BY MIN(w.day)", params).fetchall()
+
+    def load_workouts(self, athlete):
+        """Rebuild athlete's Workout objects from the store, in date order."""
+        workouts = {}
+        rows = self.conn.execute(
+            "SELECT w.id, w.name, w.date, w.duration, w.notes, e.name, e.body_part,"
+            " s.date, s.set_number, s.weight, s.reps, s.notes"
+            " FROM workouts w JOIN exercises e ON e.workout_id = w.id"
+            " JOIN sets s ON s.exercise_id = e.id"
+            " WHERE w.athlete = ? ORDER BY w.date, w.id, e.position, s.id", (athlete,))
+        for (workout_id, name, date_str, duration, notes, exercise_name, body_part,
+             set_date, set_number, weight, reps, set_notes) in rows:
+            workout = workouts.get(workout_id)
+            if workout is None:
+                workout = Workout(name, datetime.strptime(date_str, DATE_FORMAT), duration, notes)
+                workouts[workout_id] = workout
+            exercise = workout.get_exercise(exercise_name)
+            if exercise is None:
+                exercise = workout.add_exercise(
+                    Exercise(exercise_name, body_part=BODY_PARTS_BY_VALUE.get(body_part)))
+            exercise.add_set(ExerciseSet(
+                workout=name,
+                date=datetime.strptime(set_date, DATE_FORMAT),
+                set_number=set_number,
+                weight=weight,
+                reps=reps,
+                notes=set_notes,
+            ))
+        return list(workouts.values())
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(__doc__.strip().splitlines()[-1])
+        sys.exit(1)
+    db_path = sys.argv[3] if len(sys.argv) > 3 else STORE_FILE
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    with WorkoutStore(db_path) as store:
+        count = store.ingest_csv(sys.argv[1], sys.argv[2])
+    print(f"Stored {count} workouts for {sys.argv[1]} in {db_path}.")
@@ -0,0 +1,123 @@
+"""
+Rolling training-load metrics per body part.
+
+The daily load is one row per calendar day (rest days are zeros) and one column
+per (metric, body part), where metric is "volume" (sets) or "tonnage" (weight x
+reps), plus an ALL column per metric. Every derived series is a rolling window
+over those columns:
+
+- acute: load over the last 7 days
+- chronic: average weekly load over the last 28 days (NaN until 28 days exist)
+- acwr: acute:chronic workload ratio, acute / chronic
+- monotony: mean / standard deviation of the daily load over the last 7 days
+
+Appending days only recomputes the windows that can see them (the last 27 days
+before the first new day, plus the new days).
+"""
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from rollups import UNASSIGNED
+
+METRICS = ("volume", "tonnage")
+MEASURES = ("daily", "acute", "chronic", "acwr", "monotony")
+# Column holding the sum over every body part
+ALL = "All"
+ACUTE_DAYS = 7
+CHRONIC_DAYS = 28
+
+def daily_load(workouts):
+    """Calendar-day load frame for workouts, columns (metric, body part); empty if no sets."""
+    rows = {}
+    for w in workouts:
+        day = w.date.date()
+        for e in w.exercises:
+            bp = e.body_part.value if e.body_part else UNASSIGNED
+            totals = rows.setdefault((day, bp), [0, 0])
+            totals[0] += len(e.exercise_sets)
+            totals[1] += sum(s.weight * s.reps for s in e.exercise_sets)
+    if not rows:
+        return pd.DataFrame(columns=pd.MultiIndex.from_tuples([], names=["metric", "body_part"]),
+                            index=pd.DatetimeIndex([], dtype="datetime64[us]", name="date"))
+    frame = pd.DataFrame(
+        [[day, bp, volume, tonnage] for (day, bp), (volume, tonnage) in rows.items()],
+        columns=["date", "body_part", *METRICS],
+    ).astype({"date": "datetime64[us]"})
+    wide = frame.pivot_table(index="date", columns="body_part", values=list(METRICS),
+                             aggfunc="sum", fill_value=0)
+    wide.columns.names = ["metric", "body_part"]
+    for metric in METRICS:
+        wide[(metric, ALL)] = wide[metric].sum(axis=1)
+    days = pd.date_range(wide.index[0], wide.index[-1], freq="D", unit="us", name="date")
+    return wide.reindex(days, fill_value=0).sort_index(axis=1).astype(float)
+
+def rolling_metrics(daily):
+    """Every measure for every daily column, as a frame with columns (measure, metric, body part)."""
+    acute = daily.rolling(ACUTE_DAYS, min_periods=1).sum()
+    chronic = daily.rolling(CHRONIC_DAYS, min_periods=CHRONIC_DAYS).sum() * ACUTE_DAYS / CHRONIC_DAYS
+    week = daily.rolling(ACUTE_DAYS, min_periods=ACUTE_DAYS)
+    # A week of identical loads has no spread; its monotony is left undefined
+    monotony = week.mean() / week.std().replace(0, np.nan)
+    return pd.concat({
+        "daily": daily,
+        "acute": acute,
+        "chronic": chronic,
+        "acwr": acute / chronic.replace(0, np.nan),
+        "monotony": monotony,
+    }, axis=1, names=["measure"])
+
+class TrainingLoad:
+    """Daily load and its rolling metrics for a dataset; add later workouts with append()."""
+    def __init__(self, workouts):
+        self.daily = daily_load(workouts)
+        self.metrics = rolling_metrics(self.daily)
+
+    @property
+    def body_parts(self):
+        """Body parts with any load, ALL first."""
+        if self.daily.empty:
+            return []
+        parts = sorted(set(self.daily.columns.get_level_values("body_part")) - {ALL})
+        return [ALL, *parts]
+
+    def append(self, workouts):
+        """
+        Add workouts dated on or after the last day already loaded and update the
+        metrics of the affected days only. Older workouts need a rebuild and raise
+        ValueError.
+        """
+        new = daily_load(workouts)
+        if new.empty:
+            return
+        if self.daily.empty:
+            self.daily, self.metrics = new, rolling_metrics(new)
+            return
+        last = self.daily.index[-1]
+        first_new = new.index[0]
+        if first_new < last:
+            raise ValueError("append() only accepts workouts dated on or after the last loaded day")
+
+        columns = self.daily.columns.union(new.columns)
+        days = pd.date_range(self.daily.index[0], max(last, new.index[-1]), freq="D", unit="us", name="date")
+        self.daily = (self.daily.reindex(index=days, columns=columns, fill_value=0.0)
+                      + new.reindex(index=days, columns=columns, fill_value=0.0))
+        if len(columns) != len(self.metrics["daily"].columns):
+            # A body part seen for the first time has metrics back to the first day
+            self.metrics = rolling_metrics(self.daily)
+            return
+
+        # Only windows that end on or after the first changed day see new data
+        context = self.daily.loc[first_new - timedelta(days=CHRONIC_DAYS - 1):]
+        updated = rolling_metrics(context).loc[first_new:]
+        kept = self.metrics.loc[:first_new - timedelta(days=1)]
+        self.metrics = pd.concat([kept, updated]).reindex(columns=updated.columns)
+
+    def series(self, metric="tonnage", body_part=ALL, start=None, end=None):
+        """One metric and body part's MEASURES, one row per day, optionally sliced to start..end."""
+        frame = self.metrics.xs((metric, body_part), axis=1, level=["metric", "body_part"])
+        frame = frame[list(MEASURES)]
+        if start is not None:
+            frame = frame.loc[pd.Timestamp(start):pd.Timestamp(end)]
+        return frame
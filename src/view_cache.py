@@ -0,0 +1,55 @@
+"""
+Bounded LRU memo for the GUI's page aggregations.
+
+Every widget interaction reruns the whole script, so the metrics and chart frames
+of a page would be recomputed even for a date range shown a moment ago. The GUI
+keeps one ViewCache in session state and looks each aggregation up by (dataset
+generation, date range, page, view); going back to a range or page already seen
+is a dict hit. The least recently used entries are dropped past max_entries, and
+hit / miss counts are kept for the diagnostics panel.
+"""
+from collections import OrderedDict
+
+MAX_ENTRIES = 64
+
+class ViewCache:
+    """LRU mapping of view keys to built values, with hit / miss / eviction counters."""
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, build):
+        """The value cached under key, or build() stored under it (and not stored if it raises)."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        value = build()
+        self._entries[key] = value
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def clear(self):
+        """Drop every entry; the counters keep running."""
+        self._entries.clear()
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+        }
@@ -0,0 +1,85 @@
+"""
+Date-sorted workout collection with prefix sums.
+
+Workouts are kept sorted by date alongside running (prefix) sums of each metric
+shown on the Home page, so a date-range filter or any range total is two bisect
+lookups and a subtraction instead of a pass over every workout.
+"""
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+# Workout attribute summed for each Home page metric
+METRICS = (
+    "duration",
+    "total_weight_lifted",
+    "total_reps_performed",
+    "number_of_exercises",
+    "number_of_exercise_sets",
+)
+
+class WorkoutCollection:
+    """
+    Immutable, date-sorted view of a list of workouts. Build a new one when the
+    underlying workouts change; the prefix sums are not updated in place.
+    """
+    def __init__(self, workouts):
+        self._workouts = sorted(workouts, key=lambda w: w.date)
+        self._source = None
+        self.days = [w.date.date() for w in self._workouts]
+        # prefix[m][i] is the sum of metric m over the first i workouts
+        self.prefix = {
+            m: list(accumulate((getattr(w, m) for w in self._workouts), initial=0))
+            for m in METRICS
+        }
+
+    @classmethod
+    def from_summary(cls, days, totals, workouts):
+        """
+        Collection from per-workout values already in collection order (see
+        columnar.workout_summary): days is their dates, totals maps each METRICS
+        name to their values. workouts (possibly a lazy sequence) is only read
+        and sorted when between() or iteration needs the Workout objects.
+        """
+        collection = cls.__new__(cls)
+        collection._workouts = None
+        collection._source = workouts
+        collection.days = list(days)
+        collection.prefix = {m: list(accumulate(totals[m], initial=0)) for m in METRICS}
+        return collection
+
+    @property
+    def workouts(self):
+        if self._workouts is None:
+            self._workouts = sorted(self._source, key=lambda w: w.date)
+        return self._workouts
+
+    def __len__(self):
+        return len(self.days)
+
+    def __iter__(self):
+        return iter(self.workouts)
+
+    @property
+    def min_date(self):
+        return self.days[0] if self.days else None
+
+    @property
+    def max_date(self):
+        return self.days[-1] if self.days else None
+
+    def _bounds(self, start, end):
+        """Slice indices of the workouts dated start..end (inclusive)."""
+        return bisect_left(self.days, start), bisect_right(self.days, end)
+
+    def between(self, start, end):
+        """Workouts dated from start to end inclusive, in date order."""
+        lo, hi = self._bounds(start, end)
+        return self.workouts[lo:hi]
+
+    def totals(self, start, end):
+        """Number of workouts and the sum of every METRICS attribute between start and end."""
+        lo, hi = self._bounds(start, end)
+        result = {"workouts": max(0, hi - lo)}
+        for m in METRICS:
+            result[m] = self.prefix[m][hi] - self.prefix[m][lo] if hi > lo else 0
+        return result
@@ -0,0 +1,76 @@
+import pytest
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../benchmarks')))
+import parse_raw_data as prd
+import parse_cache
+import background
+from synthetic import mapping_for_catalog, write_export
+
+@pytest.fixture
+def export(tmp_path, monkeypatch):
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(tmp_path / "mapping.json"))
+    prd.save_mappings(mapping_for_catalog())
+    return write_export(str(tmp_path / "strong.csv"), 2000, seed=1)
+
+def _summary(workouts):
+    return [(w.date, w.name, w.number_of_exercises, w.number_of_exercise_sets, w.total_weight_lifted)
+            for w in workouts]
+
+def test_background_load_matches_parse_csv_and_caches(export, tmp_path):
+    """Test: batches are merged into the same workouts parse_csv builds, and the result is cached."""
+    cache_dir = str(tmp_path / "cache")
+    load = background.BackgroundLoad(export, "strong.csv", batch_rows=300, cache_dir=cache_dir).start()
+    load.join()
+    assert load.status == background.DONE and load.progress == 1.0
+    assert load.rows_read == 2000 and load.version == 7
+    assert load.bytes_read == os.path.getsize(export)
+    assert _summary(load.workouts()) == _summary(prd.parse_csv(export))
+    assert parse_cache.is_cached(export, cache_dir)
+
+def test_cancel_keeps_partial_workouts(export, tmp_path):
+    """Test: a cancelled load stops after the current batch and keeps what it read."""
+    # Big enough that the reader has not buffered the whole file after one batch
+    big = write_export(str(tmp_path / "big.csv"), 20_000, seed=2)
+    load = background.BackgroundLoad(big, "big.csv", batch_rows=1000)
+    load.cancel()
+    load.start().join()
+    assert load.status == background.CANCELLED
+    assert load.rows_read == 1000
+    assert 0 < load.progress < 1
+    assert sum(w.number_of_exercise_sets for w in load.workouts()) == 1000
+
+def test_failed_load_reports_error():
+    """Test: a parse error ends the load as failed with the exception kept."""
+    load = background.BackgroundLoad(b"not a csv", "upload").start()
+    load.join()
+    assert load.status == background.FAILED and load.error is not None
+    assert load.workouts() == []
+
+def test_published_workouts_are_not_modified(export, tmp_path, monkeypatch):
+    """Test: a workout cut by a batch boundary is completed in a copy, not in the published object."""
+    load = background.BackgroundLoad(export, "strong.csv", batch_rows=7, cache_dir=str(tmp_path / "cache"))
+    seen = []
+    real_merge = background.merge_workouts
+    def merge_and_snapshot(by_key, new):
+        seen.extend((w, w.number_of_exercise_sets) for w in load._workouts)
+        return real_merge(by_key, new)
+    monkeypatch.setattr(background, 'merge_workouts', merge_and_snapshot)
+    load.start().join()
+    assert load.status == background.DONE
+    assert all(w.number_of_exercise_sets == sets for w, sets in seen)
+    assert _summary(load.workouts()) == _summary(prd.parse_csv(export))
+
+def test_background_load_records_stage(export, tmp_path):
+    """Test: the parse is timed as one stage in the recorder of the thread that created the load."""
+    import instrumentation
+    recorder = instrumentation.Recorder()
+    instrumentation.use_recorder(recorder)
+    try:
+        load = background.BackgroundLoad(export, "strong.csv", cache_dir=str(tmp_path / "cache"))
+    finally:
+        instrumentation.use_recorder(instrumentation.DEFAULT_RECORDER)
+    load.start().join()
+    (record,) = recorder.stage_rows()
+    assert record["stage"] == "background_load" and record["rows"] == 2000
@@ -0,0 +1,26 @@
+import pytest
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../benchmarks')))
+import parse_raw_data as prd
+import synthetic
+import run_benchmarks
+
+def test_synthetic_export_parses(tmp_path, monkeypatch):
+    """Test: the generator writes exactly the requested rows as a parseable Strong export."""
+    mapping_file = tmp_path / "mapping.json"
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(mapping_file))
+    prd.save_mappings(synthetic.mapping_for_catalog())
+    path = synthetic.write_export(str(tmp_path / "strong.csv"), 500, seed=3)
+    workouts = prd.parse_csv(path)
+    assert sum(w.number_of_exercise_sets for w in workouts) == 500
+    assert all(e.body_part is not None for w in workouts for e in w.exercises)
+    assert len({w.duration for w in workouts}) > 5
+
+def test_compare_flags_only_real_regressions():
+    """Test: compare reports cases over the threshold and ignores sub-millisecond noise."""
+    baseline = {"parse_csv": 1.0, "tiny": 0.00001, "new_case_missing": 0.5}
+    results = {"parse_csv": 1.3, "tiny": 0.0001, "fresh": 2.0}
+    assert run_benchmarks.compare(results, baseline, 0.25) == [("parse_csv", 1.0, 1.3)]
+    assert run_benchmarks.compare(results, baseline, 0.5) == []
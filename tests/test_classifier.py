@@ -0,0 +1,61 @@
+import pytest
+import os
+import sys
+import time
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../benchmarks')))
+import classifier
+from synthetic import exercise_name_variants, mapping_for_catalog
+
+MAPPING = {
+    "Bench Press (Barbell)": "Pecs",
+    "Incline Bench Press (Dumbbell)": "Pecs",
+    "Squat (Barbell)": "Quads",
+    "Bicep Curl (Dumbbell)": "Biceps",
+    "Lateral Raise (Dumbbell)": "Side Delts",
+    "Standing Calf Raise (Machine)": "Calves",
+    "Unsure Exercise": None,
+}
+
+def test_similar_names_get_the_mapped_body_part():
+    """Test: close variants of mapped names are auto-assigned; unrelated names stay ambiguous."""
+    index = classifier.BodyPartIndex(MAPPING)
+    assert len(index) == 6
+    assigned, ambiguous = index.classify([
+        "Incline Bench Press (Barbell)", "squat  barbell", "Bicep Curl (Cable)", "Farmer Walk",
+    ])
+    assert assigned == {
+        "Incline Bench Press (Barbell)": "Pecs",
+        "squat  barbell": "Quads",
+        "Bicep Curl (Cable)": "Biceps",
+    }
+    assert ambiguous == ["Farmer Walk"]
+
+def test_match_reports_score_and_runner_up():
+    """Test: match returns the best body part, its similarity and the best other body part's."""
+    index = classifier.BodyPartIndex(MAPPING)
+    body_part, score, runner_up = index.match("Bench Press (Barbell)")
+    assert (body_part, score) == ("Pecs", 1.0)
+    body_part, score, runner_up = index.match("Seated Calf Raise (Machine)")
+    assert body_part == "Calves" and 0 < runner_up < score < 1
+    assert index.match("zzz") == (None, 0.0, 0.0)
+
+def test_margin_leaves_close_calls_ambiguous():
+    """Test: a name about equally similar to two body parts is not auto-assigned."""
+    index = classifier.BodyPartIndex({"Press Up": "Pecs", "Press Down": "Triceps"})
+    assigned, ambiguous = index.classify(["Press"], threshold=0.1)
+    assert not assigned and ambiguous == ["Press"]
+
+def test_empty_mapping_leaves_everything_ambiguous():
+    """Test: with nothing mapped yet, every name goes to the prompt."""
+    assert classifier.BodyPartIndex({}).classify(["Squat"]) == ({}, ["Squat"])
+
+def test_classifies_thousands_of_names_quickly():
+    """Test: thousands of custom names are classified in one pass, well under a second."""
+    index = classifier.BodyPartIndex(mapping_for_catalog())
+    names = exercise_name_variants(3000)
+    start = time.perf_counter()
+    assigned, ambiguous = index.classify(names)
+    assert time.perf_counter() - start < 1.0
+    assert len(assigned) + len(ambiguous) == 3000
+    assert len(assigned) > 2500
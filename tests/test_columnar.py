@@ -0,0 +1,71 @@
+import pytest
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import parse_raw_data as prd
+import columnar
+
+CSV_CONTENT = """Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 10:00:00,Test,1h 5m,Pushup,1,0,10,,Morning
+2024-01-01 10:00:00,Test,1h 5m,Pushup,2,,12,Slow,Morning
+2024-01-01 10:00:00,Test,1h 5m,Squat,,52.5,8,,Morning
+2024-01-03 18:30:00,Legs,45m,Squat,1,60,5,,
+2024-01-03 18:30:00,Legs,45m,Lunge,1,20.9,,,
+"""
+
+def _flatten(workouts):
+    """Reduce a list of workouts to plain tuples so two parses can be compared."""
+    return [
+        (w.name, w.date, w.duration, w.notes, [
+            (e.name, e.body_part, [
+                (s.workout, s.date, s.set_number, s.weight, s.reps, s.notes)
+                for s in e.exercise_sets
+            ])
+            for e in w.exercises
+        ])
+        for w in workouts
+    ]
+
+def test_parse_csv_columnar_matches_parse_csv(tmp_path, monkeypatch):
+    """Test: the columnar engine's object view is identical to parse_csv output."""
+    mapping_file = tmp_path / "mapping.json"
+    mapping_file.write_text('{"Squat": "Quads"}')
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(mapping_file))
+    f = tmp_path / "test.csv"
+    f.write_text(CSV_CONTENT)
+    expected = prd.parse_csv(str(f))
+    result = columnar.parse_csv_columnar(str(f))
+    assert len(result) == 2
+    assert result.number_of_sets == 5
+    assert _flatten(result.workouts()) == _flatten(expected)
+
+def test_read_sets_frame_typed_columns(tmp_path):
+    """Test: read_sets_frame converts dates, weights, reps and durations in bulk."""
+    f = tmp_path / "test.csv"
+    f.write_text(CSV_CONTENT)
+    frame = columnar.read_sets_frame(str(f), mappings={"Squat": "Quads"})
+    assert frame["duration"].tolist() == [65, 65, 65, 45, 45]
+    assert frame["weight"].tolist() == [0, 0, 52, 60, 20]
+    assert frame["reps"].tolist() == [10, 12, 8, 5, 0]
+    assert frame["set_number"].tolist() == [1, 2, 1, 1, 1]
+    assert frame["body_part"].tolist() == ["", "", "Quads", "Quads", ""]
+    assert str(frame["date"].dtype).startswith("datetime64")
+
+def test_workouts_view_is_lazy(tmp_path):
+    """Test: Workout objects are only built when workouts() is called, then reused."""
+    f = tmp_path / "test.csv"
+    f.write_text(CSV_CONTENT)
+    result = columnar.parse_csv_columnar(str(f), mappings={})
+    assert result._workouts is None
+    first = result.workouts()
+    assert result.workouts() is first
+
+def test_iter_set_batches_matches_full_frame(tmp_path):
+    """Test: batches from iter_set_batches concatenate to the full typed frame."""
+    f = tmp_path / "test.csv"
+    f.write_text(CSV_CONTENT)
+    batches = list(columnar.iter_set_batches(str(f), batch_size=2, mappings={}))
+    assert [len(b) for b in batches] == [2, 2, 1]
+    full = columnar.read_sets_frame(str(f), mappings={})
+    assert sum(int(b["weight"].sum()) for b in batches) == int(full["weight"].sum())
+    assert sum(int(b["duration"].sum()) for b in batches) == int(full["duration"].sum())
@@ -0,0 +1,47 @@
+import pytest
+import os
+import sys
+import numpy as np
+import pandas as pd
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import downsample
+
+def test_lttb_keeps_endpoints_and_peaks():
+    """Test: LTTB keeps the first/last points and a spike in the middle."""
+    y = np.zeros(1000)
+    y[437] = 50
+    kept = downsample.lttb_indices(np.arange(1000), y, 20)
+    assert len(kept) == 20
+    assert kept[0] == 0 and kept[-1] == 999
+    assert 437 in kept
+    assert list(kept) == sorted(kept)
+
+def test_downsample_series_reports_savings():
+    """Test: long date-indexed series are reduced and the saved point count reported."""
+    days = pd.date_range("2015-01-01", periods=3000, freq="D")
+    series = pd.Series(np.arange(3000), index=days)
+    small, saved = downsample.downsample_series(series, max_points=300)
+    assert len(small) == 300 and saved == 2700
+    same, saved = downsample.downsample_series(series.iloc[:10], max_points=300)
+    assert len(same) == 10 and saved == 0
+
+def test_cap_periods_rolls_weeks_up_to_months():
+    """Test: bar data moves to a coarser period once it has too many bars."""
+    def frame_for(granularity):
+        periods = {"week": 200, "month": 46, "year": 4}[granularity]
+        return pd.DataFrame({"period": np.repeat(np.arange(periods), 2), "sets_count": 1})
+    frame, granularity, saved = downsample.cap_periods(frame_for, "week", max_bars=100)
+    assert granularity == "month"
+    assert saved == 400 - 92
+    _, granularity, saved = downsample.cap_periods(frame_for, "month", max_bars=100)
+    assert granularity == "month" and saved == 0
+
+def test_thin_events_keeps_last_per_month():
+    """Test: long event tables keep the last event per exercise, record and month."""
+    days = pd.date_range("2015-01-01", periods=900, freq="D")
+    events = pd.DataFrame({"date": days, "exercise": "Squat", "record": "weight", "value": np.arange(900)})
+    thinned, saved = downsample.thin_events(events, max_points=100)
+    assert len(thinned) == 30 and saved == 870
+    assert thinned["value"].iloc[0] == 30
+    same, saved = downsample.thin_events(events.iloc[:50], max_points=100)
+    assert len(same) == 50 and saved == 0
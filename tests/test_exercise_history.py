@@ -0,0 +1,45 @@
+import pytest
+import os
+import sys
+from datetime import date, datetime
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import parse_raw_data as prd
+from exercise_history import ExerciseHistory
+
+CSV = b"""Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-08 09:00:00,Legs,30m,Squat,1,110,5,,
+2024-01-08 09:00:00,Legs,30m,Squat,2,120,3,,
+2024-01-01 09:00:00,Legs,30m,Squat,1,100,5,,
+2024-01-01 09:00:00,Legs,30m,Bench Press,1,80,8,,
+2024-01-15 09:00:00,Push,30m,Bench Press,1,85,8,,
+"""
+
+@pytest.fixture
+def history(tmp_path, monkeypatch):
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(tmp_path / "missing.json"))
+    return ExerciseHistory(prd.parse_csv(CSV))
+
+def test_sets_are_date_ordered_arrays(history):
+    """Test: each exercise's sets across workouts come back in date order."""
+    squat = history.sets("Squat")
+    assert squat.weights.tolist() == [100, 110, 120]
+    assert squat.reps.tolist() == [5, 5, 3]
+    assert list(squat.dates.astype(str)) == ["2024-01-01T09:00:00", "2024-01-08T09:00:00", "2024-01-08T09:00:00"]
+    assert len(history) == 2 and "Squat" in history and "Deadlift" not in history
+    assert history.names() == ["Squat", "Bench Press"]
+    assert len(history.sets("Deadlift").dates) == 0
+
+def test_last_performed_and_range(history):
+    """Test: last_performed is the newest set and between slices by date, inclusive."""
+    assert history.last_performed("Bench Press") == datetime(2024, 1, 15, 9)
+    assert history.last_performed("Deadlift") is None
+    assert history.between("Squat", date(2024, 1, 8), date(2024, 1, 8)).weights.tolist() == [110, 120]
+    assert history.between("Squat", date(2024, 2, 1), date(2024, 2, 28)).weights.tolist() == []
+
+def test_sessions_summarize_each_workout(history):
+    """Test: sessions has one row per workout with top weight, volume, sets and reps."""
+    sessions = history.sessions("Squat")
+    assert sessions["top_weight"].tolist() == [100, 120]
+    assert sessions["volume"].tolist() == [500, 910]
+    assert sessions["sets"].tolist() == [1, 2]
+    assert history.sessions("Squat", date(2024, 1, 2), date(2024, 1, 31))["reps"].tolist() == [8]
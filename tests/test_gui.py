@@ -15,18 +15,25 @@ class DummyWorkout:
         self.number_of_exercise_sets = number_of_exercise_sets
         self.exercises = exercises or []
 
+def _chart_rows(spec, layer=None):
+    """Inline data rows of a Vega-Lite spec (of one layer, for layered charts)."""
+    chart = spec if layer is None else spec["layer"][layer]
+    return spec["datasets"][chart["data"]["name"]]
+
 def test_load_workouts_file_not_found(monkeypatch):
     """Test: load_workouts returns [] if file does not exist."""
     monkeypatch.setattr(sys, 'argv', ['prog', '/tmp/nonexistent.csv'])
     assert gui.load_workouts() == []
 
 def test_load_workouts_parse_error(monkeypatch):
-    """Test: load_workouts returns [] if parse_csv raises an exception."""
-    def bad_parse_csv(path):
+    """Test: load_workouts returns [] if parsing (through the cache) raises an exception."""
+    def bad_load(path, source=None):
         raise Exception('parse error')
+    import parse_cache
     monkeypatch.setattr(sys, 'argv', ['prog', '/tmp/fake.csv'])
     monkeypatch.setattr(os.path, 'isfile', lambda p: True)
-    monkeypatch.setattr(gui, 'parse_csv', bad_parse_csv)
+    monkeypatch.setattr(parse_cache, 'cache_path', lambda p: '/tmp/fake.parquet')
+    monkeypatch.setattr(parse_cache, 'load_cached', bad_load)
     assert gui.load_workouts() == []
 
 def test_filter_workouts_date_range():
@@ -105,12 +112,41 @@ def test_upload_page_handles_non_csv(monkeypatch):
     monkeypatch.setattr(gui.st, 'success', lambda *a, **k: None)
     monkeypatch.setattr(gui.st, 'error', lambda *a, **k: None)
     monkeypatch.setattr(gui.st, 'info', lambda *a, **k: None)
-    # Patch parse_csv to raise Exception for non-CSV
-    monkeypatch.setattr(gui, 'parse_csv', lambda path: (_ for _ in ()).throw(Exception('bad csv')))
     # Patch os.remove to avoid file errors
     monkeypatch.setattr(os, 'remove', lambda *a, **k: None)
-    # Should not raise
+    # Should not raise; the background parse fails and the error is shown in the sidebar
     gui.main()
+    st.session_state['background_load'].join()
+    errors = []
+    monkeypatch.setattr(gui.st.sidebar, 'error', lambda msg: errors.append(msg))
+    assert gui.poll_background_load() is False
+    assert len(errors) == 1 and errors[0].startswith('An error occurred')
+    assert st.session_state['workouts'] == []
+
+
+def test_upload_page_parses_upload_in_memory(monkeypatch, tmp_path):
+    """Test: the uploaded file object is handed straight to a background parse, with no temp file."""
+    import io
+    import streamlit as st
+    import parse_raw_data as prd
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(tmp_path / "missing.json"))
+    monkeypatch.setattr(st, 'session_state', {})
+    monkeypatch.setattr(gui.st, 'title', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'write', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'button', lambda *a, **k: True)
+    upload = io.BytesIO(b"""Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 09:00:00,Legs,30m,Squat,1,100,5,,
+""")
+    monkeypatch.setattr(gui.st, 'file_uploader', lambda *a, **k: upload)
+    monkeypatch.setattr(gui.st, 'text_input', lambda *a, **k: '')
+    monkeypatch.setattr(gui.st, 'info', lambda *a, **k: None)
+    gui.show_upload_page()
+    load = st.session_state['background_load']
+    assert load.source is upload
+    load.join()
+    monkeypatch.setattr(gui.st.sidebar, 'success', lambda msg: None)
+    gui.poll_background_load()
+    assert [w.name for w in st.session_state['workouts']] == ['Legs']
 
 
 def test_all_pages_display(monkeypatch):
@@ -137,3 +173,323 @@ def test_all_pages_display(monkeypatch):
     monkeypatch.setattr(gui.st, 'file_uploader', lambda *a, **k: None)
     monkeypatch.setattr(gui.st, 'text_input', lambda *a, **k: '')
     gui.main()
+
+
+def test_graphs_page_charts_from_rollups(monkeypatch, tmp_path):
+    """Test: the Graphs page charts daily weight and per-week body-part sets for parsed workouts."""
+    import streamlit as st
+    import parse_raw_data as prd
+    from datetime import date
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(tmp_path / "missing.json"))
+    f = tmp_path / "test.csv"
+    f.write_text("""Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 09:00:00,Legs,30m,Squat,1,100,5,,
+2024-01-08 09:00:00,Legs,30m,Squat,1,110,5,,
+""")
+    workouts = prd.parse_csv(str(f))
+    monkeypatch.setattr(st, 'session_state', {})
+    monkeypatch.setattr(gui.st, 'title', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'subheader', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'date_input', lambda *a, **k: [date(2024, 1, 1), date(2024, 1, 31)])
+    monkeypatch.setattr(gui.st, 'button', lambda *a, **k: False)
+    monkeypatch.setattr(gui.st, 'selectbox', lambda label, options, **k: options[0])
+    charts = []
+    monkeypatch.setattr(gui.st, 'vega_lite_chart', lambda spec, **k: charts.append(spec))
+    gui.show_graphs_page(workouts, date(2024, 1, 1), date(2024, 1, 8))
+    assert [row['value'] for row in _chart_rows(charts[0])] == [100, 110]
+    assert sorted(row['period'] for row in _chart_rows(charts[1])) == ['2024-W1', '2024-W2']
+
+
+def test_team_page_queries_store(monkeypatch, tmp_path):
+    """Test: the Team page is offered when a store exists and renders from SQL queries."""
+    import streamlit as st
+    import parse_raw_data as prd
+    from store import WorkoutStore
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(tmp_path / "missing.json"))
+    db = tmp_path / "workouts.db"
+    with WorkoutStore(str(db)) as store:
+        store.ingest_csv("alice", b"""Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 09:00:00,Legs,30m,Squat,1,100,5,,
+""")
+    monkeypatch.setattr(gui, 'STORE_PATH', str(db))
+    monkeypatch.setattr(st, 'session_state', {'workouts': []})
+    options = {}
+    def fake_sidebar_selectbox(label, opts, index=0):
+        options['nav'] = opts
+        return 'Team'
+    monkeypatch.setattr(gui.st.sidebar, 'selectbox', fake_sidebar_selectbox)
+    monkeypatch.setattr(gui.st, 'selectbox', lambda label, opts, **k: opts[0])
+    monkeypatch.setattr(gui.st, 'title', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'subheader', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'date_input', lambda label, value, **k: value)
+    metrics = {}
+    monkeypatch.setattr(gui.st, 'metric', lambda label, value: metrics.setdefault(label, value))
+    monkeypatch.setattr(gui.st, 'line_chart', lambda *a, **k: None)
+    monkeypatch.setattr(gui.st, 'altair_chart', lambda *a, **k: None)
+    gui.main()
+    assert 'Team' in options['nav']
+    assert metrics['Total weight lifted (lbs)'] == '100'
+
+def test_diagnostics_panel_lists_page_timings(monkeypatch):
+    """Test: with diagnostics toggled on, the sidebar shows the rerun's page stage."""
+    import streamlit as st
+    from datetime import datetime
+    dummy = DummyWorkout(datetime(2024, 1, 1))
+    monkeypatch.setattr(st, 'session_state', {'workouts': [dummy]})
+    monkeypatch.setattr(gui.st.sidebar, 'selectbox', lambda *a, **k: 'Upload Data')
+    monkeypatch.setattr(gui.st.sidebar, 'checkbox', lambda label, *a, **k: label == "Show diagnostics")
+    shown = []
+    monkeypatch.setattr(gui.st.sidebar, 'dataframe', lambda df, **k: shown.append(df))
+    monkeypatch.setattr(gui.st, 'title', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'write', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'text_input', lambda *a, **k: '')
+    monkeypatch.setattr(gui.st, 'file_uploader', lambda *a, **k: None)
+    monkeypatch.setattr(gui.st, 'button', lambda *a, **k: False)
+    gui.main()
+    (table,) = shown
+    assert list(table["stage"]) == ["page:Upload Data"]
+    assert list(table["rows"]) == [1]
+    # Another session gets its own recorder and history
+    monkeypatch.setattr(st, 'session_state', {'workouts': [dummy]})
+    gui.main()
+    assert len(shown[1]) == 1
+
+
+def test_hidden_diagnostics_panel_stops_memory_tracing(monkeypatch):
+    """Test: closing the diagnostics panel turns this session's memory tracing off."""
+    import streamlit as st
+    recorder = gui.Recorder()
+    recorder.set_trace_memory(True)
+    monkeypatch.setattr(st, 'session_state', {'timing_recorder': recorder})
+    monkeypatch.setattr(gui.st.sidebar, 'checkbox', lambda *a, **k: False)
+    gui.show_diagnostics_panel()
+    assert not recorder.trace_memory
+    import tracemalloc
+    assert not tracemalloc.is_tracing()
+
+
+def test_progress_page_charts_exercise_history(monkeypatch, tmp_path):
+    """Test: the Progress page charts the chosen exercise's sessions from the history index."""
+    import streamlit as st
+    import parse_raw_data as prd
+    from datetime import date
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(tmp_path / "missing.json"))
+    workouts = prd.parse_csv(b"""Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 09:00:00,Legs,30m,Squat,1,100,5,,
+2024-01-08 09:00:00,Legs,30m,Squat,1,110,5,,
+2024-01-08 09:00:00,Legs,30m,Lunge,1,40,10,,
+""")
+    monkeypatch.setattr(st, 'session_state', {})
+    monkeypatch.setattr(gui.st, 'title', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'subheader', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'date_input', lambda *a, **k: [date(2024, 1, 1), date(2024, 1, 31)])
+    options = {}
+    monkeypatch.setattr(gui.st, 'selectbox', lambda label, opts, **k: options.setdefault(label, opts)[0])
+    metrics = {}
+    monkeypatch.setattr(gui.st, 'metric', lambda label, value: metrics.setdefault(label, value))
+    charts = []
+    monkeypatch.setattr(gui.st, 'line_chart', lambda data, **k: charts.append(data.tolist()))
+    gui.show_progress_page(workouts, date(2024, 1, 1), date(2024, 1, 8))
+    assert options['Exercise'] == ["Squat", "Lunge"]
+    assert metrics == {"Last performed": "2024-01-08", "Total sets ever": "2"}
+    assert charts == [[100, 110], [500, 550]]
+
+
+def test_graphs_page_shows_pr_timeline(monkeypatch, tmp_path):
+    """Test: the Graphs page charts the selected personal-record type for the date range."""
+    import streamlit as st
+    import parse_raw_data as prd
+    from datetime import date
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(tmp_path / "missing.json"))
+    workouts = prd.parse_csv(b"""Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 09:00:00,Legs,30m,Squat,1,100,5,,
+2024-01-08 09:00:00,Legs,30m,Squat,1,90,5,,
+2024-01-15 09:00:00,Legs,30m,Squat,1,120,5,,
+""")
+    monkeypatch.setattr(st, 'session_state', {})
+    monkeypatch.setattr(gui.st, 'title', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'subheader', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'date_input', lambda *a, **k: [date(2024, 1, 1), date(2024, 1, 31)])
+    monkeypatch.setattr(gui.st, 'button', lambda *a, **k: False)
+    monkeypatch.setattr(gui.st, 'line_chart', lambda *a, **k: None)
+    monkeypatch.setattr(gui.st, 'selectbox',
+                        lambda label, options, **k: "Heaviest weight" if label == "Personal record" else options[0])
+    charts = []
+    monkeypatch.setattr(gui.st, 'vega_lite_chart', lambda spec, **k: charts.append(spec))
+    gui.show_graphs_page(workouts, date(2024, 1, 1), date(2024, 1, 15))
+    timeline = _chart_rows(charts[-1])
+    assert [row["value"] for row in timeline] == [100, 120]
+    assert {row["record"] for row in timeline} == {"weight"}
+
+
+def test_poll_background_load_publishes_partial_workouts(monkeypatch):
+    """Test: while a load runs, its partial workouts are published with a progress bar and cancel button."""
+    import streamlit as st
+    cancelled = []
+    load = types.SimpleNamespace(
+        running=True, status="running", version=2, progress=0.4, rows_read=4000, label="strong.csv",
+        workouts=lambda: ['w1', 'w2'], cancel=lambda: cancelled.append(True))
+    monkeypatch.setattr(st, 'session_state', {'background_load': load, 'background_version': 1})
+    bars = []
+    monkeypatch.setattr(gui.st.sidebar, 'progress', lambda value, text: bars.append((value, text)))
+    monkeypatch.setattr(gui.st.sidebar, 'button', lambda label: label == "Cancel load")
+    assert gui.poll_background_load() is True
+    assert st.session_state['workouts'] == ['w1', 'w2']
+    assert bars == [(0.4, "Loading strong.csv: 4,000 rows read")]
+    assert cancelled == [True]
+    # Later batches are held back until the rows read have doubled, or the load ends
+    load.version, load.rows_read, load.workouts = 3, 6000, lambda: ['w1', 'w2', 'w3']
+    gui.poll_background_load()
+    assert st.session_state['workouts'] == ['w1', 'w2']
+    load.running, load.status = False, "done"
+    monkeypatch.setattr(gui.st.sidebar, 'success', lambda msg: None)
+    assert gui.poll_background_load() is False
+    assert st.session_state['workouts'] == ['w1', 'w2', 'w3']
+
+def test_dataset_window_reads_selected_dates(monkeypatch, tmp_path):
+    """Test: with a dataset open, the sidebar window's sets become the loaded workouts."""
+    import streamlit as st
+    from datetime import date
+    import sets_dataset
+    csv_file = tmp_path / "strong.csv"
+    csv_file.write_text(
+        "Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes\n"
+        "2023-06-01 10:00:00,Old,30m,Squat,1,50,5,,\n"
+        "2024-03-01 10:00:00,New,30m,Squat,1,60,5,,\n")
+    sets_dataset.export_dataset(str(csv_file), str(tmp_path / "dataset"))
+    dataset = sets_dataset.SetsDataset(str(tmp_path / "dataset"))
+    monkeypatch.setattr(st, 'session_state', {'sets_dataset': dataset, 'workouts': []})
+    monkeypatch.setattr(gui.st.sidebar, 'date_input', lambda *a, **k: [date(2024, 1, 1), date(2024, 12, 31)])
+    captions = []
+    monkeypatch.setattr(gui.st.sidebar, 'caption', captions.append)
+    gui.show_dataset_window(dataset)
+    assert [w.name for w in st.session_state['workouts']] == ['New']
+    assert captions == ["1 workouts read from 1 year partition(s)."]
+
+def test_dataset_window_handles_empty_dataset(monkeypatch, tmp_path):
+    """Test: a dataset exported from a header-only CSV shows a message instead of a window picker."""
+    import streamlit as st
+    import sets_dataset
+    csv_file = tmp_path / "strong.csv"
+    csv_file.write_text("Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes\n")
+    sets_dataset.export_dataset(str(csv_file), str(tmp_path / "dataset"))
+    dataset = sets_dataset.SetsDataset(str(tmp_path / "dataset"))
+    monkeypatch.setattr(st, 'session_state', {'sets_dataset': dataset, 'workouts': []})
+    monkeypatch.setattr(gui.st.sidebar, 'date_input', lambda *a, **k: pytest.fail("no window for an empty dataset"))
+    messages = []
+    monkeypatch.setattr(gui.st.sidebar, 'info', messages.append)
+    gui.show_dataset_window(dataset)
+    assert messages == ["The opened dataset has no sets."]
+    assert st.session_state['workouts'] == []
+
+def test_graphs_page_charts_training_load(monkeypatch, tmp_path):
+    """Test: the Graphs page charts the ACWR of the chosen training-load metric and body part."""
+    import streamlit as st
+    import parse_raw_data as prd
+    from datetime import date, timedelta
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(tmp_path / "missing.json"))
+    rows = "".join(f"{date(2024, 1, 1) + timedelta(days=d)} 09:00:00,Legs,30m,Squat,1,100,{5 + d % 3},,\n"
+                   for d in range(0, 60, 2))
+    workouts = prd.parse_csv(
+        ("Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes\n" + rows).encode())
+    monkeypatch.setattr(st, 'session_state', {})
+    monkeypatch.setattr(gui.st, 'title', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'subheader', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'caption', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'date_input', lambda *a, **k: [date(2024, 1, 1), date(2024, 2, 29)])
+    monkeypatch.setattr(gui.st, 'button', lambda *a, **k: False)
+    options = {}
+    monkeypatch.setattr(gui.st, 'selectbox', lambda label, opts, **k: options.setdefault(label, opts)[0])
+    charts = []
+    monkeypatch.setattr(gui.st, 'vega_lite_chart', lambda spec, **k: charts.append(spec))
+    gui.show_graphs_page(workouts, date(2024, 1, 1), date(2024, 2, 29))
+    assert options['Training load body part'] == ['All', 'Unassigned']
+    lines, acwr = _chart_rows(charts[-3]), _chart_rows(charts[-2], layer=1)
+    assert {row["series"] for row in lines} == {"Last 7 days", "Weekly average, last 28 days"}
+    assert len(acwr) == 59 - 27 and all(0.5 < row["acwr"] < 1.5 for row in acwr)
+
+def test_graphs_page_reuses_cached_views(monkeypatch, tmp_path):
+    """Test: re-rendering Graphs for a range already seen builds nothing; a new range misses."""
+    import streamlit as st
+    import parse_raw_data as prd
+    from datetime import date
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(tmp_path / "missing.json"))
+    workouts = prd.parse_csv(b"""Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 09:00:00,Legs,30m,Squat,1,100,5,,
+2024-01-15 09:00:00,Legs,30m,Squat,1,120,5,,
+""")
+    monkeypatch.setattr(st, 'session_state', {})
+    date_range = [date(2024, 1, 1), date(2024, 1, 31)]
+    keys = []
+    def fake_date_input(label, value, key=None):
+        keys.append(key)
+        return date_range
+    for name in ('title', 'subheader', 'caption', 'write', 'vega_lite_chart', 'metric'):
+        monkeypatch.setattr(gui.st, name, lambda *a, **k: None)
+    monkeypatch.setattr(gui.st, 'date_input', fake_date_input)
+    monkeypatch.setattr(gui.st, 'button', lambda *a, **k: False)
+    monkeypatch.setattr(gui.st, 'selectbox', lambda label, options, **k: options[0])
+    gui.show_graphs_page(workouts, date(2024, 1, 1), date(2024, 1, 15))
+    cache = st.session_state['view_cache']
+    misses = cache.misses
+    gui.show_graphs_page(workouts, date(2024, 1, 1), date(2024, 1, 15))
+    assert cache.misses == misses and cache.hits == misses
+    date_range = [date(2024, 1, 1), date(2024, 1, 10)]
+    gui.show_home_page(workouts, date(2024, 1, 1), date(2024, 1, 15))
+    assert cache.misses == misses + 1
+    assert set(keys) == {gui.DATE_RANGE_KEY}
+
+def test_reloaded_dataset_misses_view_cache(monkeypatch, tmp_path):
+    """Test: a reload with identical totals but a different exercise does not reuse cached views."""
+    import streamlit as st
+    import parse_raw_data as prd
+    from datetime import date
+    mapping_file = tmp_path / "mapping.json"
+    mapping_file.write_text('{"Squat": "Quads", "Hip Thrust": "Glutes"}')
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(mapping_file))
+    header = b"Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes\n"
+    squat = prd.parse_csv(header + b"2024-01-01 09:00:00,Legs,30m,Squat,1,100,5,,\n")
+    thrust = prd.parse_csv(header + b"2024-01-01 09:00:00,Legs,30m,Hip Thrust,1,100,5,,\n")
+    monkeypatch.setattr(st, 'session_state', {})
+    day = date(2024, 1, 1)
+    built = []
+    for workouts in (squat, thrust):
+        gui.cached_view(workouts, "Graphs", [day, day], "body_parts",
+                        lambda: built.append(workouts[0].exercises[0].body_part))
+    assert built == [prd.BodyPart.QUADS, prd.BodyPart.GLUTES]
+
+
+def test_import_defers_heavy_libraries():
+    """Test: importing the GUI loads none of pandas, numpy, altair or pyarrow."""
+    import subprocess
+    src = os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))
+    heavy = ("pandas", "numpy", "altair", "pyarrow")
+    code = f"import sys; sys.path.insert(0, {src!r}); import gui; print([m for m in {heavy!r} if m in sys.modules])"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "[]"
+
+def test_home_page_from_cache_builds_no_workouts(monkeypatch, tmp_path):
+    """Test: with the export in the parse cache, the Home page renders from the summary alone."""
+    import streamlit as st
+    import parse_raw_data as prd
+    import parse_cache
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(tmp_path / "missing.json"))
+    monkeypatch.setattr(parse_cache, 'CACHE_DIR', str(tmp_path / "cache"))
+    csv_file = tmp_path / "strong.csv"
+    csv_file.write_text("Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes\n"
+                        "2024-01-01 09:00:00,Legs,30m,Squat,1,100,5,,\n"
+                        "2024-01-03 09:00:00,Legs,30m,Squat,1,110,5,,\n")
+    parse_cache.cached_parse_csv(str(csv_file))
+    monkeypatch.setattr(parse_cache, 'workouts_from_frame', lambda frame: pytest.fail("Workout objects built"))
+    monkeypatch.setattr(sys, 'argv', ['prog', str(csv_file)])
+    monkeypatch.setattr(st, 'session_state', {})
+    monkeypatch.setattr(gui.st.sidebar, 'selectbox', lambda *a, **k: 'Home')
+    monkeypatch.setattr(gui.st.sidebar, 'checkbox', lambda *a, **k: False)
+    monkeypatch.setattr(gui.st, 'title', lambda msg: None)
+    monkeypatch.setattr(gui.st, 'date_input', lambda label, value, **k: value)
+    monkeypatch.setattr(gui.st, 'button', lambda *a, **k: False)
+    metrics = {}
+    monkeypatch.setattr(gui.st, 'metric', lambda label, value: metrics.setdefault(label, value))
+    gui.main()
+    assert metrics['Number of total workouts'] == '2'
+    assert metrics['Total weight lifted (lbs)'] == '210'
@@ -0,0 +1,100 @@
+import pytest
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import parse_raw_data as prd
+import incremental
+
+HEADER = "Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes\n"
+DAY_1 = """2024-01-01 10:00:00,Push,30m,Bench,1,100,5,,
+2024-01-01 10:00:00,Push,30m,Bench,2,100,5,,
+"""
+DAY_2 = """2024-01-02 10:00:00,Legs,45m,Squat,1,150,5,,
+"""
+
+@pytest.fixture(autouse=True)
+def no_mappings(tmp_path, monkeypatch):
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(tmp_path / "missing.json"))
+
+def test_ingest_parses_only_new_tail(tmp_path, monkeypatch):
+    """Test: re-ingesting a cumulative export only parses the appended rows."""
+    export = tmp_path / "strong.csv"
+    export.write_text(HEADER + DAY_1)
+    ingest = incremental.IncrementalIngest()
+    assert len(ingest.ingest(str(export))) == 1
+
+    parsed_rows = []
+    real_parse_rows = incremental.parse_rows
+    def counting_parse_rows(rows, mappings=None):
+        rows = list(rows)
+        parsed_rows.extend(rows)
+        return real_parse_rows(rows, mappings)
+    monkeypatch.setattr(incremental, 'parse_rows', counting_parse_rows)
+
+    export.write_text(HEADER + DAY_1 + DAY_2)
+    new = ingest.ingest(str(export))
+    assert [w.name for w in new] == ['Legs']
+    assert len(parsed_rows) == 1
+    assert [w.name for w in ingest.workouts_list()] == ['Push', 'Legs']
+
+    # Nothing new: nothing parsed
+    assert ingest.ingest(str(export)) == []
+
+def test_ingest_reparses_edited_history(tmp_path):
+    """Test: when the history no longer lines up, everything is reparsed and only later workouts are reported new."""
+    export = tmp_path / "strong.csv"
+    export.write_text(HEADER + DAY_1)
+    ingest = incremental.IncrementalIngest()
+    ingest.ingest(str(export))
+    # An old set edited in Strong, another deleted, and a new workout appended
+    edited = HEADER + "2024-01-01 10:00:00,Push,30m,Bench,1,110,5,,\n" + DAY_2
+    export.write_text(edited)
+    new = ingest.ingest(str(export))
+    assert [w.name for w in new] == ['Legs']
+    push = ingest.workouts[('2024-01-01 10:00:00', 'Push')]
+    assert push.number_of_exercise_sets == 1
+    assert push.total_weight_lifted == 110
+    expected = prd.parse_csv(str(export))
+    assert [(w.name, w.total_weight_lifted) for w in ingest.workouts_list()] == \
+        [(w.name, w.total_weight_lifted) for w in expected]
+    # The rebuilt history is the new baseline for tail-only ingests
+    export.write_text(edited + "2024-01-03 10:00:00,Pull,30m,Row,1,80,8,,\n")
+    assert [w.name for w in ingest.ingest(str(export))] == ['Pull']
+
+def test_ingest_detects_same_length_edit_far_before_tail(tmp_path):
+    """Test: an edit that keeps the byte length, well before the last 4 KiB, still triggers a full re-parse."""
+    export = tmp_path / "strong.csv"
+    filler = "".join(f"2023-01-01 10:00:00,Push,30m,Bench,{i},45,5,,\n" for i in range(1, 200))
+    export.write_text(HEADER + filler + DAY_1)
+    ingest = incremental.IncrementalIngest()
+    ingest.ingest(str(export))
+    export.write_text(HEADER + filler.replace(",45,", ",95,", 1) + DAY_1 + DAY_2)
+    assert len(HEADER + filler) > 4096
+    new = ingest.ingest(str(export))
+    assert [w.name for w in new] == ['Legs']
+    total = sum(w.total_weight_lifted for w in ingest.workouts_list())
+    assert total == sum(w.total_weight_lifted for w in prd.parse_csv(str(export)))
+
+def test_ingest_merges_sets_into_existing_workout(tmp_path):
+    """Test: rows appended for an already ingested workout are merged into it."""
+    export = tmp_path / "strong.csv"
+    export.write_text(HEADER + DAY_1)
+    ingest = incremental.IncrementalIngest()
+    ingest.ingest(str(export))
+    export.write_text(HEADER + DAY_1 + "2024-01-01 10:00:00,Push,30m,Bench,3,100,4,,\n")
+    new = ingest.ingest(str(export))
+    assert len(new) == 1
+    assert new[0].number_of_exercise_sets == 3
+    assert new[0].total_reps_performed == 14
+
+def test_save_and_load_round_trip(tmp_path):
+    """Test: a saved ingest resumes from where it stopped."""
+    export = tmp_path / "strong.csv"
+    export.write_text(HEADER + DAY_1)
+    state = tmp_path / "ingest.pickle"
+    ingest = incremental.IncrementalIngest.load(str(state))
+    ingest.ingest(str(export))
+    ingest.save(str(state))
+    export.write_text(HEADER + DAY_1 + DAY_2)
+    resumed = incremental.IncrementalIngest.load(str(state))
+    assert [w.name for w in resumed.ingest(str(export))] == ['Legs']
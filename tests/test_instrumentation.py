@@ -0,0 +1,96 @@
+import pytest
+import os
+import sys
+import json
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import instrumentation
+
+def test_stage_records_time_rows_and_memory():
+    """Test: a timed block lands in the current run with its row count and memory fields."""
+    recorder = instrumentation.Recorder()
+    recorder.start_run("first")
+    with recorder.stage("parse", rows=3) as record:
+        record["rows"] = 5
+    (run,) = recorder.runs
+    (stage,) = run["stages"]
+    assert stage["stage"] == "parse" and stage["rows"] == 5
+    assert stage["seconds"] >= 0
+    assert "process_peak_rss_mb" in stage and "peak_traced_mb" not in stage
+    if stage["rss_growth_mb"] is not None:
+        assert stage["rss_growth_mb"] >= 0
+
+def test_timed_decorator_counts_result_and_keeps_last_runs():
+    """Test: the decorator counts rows from the result and only the last max_runs runs are kept."""
+    recorder = instrumentation.Recorder(max_runs=2)
+
+    @recorder.timed("load", count=len)
+    def load(n):
+        return list(range(n))
+
+    for n in range(3):
+        recorder.start_run(f"run {n}")
+        assert load(n) == list(range(n))
+    assert [run["run"] for run in recorder.runs] == ["run 1", "run 2"]
+    rows = recorder.stage_rows()
+    assert [(r["run"], r["rows"]) for r in rows] == [("run 2", 2), ("run 1", 1)]
+    assert load.__name__ == "load"
+
+def test_trace_memory_reports_python_peak():
+    """Test: with trace_memory on, stages report the traced allocation peak."""
+    recorder = instrumentation.Recorder()
+    recorder.set_trace_memory(True)
+    with recorder.stage("allocate"):
+        blob = bytearray(4 * 1024 * 1024)
+    del blob
+    recorder.set_trace_memory(False)
+    assert recorder.runs[0]["stages"][0]["peak_traced_mb"] >= 4
+    assert not instrumentation.tracemalloc.is_tracing()
+
+def test_trace_memory_stops_only_when_no_recorder_wants_it():
+    """Test: one recorder turning tracing off leaves it running for another that still traces."""
+    first, second = instrumentation.Recorder(), instrumentation.Recorder()
+    first.set_trace_memory(True)
+    second.set_trace_memory(True)
+    with second.stage("allocate"):
+        first.set_trace_memory(False)
+        blob = bytearray(4 * 1024 * 1024)
+    del blob
+    assert instrumentation.tracemalloc.is_tracing()
+    assert second.runs[0]["stages"][0]["peak_traced_mb"] >= 4
+    second.set_trace_memory(False)
+    assert not instrumentation.tracemalloc.is_tracing()
+
+def test_json_log_writes_one_line_per_stage(tmp_path, monkeypatch):
+    """Test: configure_json_log emits each stage as a JSON line."""
+    monkeypatch.setattr(instrumentation.logger, "handlers", [])
+    log_path = tmp_path / "timings.jsonl"
+    instrumentation.configure_json_log(str(log_path))
+    recorder = instrumentation.Recorder()
+    recorder.start_run("logged")
+    with recorder.stage("filter", rows=7):
+        pass
+    for handler in instrumentation.logger.handlers:
+        handler.close()
+    (line,) = log_path.read_text(encoding="utf-8").splitlines()
+    entry = json.loads(line)
+    assert entry["run"] == "logged" and entry["stage"] == "filter" and entry["rows"] == 7
+
+def test_module_stage_records_into_thread_recorder():
+    """Test: stage / timed record into the recorder picked for the calling thread only."""
+    import threading
+    mine, other = instrumentation.Recorder(), instrumentation.Recorder()
+    instrumentation.use_recorder(mine)
+    try:
+        @instrumentation.timed("count", count=len)
+        def load():
+            return [1, 2]
+        load()
+        worker = threading.Thread(target=lambda: (instrumentation.use_recorder(other), load()))
+        worker.start()
+        worker.join()
+        with instrumentation.stage("filter"):
+            pass
+    finally:
+        instrumentation.use_recorder(instrumentation.DEFAULT_RECORDER)
+    assert [r["stage"] for r in mine.stage_rows()] == ["count", "filter"]
+    assert [r["rows"] for r in other.stage_rows()] == [2]
@@ -0,0 +1,13 @@
+import pytest
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import metrics
+
+def test_home_metrics_formats_totals():
+    """Test: home_metrics labels and formats WorkoutCollection totals like the Home page."""
+    totals = dict.fromkeys(metrics.HOME_METRICS.values(), 0)
+    totals["total_weight_lifted"] = 12345
+    result = metrics.home_metrics(totals)
+    assert list(result) == list(metrics.HOME_METRICS)
+    assert result["Total weight lifted (lbs)"] == "12,345"
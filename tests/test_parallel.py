@@ -0,0 +1,71 @@
+import pytest
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import parse_raw_data as prd
+import parallel
+
+HEADER = "Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes\n"
+
+def _export(num_workouts):
+    lines = [HEADER]
+    for day in range(1, num_workouts + 1):
+        date = f"2024-01-{day:02d} 10:00:00"
+        for exercise in ("Bench", "Squat", "Row"):
+            for s in range(1, 4):
+                # Quoted note with a line break, which must not be taken as a row boundary
+                notes = '"tough\nset, grinded"' if s == 2 else ""
+                lines.append(f"{date},Day {day},45m,{exercise},{s},{day * 5},{s + 4},{notes},\n")
+    return "".join(lines)
+
+def _flatten(workouts):
+    return [
+        (w.name, w.date, w.duration, [
+            (e.name, [(s.set_number, s.weight, s.reps, s.notes) for s in e.exercise_sets])
+            for e in w.exercises
+        ])
+        for w in workouts
+    ]
+
+@pytest.fixture(autouse=True)
+def no_mappings(tmp_path, monkeypatch):
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(tmp_path / "missing.json"))
+
+def test_chunk_ranges_start_at_row_boundaries(tmp_path):
+    """Test: chunk ranges cover the data rows exactly and never split a row."""
+    f = tmp_path / "strong.csv"
+    f.write_text(_export(10))
+    header, ranges = parallel.chunk_ranges(str(f), 7)
+    assert header[0] == "Date"
+    assert ranges[0][0] == len(HEADER) and ranges[-1][1] == os.path.getsize(f)
+    data = f.read_bytes()
+    for (start, end), (next_start, _) in zip(ranges, ranges[1:]):
+        assert end == next_start
+        assert data[start - 1:start] == b"\n" and data[start:start + 4] == b"2024"
+
+def test_parse_csv_parallel_matches_serial(tmp_path):
+    """Test: parallel parsing stitches chunks back into exactly the serial result."""
+    f = tmp_path / "strong.csv"
+    f.write_text(_export(20))
+    expected = prd.parse_csv(str(f))
+    result = parallel.parse_csv_parallel(str(f), max_workers=2, num_chunks=13)
+    assert _flatten(result) == _flatten(expected)
+    assert [w.total_weight_lifted for w in result] == [w.total_weight_lifted for w in expected]
+
+def test_parse_directory(tmp_path):
+    """Test: parse_directory parses every CSV export in a directory."""
+    (tmp_path / "alice.csv").write_text(_export(2))
+    (tmp_path / "bob.csv").write_text(_export(3))
+    (tmp_path / "readme.txt").write_text("ignored")
+    result = parallel.parse_directory(str(tmp_path), max_workers=2)
+    assert sorted(result) == ["alice.csv", "bob.csv"]
+    assert len(result["bob.csv"]) == 3
+
+def test_read_sets_frame_parallel_matches_serial(tmp_path):
+    """Test: the parallel columnar reader returns the same frame as read_sets_frame."""
+    import columnar
+    f = tmp_path / "strong.csv"
+    f.write_text(_export(20))
+    expected = columnar.read_sets_frame(str(f), mappings={})
+    result = parallel.read_sets_frame_parallel(str(f), max_workers=2, num_chunks=5)
+    assert result.equals(expected)
@@ -0,0 +1,94 @@
+import pytest
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import parse_raw_data as prd
+import parse_cache
+
+CSV_CONTENT = """Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 10:00:00,Test,30m,Pushup,1,0,10,,
+2024-01-01 10:00:00,Test,30m,Squat,1,50,8,,
+"""
+
+@pytest.fixture
+def mapping_file(tmp_path, monkeypatch):
+    path = tmp_path / "mapping.json"
+    path.write_text('{"Squat": "Quads"}')
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(path))
+    return path
+
+def test_cache_hit_skips_parsing(tmp_path, mapping_file, monkeypatch):
+    """Test: a second load of the same CSV comes from the cache, not the parser."""
+    csv_file = tmp_path / "strong.csv"
+    csv_file.write_text(CSV_CONTENT)
+    cache_dir = tmp_path / "cache"
+    first = parse_cache.cached_parse_csv(str(csv_file), cache_dir=str(cache_dir))
+    # The sets frame and its per-workout summary
+    assert len(os.listdir(cache_dir)) == 2
+
+    def fail(*a, **k):
+        raise AssertionError('should not reparse')
+    monkeypatch.setattr(parse_cache, 'read_sets_frame', fail)
+    second = parse_cache.cached_parse_csv(str(csv_file), cache_dir=str(cache_dir))
+    assert [w.total_weight_lifted for w in second] == [w.total_weight_lifted for w in first]
+    assert second[0].get_exercise('Squat').body_part is prd.BodyPart.QUADS
+
+def test_load_cached_defers_workout_objects(tmp_path, mapping_file, monkeypatch):
+    """Test: a hit gives the count and Home totals from the summary; objects are built on first iteration."""
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../benchmarks')))
+    from synthetic import write_export
+    from workout_collection import WorkoutCollection
+    export = write_export(str(tmp_path / "strong.csv"), 3000, seed=4)
+    cache_dir = str(tmp_path / "cache")
+    entry = parse_cache.cache_path(export, cache_dir)
+    assert parse_cache.load_cached(entry) is None
+    parse_cache.cached_parse_csv(export, cache_dir=cache_dir)
+
+    built = []
+    real_build = parse_cache.workouts_from_frame
+    monkeypatch.setattr(parse_cache, 'workouts_from_frame', lambda frame: built.append(1) or real_build(frame))
+    cached = parse_cache.load_cached(entry, export)
+    expected = WorkoutCollection(prd.parse_csv(export))
+    collection = cached.collection()
+    assert len(cached) == len(expected)
+    assert (collection.min_date, collection.max_date) == (expected.min_date, expected.max_date)
+    start, end = expected.days[len(expected) // 3], expected.days[-10]
+    got, want = collection.totals(start, end), expected.totals(start, end)
+    assert got == pytest.approx(want)
+    assert built == []
+
+    # Objects (and between) come from the sets frame, in the same order as parse_csv
+    assert [w.date for w in collection.between(start, end)] == [w.date for w in expected.between(start, end)]
+    assert cached[0].date == prd.parse_csv(export)[0].date
+    assert built == [1]
+
+def test_load_cached_falls_back_to_source_when_frame_evicted(tmp_path, mapping_file):
+    """Test: if the sets frame is evicted after the summary was read, the objects come from the CSV."""
+    csv_file = tmp_path / "strong.csv"
+    csv_file.write_text(CSV_CONTENT)
+    cache_dir = str(tmp_path / "cache")
+    parse_cache.cached_parse_csv(str(csv_file), cache_dir=cache_dir)
+    entry = parse_cache.cache_path(str(csv_file), cache_dir)
+    cached = parse_cache.load_cached(entry, str(csv_file))
+    os.remove(entry)
+    assert [w.total_weight_lifted for w in cached] == [50]
+
+def test_cache_invalidated_by_csv_or_mapping_change(tmp_path, mapping_file):
+    """Test: editing the export or the mapping file produces a new cache key."""
+    csv_file = tmp_path / "strong.csv"
+    csv_file.write_text(CSV_CONTENT)
+    key = parse_cache.cache_key(str(csv_file))
+    mapping_file.write_text('{"Squat": "Glutes"}')
+    mapping_key = parse_cache.cache_key(str(csv_file))
+    assert mapping_key != key
+    csv_file.write_text(CSV_CONTENT + "2024-01-02 10:00:00,Test,30m,Squat,1,55,8,,\n")
+    assert parse_cache.cache_key(str(csv_file)) not in (key, mapping_key)
+
+def test_evict_removes_least_recently_used(tmp_path):
+    """Test: evict deletes the oldest entries until the cache fits the size bound."""
+    for i, name in enumerate(["old", "mid", "new"]):
+        path = tmp_path / (name + parse_cache.CACHE_SUFFIX)
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (1000 + i, 1000 + i))
+    parse_cache.evict(str(tmp_path), max_bytes=250)
+    assert sorted(os.listdir(tmp_path)) == ["mid.parquet", "new.parquet"]
@@ -88,3 +88,148 @@ def test_main_flow(monkeypatch, tmp_path):
     prd.save_mappings(mapping_dict)
     # Check that the mapping file was written
     assert mapping_file.read_text() == 'saved'
+
+def test_workout_exercise_index():
+    """Test: Workout.get_exercise finds exercises by name, including ones appended directly."""
+    w = prd.Workout('Test', prd.datetime(2024, 1, 1, 10, 0, 0), 30)
+    squat = w.add_exercise(prd.Exercise('Squat'))
+    assert w.get_exercise('Squat') is squat
+    assert w.get_exercise('Bench') is None
+    bench = prd.Exercise('Bench')
+    w.exercises.append(bench)
+    assert w.get_exercise('Bench') is bench
+
+def test_parse_csv_resolves_body_parts(tmp_path, monkeypatch):
+    """Test: parse_csv maps exercise names to BodyPart members via the JSON mapping."""
+    mapping_file = tmp_path / "mapping.json"
+    mapping_file.write_text('{"Squat": "Quads"}')
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(mapping_file))
+    csv_content = """Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 10:00:00,Test,30m,Squat,1,50,8,,
+2024-01-01 10:00:00,Test,30m,Pushup,1,0,10,,
+"""
+    f = tmp_path / "test.csv"
+    f.write_text(csv_content)
+    w = prd.parse_csv(str(f))[0]
+    assert w.get_exercise('Squat').body_part is prd.BodyPart.QUADS
+    assert w.get_exercise('Pushup').body_part is None
+
+def test_workout_totals_track_added_sets(tmp_path):
+    """Test: Workout/Exercise aggregates stay correct when sets are added after parsing."""
+    csv_content = """Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 10:00:00,Test,30m,Squat,1,50,8,,
+"""
+    f = tmp_path / "test.csv"
+    f.write_text(csv_content)
+    w = prd.parse_csv(str(f))[0]
+    squat = w.get_exercise('Squat')
+    later = prd.datetime(2024, 1, 1, 10, 20, 0)
+    squat.add_set(prd.ExerciseSet('Test', later, 2, 60, 5))
+    w.add_set('Bench', prd.ExerciseSet('Test', later, 1, 40, 10))
+    assert w.number_of_exercises == 2
+    assert w.number_of_exercise_sets == 3
+    assert w.total_weight_lifted == 50 + 60 + 40
+    assert w.total_reps_performed == 8 + 5 + 10
+    assert squat.last_performed == later
+    # Exercises built up before being attached are folded into the totals
+    deadlift = prd.Exercise('Deadlift')
+    deadlift.add_set(prd.ExerciseSet('Test', later, 1, 100, 3))
+    w.add_exercise(deadlift)
+    assert w.total_weight_lifted == 250
+    assert w.number_of_exercise_sets == 4
+
+def test_iter_workouts_yields_contiguous_blocks(tmp_path):
+    """Test: iter_workouts yields one finished workout per contiguous block of rows."""
+    csv_content = """Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 10:00:00,Push,30m,Bench,1,100,5,,
+2024-01-01 10:00:00,Push,30m,Bench,2,100,5,,
+2024-01-02 10:00:00,Legs,45m,Squat,1,150,5,,
+"""
+    f = tmp_path / "test.csv"
+    f.write_text(csv_content)
+    stream = prd.iter_workouts(str(f))
+    first = next(stream)
+    assert first.name == 'Push' and first.number_of_exercise_sets == 2
+    assert [w.name for w in stream] == ['Legs']
+
+def test_parse_csv_accepts_streams_and_bytes():
+    """Test: parse_csv parses text streams, bytes and binary streams without a file on disk."""
+    import io
+    csv_content = """Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 10:00:00,Test,30m,Squat,1,50,8,"two
+lines",
+"""
+    sources = [
+        io.StringIO(csv_content),
+        csv_content.encode("utf-8"),
+        io.BytesIO(csv_content.encode("utf-8")),
+    ]
+    for source in sources:
+        workouts = prd.parse_csv(source)
+        assert len(workouts) == 1
+        assert workouts[0].total_weight_lifted == 50
+        assert workouts[0].exercises[0].exercise_sets[0].notes == "two\nlines"
+    # Binary streams are left open for the caller
+    assert not sources[2].closed
+
+def test_parse_rows_parses_workout_fields_once_per_group(monkeypatch):
+    """Test: date and duration are parsed once per row group, and interleaved groups still merge."""
+    memoized = prd.parse_date
+    assert memoized("2024-01-01 10:00:00") is memoized("2024-01-01 10:00:00")
+    calls = []
+    monkeypatch.setattr(prd, 'parse_date', lambda s: calls.append(s) or prd.datetime.strptime(s, "%Y-%m-%d %H:%M:%S"))
+    rows = [
+        {"Date": "2024-01-01 10:00:00", "Workout Name": "A", "Duration": "1h 5m", "Exercise Name": "Squat",
+         "Set Order": str(i), "Weight": "100", "Reps": "5", "Notes": "", "Workout Notes": ""}
+        for i in range(1, 4)
+    ]
+    rows.append(dict(rows[0], **{"Date": "2024-01-02 10:00:00", "Workout Name": "B"}))
+    rows.append(dict(rows[0], **{"Set Order": "4"}))
+    workouts = prd.parse_rows(rows, mappings={})
+    assert calls == ["2024-01-01 10:00:00", "2024-01-02 10:00:00", "2024-01-01 10:00:00"]
+    first = workouts[("2024-01-01 10:00:00", "A")]
+    assert first.duration == 65 and first.number_of_exercise_sets == 4
+    assert workouts[("2024-01-02 10:00:00", "B")].number_of_exercise_sets == 1
+
+def test_model_classes_use_slots(tmp_path, monkeypatch):
+    """Test: parsed objects have no per-instance __dict__ and share repeated strings."""
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(tmp_path / "missing.json"))
+    workouts = prd.parse_csv(b"""Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 09:00:00,Legs,30m,Squat,1,100,5,Felt strong,
+2024-01-01 09:00:00,Legs,30m,Squat,2,100,5,Felt strong,
+2024-01-02 09:00:00,Legs,30m,Squat,1,100,5,,
+""")
+    first, second = workouts
+    sets = first.exercises[0].exercise_sets
+    for obj in (first, first.exercises[0], sets[0]):
+        assert not hasattr(obj, '__dict__')
+    assert first.name is second.name
+    assert sets[0].notes is sets[1].notes
+    assert sets[0].workout is first.name
+
+def test_exercise_add_sets_updates_totals():
+    """Test: add_sets appends a batch of sets and folds it into the exercise and workout totals."""
+    w = prd.Workout('Test', prd.datetime(2024, 1, 1, 10, 0, 0), 30)
+    squat = prd.Exercise('Squat')
+    w.add_exercise(squat)
+    early, late = prd.datetime(2024, 1, 1, 10, 5, 0), prd.datetime(2024, 1, 1, 10, 20, 0)
+    squat.add_sets([prd.ExerciseSet('Test', late, 1, 50, 8), prd.ExerciseSet('Test', early, 2, 60, 5)])
+    assert squat.last_performed == late
+    assert w.number_of_exercise_sets == 2
+    assert w.total_weight_lifted == 110
+    assert w.total_reps_performed == 13
+
+def test_gc_paused_restores_collector_state():
+    """Test: gc_paused turns the collector off inside the block and back to its previous state after."""
+    import gc
+    assert gc.isenabled()
+    with prd.gc_paused():
+        assert not gc.isenabled()
+    assert gc.isenabled()
+    gc.disable()
+    try:
+        with prd.gc_paused():
+            pass
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
@@ -0,0 +1,61 @@
+import pytest
+import os
+import sys
+from datetime import date
+import numpy as np
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import parse_raw_data as prd
+import records
+
+HEADER = "Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes\n"
+FIRST = HEADER + """2024-01-01 09:00:00,Legs,30m,Squat,1,100,5,,
+2024-01-01 09:00:00,Legs,30m,Squat,2,100,6,,
+2024-01-08 09:00:00,Legs,30m,Squat,1,110,3,,
+2024-01-08 09:00:00,Legs,30m,Squat,2,100,4,,
+"""
+LATER = HEADER + """2024-01-15 09:00:00,Legs,30m,Squat,1,100,8,,
+2024-01-15 09:00:00,Legs,30m,Squat,2,120,1,,
+"""
+
+@pytest.fixture(autouse=True)
+def no_mappings(tmp_path, monkeypatch):
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(tmp_path / "missing.json"))
+
+def test_one_rep_max_formulas():
+    """Test: Epley and Brzycki estimates, with one rep equal to the weight and zero reps to 0."""
+    assert records.epley([100, 100, 100], [10, 1, 0]).tolist() == pytest.approx([133.33, 100, 0], abs=0.01)
+    assert records.brzycki([100, 100, 100], [10, 1, 40]).tolist() == pytest.approx([133.33, 100, 0], abs=0.01)
+
+def test_timeline_and_bests():
+    """Test: the timeline lists each day's record sets and the running bests are kept."""
+    prs = records.PersonalRecords.from_workouts(prd.parse_csv(FIRST.encode()))
+    weight = prs.timeline[prs.timeline["record"] == "weight"]
+    assert weight["value"].tolist() == [100, 110]
+    reps = prs.timeline[prs.timeline["record"] == "reps"]
+    # Day one: 6 reps at 100 (best of the day); day two: first set at 110; 4 reps at 100 is no PR
+    assert list(zip(reps["weight"], reps["reps"])) == [(100, 6), (110, 3)]
+    assert prs.best("Squat", "weight") == 110
+    assert prs.best("Squat", "volume") == 600
+    assert prs.best("Squat") == 121.0
+    assert prs.best("Squat", "reps") == {100: 6, 110: 3}
+    assert prs.best("Deadlift") is None and prs.best("Deadlift", "reps") == {}
+
+def test_update_matches_full_build():
+    """Test: folding in later workouts gives the same bests and timeline as building from all of them."""
+    prs = records.PersonalRecords.from_workouts(prd.parse_csv(FIRST.encode()))
+    new_events = prs.update(prd.parse_csv(LATER.encode()))
+    assert sorted(new_events["record"]) == ["e1rm", "reps", "reps", "volume", "weight"]
+    full = records.PersonalRecords.from_workouts(prd.parse_csv((FIRST + LATER[len(HEADER):]).encode()))
+    assert prs.timeline.equals(full.timeline)
+    for record in records.RECORD_TYPES:
+        assert prs.bests[record].sort_index().equals(full.bests[record].sort_index())
+    with pytest.raises(ValueError):
+        prs.update(prd.parse_csv(FIRST.encode()))
+
+def test_between_filters_dates_and_record():
+    """Test: between returns events in the inclusive date range, optionally of one type."""
+    prs = records.PersonalRecords.from_workouts(prd.parse_csv(FIRST.encode()))
+    week_two = prs.between(date(2024, 1, 8), date(2024, 1, 8), record="weight")
+    assert week_two["value"].tolist() == [110]
+    assert prs.between(date(2024, 2, 1), date(2024, 2, 2)).empty
+    assert records.PersonalRecords.from_workouts([]).between(date(2024, 1, 1), date(2024, 1, 2)).empty
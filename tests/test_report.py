@@ -0,0 +1,64 @@
+import pytest
+import json
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import parse_raw_data as prd
+import report
+
+HEADER = "Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes\n"
+
+def _export(days, weight):
+    rows = [f"2024-{1 + d // 28:02d}-{1 + d % 28:02d} 09:00:00,Legs,30m,Squat,1,{weight + d},5,,\n"
+            for d in range(0, days, 2)]
+    return HEADER + "".join(rows)
+
+@pytest.fixture
+def exports(tmp_path, monkeypatch):
+    mapping_file = tmp_path / "mapping.json"
+    mapping_file.write_text('{"Squat": "Quads"}')
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(mapping_file))
+    exports_dir = tmp_path / "exports"
+    exports_dir.mkdir()
+    (exports_dir / "alice.csv").write_text(_export(60, 100))
+    (exports_dir / "bob.csv").write_text(_export(10, 50))
+    (exports_dir / "broken.csv").write_text("not,a,strong,export\n1,2,3,4\n")
+    (exports_dir / "notes.txt").write_text("ignored")
+    return str(exports_dir)
+
+def test_run_reports_writes_summary_and_charts(exports, tmp_path):
+    """Test: each export gets a summary.json and HTML charts; a bad export is recorded, not raised."""
+    out = str(tmp_path / "out")
+    statuses = report.run_reports(exports, out, max_workers=1)
+    assert [(s["athlete"], s["status"]) for s in statuses] == [
+        ("alice", "ok"), ("bob", "ok"), ("broken", "failed")]
+    with open(os.path.join(out, "index.json"), encoding="utf-8") as f:
+        assert json.load(f) == statuses
+
+    with open(os.path.join(out, "alice", "summary.json"), encoding="utf-8") as f:
+        summary = json.load(f)
+    assert summary["totals"]["workouts"] == 30
+    assert summary["home_metrics"]["Number of total workouts"] == "30"
+    assert summary["first_workout"] == "2024-01-01"
+    assert summary["personal_records"]["weight"] == {"Squat": 158}
+    assert summary["body_part_sets"]["period"] == "week"
+    assert summary["training_load"]["Quads"]["volume"]["acute"] == 3
+    assert sorted(os.listdir(os.path.join(out, "alice"))) == [
+        "body_part_sets.html", "personal_records.html", "summary.json",
+        "training_load.html", "weight_over_time.html"]
+
+def test_run_reports_in_process_pool(exports, tmp_path):
+    """Test: the pool produces the same summaries as reporting serially."""
+    serial, pooled = str(tmp_path / "serial"), str(tmp_path / "pooled")
+    report.run_reports(exports, serial, max_workers=1)
+    statuses = report.run_reports(exports, pooled, max_workers=2)
+    assert [s["status"] for s in statuses] == ["ok", "ok", "failed"]
+    for athlete in ("alice", "bob"):
+        with open(os.path.join(serial, athlete, "summary.json"), encoding="utf-8") as a, \
+                open(os.path.join(pooled, athlete, "summary.json"), encoding="utf-8") as b:
+            assert json.load(a) == json.load(b)
+
+def test_run_reports_rejects_unknown_chart_format(exports, tmp_path):
+    """Test: only html and png charts can be written."""
+    with pytest.raises(ValueError):
+        report.run_reports(exports, str(tmp_path / "out"), chart_format="svg")
@@ -0,0 +1,47 @@
+import pytest
+import os
+import sys
+from datetime import date
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import parse_raw_data as prd
+from rollups import Rollups
+
+CSV_CONTENT = """Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 09:00:00,Legs,30m,Squat,1,100,5,,
+2024-01-01 09:00:00,Legs,30m,Squat,2,100,5,,
+2024-01-01 18:00:00,Arms,20m,Curl,1,20,10,,
+2024-01-09 09:00:00,Legs,40m,Squat,1,110,5,,
+2024-02-02 09:00:00,Legs,40m,Lunge,1,30,8,,
+"""
+
+@pytest.fixture
+def rollups(tmp_path, monkeypatch):
+    mapping_file = tmp_path / "mapping.json"
+    mapping_file.write_text('{"Squat": "Quads", "Curl": "Biceps"}')
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(mapping_file))
+    f = tmp_path / "test.csv"
+    f.write_text(CSV_CONTENT)
+    return Rollups(prd.parse_csv(str(f)))
+
+def test_daily_totals_sliced_by_date(rollups):
+    """Test: daily totals combine same-day workouts and respect inclusive date bounds."""
+    daily = rollups.daily_totals(date(2024, 1, 1), date(2024, 1, 9))
+    assert daily["total_weight_lifted"].tolist() == [220, 110]
+    assert daily["workouts"].tolist() == [2, 1]
+    assert rollups.daily_totals(date(2024, 3, 1), date(2024, 3, 31)).empty
+
+def test_body_part_sets_by_week(rollups):
+    """Test: weekly set counts per body part match the Graphs page's ISO week labels."""
+    weekly = rollups.body_part_sets(date(2024, 1, 1), date(2024, 12, 31), "week")
+    rows = set(map(tuple, weekly[["period", "body_part", "sets_count"]].values.tolist()))
+    assert rows == {
+        ("2024-W1", "Quads", 2), ("2024-W1", "Biceps", 1),
+        ("2024-W2", "Quads", 1), ("2024-W5", "Unassigned", 1),
+    }
+
+def test_coarser_granularities(rollups):
+    """Test: month and year views are grouped from the daily rollups."""
+    monthly = rollups.body_part_sets(date(2024, 1, 1), date(2024, 12, 31), "month")
+    assert monthly.groupby("period")["sets_count"].sum().to_dict() == {"2024-01": 4, "2024-02": 1}
+    yearly = rollups.totals(date(2024, 1, 1), date(2024, 12, 31), "year")
+    assert yearly.loc["2024", "duration"] == 30 + 20 + 40 + 40
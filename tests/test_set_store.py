@@ -0,0 +1,60 @@
+import pytest
+import os
+import sys
+from datetime import datetime
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import parse_raw_data as prd
+from exercise_history import ExerciseHistory
+from set_store import SetStore, StoredSets, compact
+
+CSV = b"""Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 09:00:00,Legs,30m,Squat,1,100,5,Felt strong,
+2024-01-01 09:00:00,Legs,30m,Squat,2,110,3,,
+2024-01-01 09:00:00,Legs,30m,Lunge,1,40,10,Felt strong,
+2024-01-03 18:30:15,Push,45m,Bench Press,1,80,8,,
+"""
+
+@pytest.fixture
+def workouts(tmp_path, monkeypatch):
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(tmp_path / "missing.json"))
+    return prd.parse_csv(CSV)
+
+def _sets(workouts):
+    return [(s.workout, s.date, s.set_number, s.weight, s.reps, s.notes)
+            for w in workouts for e in w.exercises for s in e.exercise_sets]
+
+def test_compact_keeps_the_set_api(workouts):
+    """Test: after compact(), sets read back with the same attributes and totals are unchanged."""
+    before = _sets(workouts)
+    totals = [(w.number_of_exercise_sets, w.total_weight_lifted) for w in workouts]
+    store = compact(workouts)
+    assert isinstance(workouts[0].exercises[0].exercise_sets, StoredSets)
+    assert _sets(workouts) == before
+    assert [(w.number_of_exercise_sets, w.total_weight_lifted) for w in workouts] == totals
+    assert len(store) == 4 and store.notes == ["Felt strong", ""]
+    assert store.nbytes() == 4 * (8 + 4 + 8 + 4 + 4)
+
+def test_stored_sets_index_and_slice(workouts):
+    """Test: StoredSets supports len, indexing (negative too) and slices."""
+    compact(workouts)
+    squat = workouts[0].get_exercise("Squat").exercise_sets
+    assert len(squat) == 2
+    assert squat[-1].weight == 110 and squat[0].notes == "Felt strong"
+    assert [s.set_number for s in squat[0:2]] == [1, 2]
+    assert workouts[1].exercises[0].exercise_sets[0].date == datetime(2024, 1, 3, 18, 30, 15)
+    with pytest.raises(IndexError):
+        squat[2]
+
+def test_adding_to_compacted_exercise(workouts):
+    """Test: add_set on a compacted exercise materializes a list and keeps totals current."""
+    compact(workouts)
+    legs = workouts[0]
+    legs.add_set("Squat", prd.ExerciseSet("Legs", legs.date, 3, 120, 2))
+    assert [s.weight for s in legs.get_exercise("Squat").exercise_sets] == [100, 110, 120]
+    assert legs.number_of_exercise_sets == 4
+
+def test_history_from_compacted_workouts(workouts):
+    """Test: derived indexes build the same from compacted workouts."""
+    expected = ExerciseHistory(workouts).sets("Squat").weights.tolist()
+    compact(workouts)
+    assert ExerciseHistory(workouts).sets("Squat").weights.tolist() == expected
@@ -0,0 +1,79 @@
+import pytest
+import os
+import sys
+from datetime import date
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import parse_raw_data as prd
+import columnar
+import sets_dataset
+
+CSV_CONTENT = """Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2023-12-30 10:00:00,Test,1h 5m,Pushup,1,0,10,,Morning
+2023-12-30 10:00:00,Test,1h 5m,Squat,1,52.5,8,,Morning
+2024-01-03 18:30:00,Legs,45m,Squat,1,60,5,,
+2024-01-03 18:30:00,Legs,45m,Squat,2,60,4,Heavy,
+2025-02-01 09:00:00,Push,30m,Pushup,1,0,20,,
+"""
+
+@pytest.fixture
+def export(tmp_path):
+    f = tmp_path / "strong.csv"
+    f.write_text(CSV_CONTENT)
+    return str(f)
+
+@pytest.mark.parametrize("file_format", ["arrow", "parquet"])
+def test_export_round_trip(export, tmp_path, file_format):
+    """Test: reading the whole dataset gives the same frame as read_sets_frame."""
+    out = str(tmp_path / "dataset")
+    metadata = sets_dataset.export_dataset(export, out, file_format, {"Squat": "Quads"})
+    assert metadata["rows"] == 5
+    assert sorted(os.listdir(out)) == ["_strong_dataset.json", "year=2023", "year=2024", "year=2025"]
+    dataset = sets_dataset.SetsDataset(out)
+    assert len(dataset) == 5
+    assert (dataset.min_date, dataset.max_date) == (date(2023, 12, 30), date(2025, 2, 1))
+    frame = dataset.frame(dataset.min_date, dataset.max_date)
+    expected = columnar.read_sets_frame(export, {"Squat": "Quads"})
+    assert list(frame.columns) == list(expected.columns)
+    assert frame["date"].tolist() == expected["date"].tolist()
+    assert frame["exercise_name"].tolist() == expected["exercise_name"].tolist()
+    assert frame["weight"].tolist() == expected["weight"].tolist()
+    assert frame["body_part"].tolist() == expected["body_part"].tolist()
+
+def test_window_reads_only_overlapping_years(export, tmp_path):
+    """Test: a date window opens only its years' partitions and returns only its rows."""
+    out = str(tmp_path / "dataset")
+    sets_dataset.export_dataset(export, out)
+    dataset = sets_dataset.SetsDataset(out)
+    files = dataset.files_for(date(2024, 1, 1), date(2024, 12, 31))
+    assert len(files) == 1 and "year=2024" in files[0]
+    frame = dataset.frame(date(2024, 1, 3), date(2024, 1, 3))
+    assert len(frame) == 2 and set(frame["workout_name"]) == {"Legs"}
+    assert len(dataset.frame(date(2023, 12, 31), date(2024, 1, 2))) == 0
+
+def test_workouts_from_dataset_window(export, tmp_path):
+    """Test: a window's frame converts to the same workouts as parsing those rows."""
+    out = str(tmp_path / "dataset")
+    sets_dataset.export_dataset(export, out)
+    frame = sets_dataset.SetsDataset(out).frame(date(2023, 1, 1), date(2024, 6, 30))
+    workouts = columnar.workouts_from_frame(frame)
+    assert [(w.name, w.number_of_exercise_sets) for w in workouts] == [("Test", 2), ("Legs", 2)]
+
+def test_is_dataset(export, tmp_path):
+    """Test: only directories written by export_dataset count as datasets."""
+    out = str(tmp_path / "dataset")
+    assert not sets_dataset.is_dataset(out)
+    assert not sets_dataset.is_dataset(export)
+    sets_dataset.export_dataset(export, out)
+    assert sets_dataset.is_dataset(out)
+
+def test_export_cli(export, tmp_path, monkeypatch, capsys):
+    """Test: the `export` command writes a dataset in the chosen format."""
+    mapping_file = tmp_path / "mapping.json"
+    mapping_file.write_text('{"Squat": "Quads"}')
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(mapping_file))
+    out = str(tmp_path / "dataset")
+    metadata = prd.export_cli([export, out, "--format", "parquet"])
+    assert metadata["format"] == "parquet"
+    assert "Wrote 5 sets" in capsys.readouterr().out
+    dataset = sets_dataset.SetsDataset(out)
+    assert "Quads" in dataset.frame(dataset.min_date, dataset.max_date)["body_part"].tolist()
@@ -0,0 +1,61 @@
+import pytest
+import os
+import sys
+from datetime import date
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import parse_raw_data as prd
+from store import WorkoutStore
+
+ALICE = """Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-01 09:00:00,Legs,30m,Squat,1,100,5,,
+2024-01-01 09:00:00,Legs,30m,Squat,2,100,5,deep,
+2024-01-01 09:00:00,Legs,30m,Curl,1,20,10,,
+2024-01-09 09:00:00,Legs,40m,Squat,1,110,5,,
+"""
+BOB = """Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes
+2024-01-02 18:00:00,Push,50m,Bench,1,80,8,,Tired
+"""
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    mapping_file = tmp_path / "mapping.json"
+    mapping_file.write_text('{"Squat": "Quads", "Bench": "Pecs"}')
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(mapping_file))
+    with WorkoutStore(str(tmp_path / "workouts.db")) as s:
+        s.ingest_csv("alice", ALICE.encode("utf-8"))
+        s.ingest_csv("bob", BOB.encode("utf-8"))
+        yield s
+
+def test_metrics_per_athlete_and_team(store):
+    """Test: date-filtered metrics match per athlete and across the whole team."""
+    assert store.athletes() == ["alice", "bob"]
+    alice = store.metrics(date(2024, 1, 1), date(2024, 1, 31), athlete="alice")
+    assert alice == {
+        "workouts": 2, "duration": 70, "total_weight_lifted": 330,
+        "total_reps_performed": 25, "number_of_exercises": 3, "number_of_exercise_sets": 4,
+    }
+    team = store.metrics(date(2024, 1, 1), date(2024, 1, 2))
+    assert team["workouts"] == 2 and team["total_weight_lifted"] == 300
+    assert store.date_bounds("bob") == (date(2024, 1, 2), date(2024, 1, 2))
+
+def test_weekly_body_part_sets_for_team(store):
+    """Test: weekly set counts by body part aggregate across athletes."""
+    rows = store.weekly_body_part_sets(date(2024, 1, 1), date(2024, 1, 31))
+    assert set(rows) == {
+        ("2024-W1", "Quads", 2), ("2024-W1", "Unassigned", 1),
+        ("2024-W1", "Pecs", 1), ("2024-W2", "Quads", 1),
+    }
+    assert store.daily_weight(date(2024, 1, 1), date(2024, 1, 31), athlete="alice") == [
+        ("2024-01-01", 220), ("2024-01-09", 110)]
+
+def test_reingest_replaces_and_round_trips(store, tmp_path):
+    """Test: loading an athlete again replaces their rows, and objects round-trip."""
+    store.ingest_csv("alice", ALICE.encode("utf-8"))
+    workouts = store.load_workouts("alice")
+    expected = prd.parse_csv(ALICE.encode("utf-8"))
+    assert [(w.name, w.date, w.total_weight_lifted) for w in workouts] == \
+        [(w.name, w.date, w.total_weight_lifted) for w in expected]
+    squat = workouts[0].get_exercise("Squat")
+    assert squat.body_part is prd.BodyPart.QUADS
+    assert [s.notes for s in squat.exercise_sets] == ["", "deep"]
+    assert store.metrics(date(2024, 1, 1), date(2024, 12, 31))["workouts"] == 3
@@ -0,0 +1,75 @@
+import pytest
+import os
+import sys
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import numpy as np
+import pandas as pd
+import parse_raw_data as prd
+from training_load import ALL, TrainingLoad, daily_load
+
+HEADER = "Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Notes,Workout Notes\n"
+
+def _export(days, start=datetime(2024, 1, 1)):
+    """CSV bytes with one squat set (and a curl set on even days) on each of the given day offsets."""
+    rows = []
+    for offset in days:
+        when = (start + timedelta(days=offset)).strftime("%Y-%m-%d 09:00:00")
+        rows.append(f"{when},Legs,30m,Squat,1,{100 + offset},5,,\n")
+        if offset % 2 == 0:
+            rows.append(f"{when},Legs,30m,Curl,1,20,10,,\n")
+    return (HEADER + "".join(rows)).encode()
+
+@pytest.fixture(autouse=True)
+def mapping(tmp_path, monkeypatch):
+    mapping_file = tmp_path / "mapping.json"
+    mapping_file.write_text('{"Squat": "Quads", "Curl": "Biceps"}')
+    monkeypatch.setattr(prd, 'MAPPING_FILE', str(mapping_file))
+
+def test_daily_load_fills_rest_days():
+    """Test: every calendar day is a row, rest days are zero and ALL sums the body parts."""
+    daily = daily_load(prd.parse_csv(_export([0, 3])))
+    assert len(daily) == 4
+    assert daily[("volume", "Quads")].tolist() == [1, 0, 0, 1]
+    assert daily[("tonnage", "Biceps")].tolist() == [200, 0, 0, 0]
+    assert daily[("tonnage", ALL)].tolist() == [700, 0, 0, 515]
+
+def test_rolling_metrics_match_definitions():
+    """Test: acute, chronic, ACWR and monotony follow their window definitions."""
+    load = TrainingLoad(prd.parse_csv(_export(range(0, 40, 2))))
+    series = load.series("volume", "Quads")
+    daily = series["daily"].to_numpy()
+    day = 35
+    assert series["acute"].iloc[day] == daily[day - 6:day + 1].sum()
+    assert series["chronic"].iloc[day] == pytest.approx(daily[day - 27:day + 1].sum() / 4)
+    assert series["acwr"].iloc[day] == pytest.approx(series["acute"].iloc[day] / series["chronic"].iloc[day])
+    week = daily[day - 6:day + 1]
+    assert series["monotony"].iloc[day] == pytest.approx(week.mean() / week.std(ddof=1))
+    # No chronic load (and so no ratio) until 28 days of history exist
+    assert series["chronic"].iloc[:27].isna().all() and series["acwr"].iloc[:27].isna().all()
+
+def test_append_matches_rebuild():
+    """Test: appending later days (including the last loaded day) gives the same metrics as a rebuild."""
+    workouts = prd.parse_csv(_export(range(60)))
+    load = TrainingLoad(workouts[:45])
+    load.append(workouts[44:])
+    # Day 44 is appended again on top of the loaded one, so it counts twice in both
+    expected = TrainingLoad(workouts[:44] + workouts[44:45] + workouts[44:])
+    pd.testing.assert_frame_equal(load.metrics, expected.metrics, check_freq=False)
+
+def test_append_new_body_part_and_older_days():
+    """Test: a new body part is backfilled; days before the last loaded one are rejected."""
+    load = TrainingLoad(prd.parse_csv(_export([1, 3])))
+    load.append(prd.parse_csv(_export([2], start=datetime(2024, 1, 4))))
+    assert load.body_parts == [ALL, "Biceps", "Quads"]
+    assert load.series("volume", "Biceps")["daily"].tolist() == [0, 0, 0, 0, 1]
+    with pytest.raises(ValueError):
+        load.append(prd.parse_csv(_export([0])))
+
+def test_series_slices_dates():
+    """Test: series() returns the measures for the inclusive date range."""
+    load = TrainingLoad(prd.parse_csv(_export(range(10))))
+    series = load.series("tonnage", ALL, datetime(2024, 1, 3).date(), datetime(2024, 1, 5).date())
+    assert list(series.columns) == ["daily", "acute", "chronic", "acwr", "monotony"]
+    assert series.index.strftime("%Y-%m-%d").tolist() == ["2024-01-03", "2024-01-04", "2024-01-05"]
+    assert np.isnan(series["acwr"]).all()
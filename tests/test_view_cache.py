@@ -0,0 +1,33 @@
+import pytest
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from view_cache import ViewCache
+
+def test_get_builds_once_and_counts_hits():
+    """Test: a key is built on its first get only; later gets are hits."""
+    cache = ViewCache(max_entries=4)
+    builds = []
+    build = lambda: builds.append(1) or len(builds)
+    assert cache.get("a", build) == 1
+    assert cache.get("a", build) == 1
+    assert builds == [1]
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "entries": 1, "max_entries": 4}
+
+def test_least_recently_used_entry_is_evicted():
+    """Test: past max_entries the entry used longest ago is dropped."""
+    cache = ViewCache(max_entries=2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: 1)
+    cache.get("c", lambda: 3)
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.evictions == 1 and len(cache) == 2
+
+def test_failed_build_is_not_cached():
+    """Test: a build that raises leaves nothing behind, so the next get retries."""
+    cache = ViewCache()
+    with pytest.raises(ZeroDivisionError):
+        cache.get("a", lambda: 1 / 0)
+    assert "a" not in cache
+    assert cache.get("a", lambda: 2) == 2
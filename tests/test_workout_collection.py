@@ -0,0 +1,48 @@
+import pytest
+import os
+import sys
+from datetime import date, datetime
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from workout_collection import WorkoutCollection
+
+class DummyWorkout:
+    def __init__(self, when, weight):
+        self.date = when
+        self.duration = 30
+        self.total_weight_lifted = weight
+        self.total_reps_performed = 10
+        self.number_of_exercises = 2
+        self.number_of_exercise_sets = 4
+
+def _collection():
+    # Deliberately unsorted
+    return WorkoutCollection([
+        DummyWorkout(datetime(2024, 1, 10, 9), 200),
+        DummyWorkout(datetime(2024, 1, 1, 9), 100),
+        DummyWorkout(datetime(2024, 2, 1, 9), 400),
+        DummyWorkout(datetime(2024, 1, 10, 18), 300),
+    ])
+
+def test_collection_sorted_with_bounds():
+    """Test: workouts are sorted by date and min/max dates come from the ends."""
+    c = _collection()
+    assert [w.total_weight_lifted for w in c] == [100, 200, 300, 400]
+    assert c.min_date == date(2024, 1, 1) and c.max_date == date(2024, 2, 1)
+    assert WorkoutCollection([]).min_date is None
+
+def test_between_is_inclusive():
+    """Test: between returns workouts on both boundary days."""
+    c = _collection()
+    assert [w.total_weight_lifted for w in c.between(date(2024, 1, 10), date(2024, 2, 1))] == [200, 300, 400]
+    assert c.between(date(2023, 1, 1), date(2023, 12, 31)) == []
+
+def test_totals_match_linear_sums():
+    """Test: prefix-sum totals equal summing the filtered workouts directly."""
+    c = _collection()
+    start, end = date(2024, 1, 5), date(2024, 1, 31)
+    totals = c.totals(start, end)
+    filtered = c.between(start, end)
+    assert totals["workouts"] == 2
+    assert totals["total_weight_lifted"] == sum(w.total_weight_lifted for w in filtered) == 500
+    assert totals["number_of_exercise_sets"] == 8
+    assert c.totals(date(2024, 3, 1), date(2024, 2, 1))["duration"] == 0